@@ -0,0 +1,277 @@
+"""
+Banc d'essai de l'envoi des rapports par email, sans le relais OVH.
+
+Démarre dans le processus un serveur SMTP local qui accepte et jette tous les
+messages, y dirige la configuration Flask-Mail de l'application, puis appelle
+`send_pdf_by_email` avec de vrais rapports rendus, depuis plusieurs threads.
+Mesure le débit (messages/s), les percentiles de latence par message, le
+nombre de connexions SMTP ouvertes et les octets transmis au serveur.
+
+Le serveur peut simuler le coût de la poignée de main TLS et de l'AUTH du
+relais (--handshake-ms) et la latence de chaque commande (--command-ms) : on
+compare ainsi réutilisation des connexions, taille des pièces jointes
+(REPORT_SIZE_PROFILE, mode `lien`) et envoi par lots.
+
+L'application est importée telle quelle : DATABASE_URL doit désigner une base
+accessible (base de développement), mais aucun envoi n'y est archivé (table
+RapportEnvoye). Les PDF envoyés sont stockés dans un répertoire temporaire,
+supprimé à la fin, sauf si REPORT_STORE_DIR est donné. Les workers de la file
+et le pool de rendu ne sont pas lancés.
+
+Usage :
+    python bench_email.py --messages 200 --concurrency 8
+    python bench_email.py --handshake-ms 150 --pool-size 0 -o sans_pool.json   # une connexion par email
+    python bench_email.py --handshake-ms 150 --compare sans_pool.json
+    REPORT_EMAIL_MODE=lien python bench_email.py --compare bench_email.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# Avant l'import de l'application : ni workers de file, ni pool de rendu
+os.environ.setdefault("JOB_WORKER_THREADS", "0")
+os.environ.setdefault("RENDER_WORKERS", "0")
+# Stockage des rapports envoyés (archive et liens) jetable, quel que soit le mode
+STORE_DIR = None
+if "REPORT_STORE_DIR" not in os.environ:
+    STORE_DIR = os.environ["REPORT_STORE_DIR"] = tempfile.mkdtemp(prefix="bench_email_")
+if os.getenv("REPORT_EMAIL_MODE") == "lien":
+    os.environ.setdefault("REPORT_LINK_SECRET", "bench")
+    os.environ.setdefault("REPORT_BASE_URL", "http://127.0.0.1:5000")
+
+from bench_report import enumerate_cases, git_commit, percentile
+
+
+class SinkStats:
+    def __init__(self):
+        self.connections = 0
+        self.messages = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._lock = threading.Lock()
+
+    def add(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+
+class SinkHandler(socketserver.StreamRequestHandler):
+    """Session SMTP minimale : accepte toutes les commandes et jette les messages."""
+
+    def reply(self, line):
+        data = line.encode("ascii") + b"\r\n"
+        self.wfile.write(data)
+        self.server.stats.add(bytes_out=len(data))
+
+    def readline(self):
+        line = self.rfile.readline()
+        self.server.stats.add(bytes_in=len(line))
+        return line
+
+    def handle(self):
+        self.server.stats.add(connections=1)
+        # Coût de la poignée de main TLS et de l'AUTH du relais
+        time.sleep(self.server.handshake_delay)
+        self.reply("220 bench-sink ESMTP")
+        while True:
+            line = self.readline()
+            if not line:
+                return
+            commande = line[:4].upper()
+            time.sleep(self.server.command_delay)
+            if commande in (b"EHLO", b"HELO"):
+                self.reply("250 bench-sink")
+            elif commande == b"DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.readline() not in (b".\r\n", b""):
+                    pass
+                self.server.stats.add(messages=1)
+                self.reply("250 OK: queued")
+            elif commande == b"QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class SmtpSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handshake_delay=0.0, command_delay=0.0):
+        super().__init__(("127.0.0.1", 0), SinkHandler)
+        self.stats = SinkStats()
+        self.handshake_delay = handshake_delay
+        self.command_delay = command_delay
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name="smtp-sink", daemon=True).start()
+        return self
+
+
+def point_mail_at(app_module, sink):
+    """Dirige Flask-Mail (et le pool SMTP) de l'application vers le serveur local."""
+    app_module.app.config.update(
+        MAIL_SERVER="127.0.0.1", MAIL_PORT=sink.port, MAIL_USE_SSL=False, MAIL_USE_TLS=False,
+        MAIL_USERNAME=None, MAIL_PASSWORD=None,
+    )
+    state = app_module.app.extensions["mail"]
+    state.server, state.port = "127.0.0.1", sink.port
+    state.use_ssl = state.use_tls = False
+    state.username = state.password = None
+    state.suppress = False
+
+
+def prepare_cases(count):
+    """Réponses et pièces jointes réelles, rendues une fois puis envoyées en boucle."""
+    from render_service import render_attachments
+
+    cases = []
+    for _, data in enumerate_cases():
+        data = dict(data, printOption=True)
+        cases.append((data, render_attachments(data)))
+        if len(cases) >= count:
+            break
+    return cases
+
+
+def run(messages, concurrency, handshake_ms, command_ms, pool_size, batch_size, variants):
+    import app as app_module
+
+    if pool_size is not None:
+        app_module.mailer.size = pool_size
+    if batch_size is not None:
+        app_module.mailer.batch_size = batch_size
+
+    # Aucune ligne RapportEnvoye écrite dans la base configurée
+    app_module.archive_sent_reports = lambda recipient_email, lang, archives: None
+
+    sink = SmtpSink(handshake_ms / 1000, command_ms / 1000).start()
+    point_mail_at(app_module, sink)
+    cases = prepare_cases(variants)
+    # Le préchauffage du rendu lancé à l'import de l'application ne doit pas fausser les mesures
+    while not app_module.render_service.ready:
+        time.sleep(0.05)
+    attachment_bytes = [sum(len(content) for _, content in attachments) for _, attachments in cases]
+
+    latences = []
+    erreurs = []
+
+    def send(i):
+        data, attachments = cases[i % len(cases)]
+        with app_module.app.app_context():
+            start = time.perf_counter()
+            try:
+                app_module.send_pdf_by_email(data, attachments)
+            except Exception as e:
+                erreurs.append(str(e))
+                return
+            latences.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(send, range(messages)))
+    duree = time.perf_counter() - start
+    sink.shutdown()
+
+    latences_ms = [round(latence * 1000, 2) for latence in latences]
+    envoyes = len(latences_ms)
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "email_mode": app_module.REPORT_EMAIL_MODE,
+            "size_profile": os.getenv("REPORT_SIZE_PROFILE", "email"),
+            "concurrency": concurrency,
+            "pool_size": app_module.mailer.size,
+            "batch_size": app_module.mailer.batch_size,
+            "handshake_ms": handshake_ms,
+            "command_ms": command_ms,
+        },
+        "summary": {
+            "messages": messages,
+            "envoyes": envoyes,
+            "erreurs": len(erreurs),
+            "duree_s": round(duree, 3),
+            "messages_par_s": round(envoyes / duree, 1) if duree else 0.0,
+            "latence_ms_p50": percentile(latences_ms, 50) if latences_ms else None,
+            "latence_ms_p95": percentile(latences_ms, 95) if latences_ms else None,
+            "latence_ms_p99": percentile(latences_ms, 99) if latences_ms else None,
+            "connexions_smtp": sink.stats.connections,
+            "messages_recus": sink.stats.messages,
+            "octets_envoyes": sink.stats.bytes_in,
+            "octets_par_message": round(sink.stats.bytes_in / sink.stats.messages) if sink.stats.messages else 0,
+            "octets_pieces_jointes_moyen": round(sum(attachment_bytes) / len(attachment_bytes)),
+        },
+        "erreurs": sorted(set(erreurs)),
+    }
+
+
+def compare(results, baseline):
+    """Affiche les écarts des indicateurs avec un fichier de référence."""
+    a, b = baseline["summary"], results["summary"]
+    print(f"Référence : commit {baseline['meta'].get('commit')}, mode {baseline['meta'].get('email_mode')}")
+    for key in ("messages_par_s", "latence_ms_p50", "latence_ms_p95", "latence_ms_p99",
+                "connexions_smtp", "octets_par_message"):
+        if a.get(key) is None or b.get(key) is None:
+            continue
+        delta = (b[key] - a[key]) / a[key] * 100 if a[key] else 0.0
+        print(f"  {key:20} {a[key]:>12} -> {b[key]:>12}  ({delta:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai de send_pdf_by_email sur un serveur SMTP local.")
+    parser.add_argument("-o", "--output", default="bench_email.json", help="fichier JSON des résultats")
+    parser.add_argument("--messages", type=int, default=100, help="nombre d'emails envoyés")
+    parser.add_argument("--concurrency", type=int, default=4, help="threads appelant send_pdf_by_email")
+    parser.add_argument("--variants", type=int, default=8, help="rapports différents rendus pour les envois")
+    parser.add_argument("--handshake-ms", type=float, default=0.0, help="délai simulé de connexion (TLS + AUTH)")
+    parser.add_argument("--command-ms", type=float, default=0.0, help="délai simulé de chaque commande SMTP")
+    parser.add_argument("--pool-size", type=int,
+                        help="connexions SMTP du pool (MAIL_POOL_SIZE par défaut, 0 = une connexion par email)")
+    parser.add_argument("--batch-size", type=int, help="messages par lot (MAIL_BATCH_SIZE par défaut)")
+    parser.add_argument("--compare", help="fichier JSON de référence à comparer")
+    args = parser.parse_args()
+
+    try:
+        results = run(args.messages, args.concurrency, args.handshake_ms, args.command_ms,
+                      args.pool_size, args.batch_size, args.variants)
+    finally:
+        if STORE_DIR:
+            shutil.rmtree(STORE_DIR, ignore_errors=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    summary = results["summary"]
+    print(f"{summary['envoyes']}/{summary['messages']} emails envoyés en {summary['duree_s']} s "
+          f"({summary['messages_par_s']} messages/s) -> {args.output}")
+    print(f"Latence p50 {summary['latence_ms_p50']} ms, p95 {summary['latence_ms_p95']} ms, "
+          f"p99 {summary['latence_ms_p99']} ms")
+    print(f"{summary['connexions_smtp']} connexions SMTP, {summary['octets_envoyes']} octets transmis "
+          f"({summary['octets_par_message']} par message)")
+    for erreur in results["erreurs"]:
+        print(f"❌ {erreur}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+    return 1 if summary["erreurs"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
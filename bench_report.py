@@ -0,0 +1,253 @@
+"""
+Banc d'essai du moteur de rapport sur l'espace des réponses au questionnaire.
+
+Énumère des combinaisons des réponses sur lesquelles `generate_pdf` branche
+(langue, régime matrimonial, enfants, société, donations, budget, risque,
+remarques) et mesure pour chacune le temps réel, le temps CPU, le nombre de
+pages et la taille du PDF. Les résultats sont écrits en JSON pour être
+comparés d'un commit à l'autre.
+
+Usage :
+    python bench_report.py -o bench_avant.json
+    python bench_report.py -o bench_apres.json --compare bench_avant.json
+    python bench_report.py --full --repeat 1      # produit cartésien complet
+
+Par défaut, toutes les combinaisons langue × régime × enfants × remarques
+sont rendues, et les autres réponses tournent d'un cas à l'autre pour que
+chacune de leurs valeurs soit couverte.
+
+Les caches de fragments (report_fragments) et de lignes (report_lines) sont
+vidés avant chaque rendu : les temps sont ceux d'un rendu complet. Avec
+`--caches chauds`, ils sont gardés d'une répétition à l'autre et le banc
+mesure le rejeu depuis les caches (régime établi en production). Le mode
+est noté dans `meta.caches`.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from report import generate_pdf
+from report_fragments import FRAGMENT_CACHE
+from report_lines import LINE_CACHE
+
+LANGUES = ["fr", "en", "nl"]
+MARIAGES = [("non", ""), ("oui", "communautelegale"), ("oui", "separationbien"), ("oui", "communauteuniverselle")]
+ENFANTS = [("non", ""), ("oui", "1"), ("oui", "3")]
+REMARQUES = ["", "Pouvez-vous me recontacter au sujet de la cave ?"]
+SOCIETES = [("non", ""), ("oui", "SRL")]
+DONATIONS = ["non", "oui"]
+BUDGETS = ["moins_500", "500_2000", "2000_10000", "plus_10000"]
+RISQUES = ["tres_faible", "modere", "eleve"]
+
+# Réponses fixes, sans effet sur les branches mesurées
+BASE = {
+    "age": "45",
+    "relation_vin": "les_deux",
+    "connaissance_vin": "amateur",
+    "region_preferee": "bordeaux",
+    "forme_possession": "cave_personnelle",
+    "motivation": "transmission",
+    "importance_patrimoine": "elevee",
+    "presentation": ["transmission"],
+    "nom": "Bench",
+    "prenom": "Client",
+    "mail": "bench@example.com",
+    "tel": "",
+    "domicile": "",
+    "printOption": False,
+}
+
+PAGE_RE = re.compile(rb"/Type\s*/Page\b")
+
+
+def make_case(lang, mariage, enfants, remarques, societe, donations, budget, risque):
+    data = {
+        **BASE,
+        "lang": lang,
+        "mariage": mariage[0], "regime": mariage[1],
+        "enfants": enfants[0], "nombre_enfants": enfants[1],
+        "societe": societe[0], "type_societe": societe[1],
+        "donations": donations,
+        "budget_vin": budget,
+        "risque": risque,
+        "remarques": remarques,
+    }
+    case_id = "-".join([
+        lang,
+        mariage[1] or "celibataire",
+        f"enfants{enfants[1] or 0}",
+        f"societe_{societe[0]}",
+        f"donations_{donations}",
+        budget,
+        risque,
+        "remarques" if remarques else "sans_remarques",
+    ])
+    return case_id, data
+
+
+def enumerate_cases(full=False):
+    """Liste des cas (identifiant, données du formulaire)."""
+    if full:
+        for combo in itertools.product(LANGUES, MARIAGES, ENFANTS, REMARQUES, SOCIETES, DONATIONS, BUDGETS, RISQUES):
+            yield make_case(*combo)
+        return
+
+    for i, (lang, mariage, enfants, remarques) in enumerate(itertools.product(LANGUES, MARIAGES, ENFANTS, REMARQUES)):
+        yield make_case(
+            lang, mariage, enfants, remarques,
+            SOCIETES[i % len(SOCIETES)],
+            DONATIONS[(i // len(SOCIETES)) % len(DONATIONS)],
+            BUDGETS[i % len(BUDGETS)],
+            RISQUES[i % len(RISQUES)],
+        )
+
+
+def clear_caches():
+    """Vide les caches de rendu : le rendu suivant recalcule toutes les sections."""
+    FRAGMENT_CACHE.clear()
+    LINE_CACHE.clear()
+
+
+def measure(data, repeat, caches="froids"):
+    """Rend `data` `repeat` fois ; garde la médiane des temps."""
+    walls, cpus = [], []
+    for _ in range(repeat):
+        if caches == "froids":
+            clear_caches()
+        wall, cpu = time.perf_counter(), time.process_time()
+        pdf_bytes = generate_pdf(**data)
+        cpus.append(time.process_time() - cpu)
+        walls.append(time.perf_counter() - wall)
+    return {
+        "wall_ms": round(statistics.median(walls) * 1000, 2),
+        "cpu_ms": round(statistics.median(cpus) * 1000, 2),
+        "pages": len(PAGE_RE.findall(pdf_bytes)),
+        "bytes": len(pdf_bytes),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))]
+
+
+def run(full, repeat, caches="froids"):
+    # Rendu de chauffe : imports paresseux, images décodées
+    generate_pdf(**make_case("fr", MARIAGES[0], ENFANTS[0], "", SOCIETES[0], "non", BUDGETS[0], RISQUES[0])[1])
+
+    cases = []
+    for case_id, data in enumerate_cases(full):
+        cases.append({"id": case_id, **measure(data, repeat, caches)})
+
+    walls = [case["wall_ms"] for case in cases]
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+            "full": full,
+            "caches": caches,
+        },
+        "summary": {
+            "cases": len(cases),
+            "wall_ms_total": round(sum(walls), 1),
+            "wall_ms_p50": percentile(walls, 50),
+            "wall_ms_p95": percentile(walls, 95),
+            "cpu_ms_total": round(sum(case["cpu_ms"] for case in cases), 1),
+            "bytes_total": sum(case["bytes"] for case in cases),
+        },
+        "cases": cases,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Affiche les écarts avec un fichier de référence.
+
+    Les cas individuels au-delà du seuil sont listés pour information (bruit de
+    mesure) ; seule une hausse du temps total au-delà du seuil est une régression.
+    """
+    avant = {case["id"]: case for case in baseline["cases"]}
+    lents = 0
+    communs = 0
+    for case in results["cases"]:
+        ref = avant.get(case["id"])
+        if ref is None:
+            continue
+        communs += 1
+        ecart = (case["wall_ms"] - ref["wall_ms"]) / ref["wall_ms"] * 100 if ref["wall_ms"] else 0.0
+        remarques = []
+        if ecart > threshold:
+            lents += 1
+            remarques.append(f"temps +{ecart:.0f}%")
+        if case["pages"] != ref["pages"]:
+            remarques.append(f"pages {ref['pages']} -> {case['pages']}")
+        if remarques:
+            print(f"  {case['id']} : {', '.join(remarques)}")
+
+    a, b = baseline["summary"], results["summary"]
+    print(f"Référence : commit {baseline['meta'].get('commit')} ; {communs} cas communs")
+    if baseline["meta"].get("caches") != results["meta"]["caches"]:
+        print(f"⚠️ Caches {baseline['meta'].get('caches') or 'non notés'} dans la référence, "
+              f"{results['meta']['caches']} ici : temps non comparables")
+    for key in ("wall_ms_total", "wall_ms_p50", "wall_ms_p95", "cpu_ms_total", "bytes_total"):
+        delta = (b[key] - a[key]) / a[key] * 100 if a[key] else 0.0
+        print(f"  {key:14} {a[key]:>12} -> {b[key]:>12}  ({delta:+.1f}%)")
+    print(f"Cas plus lents de plus de {threshold:g}% : {lents}")
+
+    total = (b["wall_ms_total"] - a["wall_ms_total"]) / a["wall_ms_total"] * 100
+    if total > threshold:
+        print(f"❌ Régression : temps total +{total:.1f}%")
+        return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai de generate_pdf.")
+    parser.add_argument("-o", "--output", default="bench_report.json", help="fichier JSON des résultats")
+    parser.add_argument("--repeat", type=int, default=3, help="rendus par cas (la médiane est gardée)")
+    parser.add_argument("--full", action="store_true", help="produit cartésien complet des réponses")
+    parser.add_argument("--compare", help="fichier JSON de référence à comparer")
+    parser.add_argument("--threshold", type=float, default=10.0, help="seuil de régression, en %%")
+    parser.add_argument("--caches", choices=("froids", "chauds"), default="froids",
+                        help="caches de fragments et de lignes vidés avant chaque rendu (froids) ou gardés (chauds)")
+    args = parser.parse_args()
+
+    results = run(args.full, args.repeat, args.caches)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    summary = results["summary"]
+    print(f"{summary['cases']} cas rendus ({args.repeat}x, caches {args.caches}) -> {args.output}")
+    print(f"Temps total {summary['wall_ms_total']} ms, p50 {summary['wall_ms_p50']} ms, p95 {summary['wall_ms_p95']} ms")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
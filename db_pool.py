@@ -0,0 +1,199 @@
+"""
+Pool de connexions PostgreSQL partagé par les méthodes de DatabaseHandler.
+
+Chaque requête empruntait une connexion neuve (TCP, TLS, authentification,
+fork d'un backend côté serveur) puis la fermait après une seule instruction.
+Le pool garde les connexions ouvertes entre les requêtes et les prête à un
+thread à la fois.
+
+- Taille : DB_POOL_MIN connexions ouvertes d'avance, DB_POOL_MAX au plus.
+  Quand toutes sont prêtées, l'emprunt attend DB_POOL_TIMEOUT secondes avant
+  de lever PoolTimeout.
+- Santé : une connexion inutilisée depuis DB_POOL_HEALTHCHECK secondes est
+  vérifiée (`SELECT 1`) avant d'être prêtée ; une connexion fermée ou en
+  erreur n'est pas remise dans le pool.
+- Rendue au pool, une connexion est toujours hors transaction : les
+  changements non validés sont annulés (rollback).
+- Fork : un processus enfant n'utilise jamais les connexions héritées de son
+  parent (même socket que le parent) ; il ouvre les siennes.
+"""
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import extensions
+
+import metrics
+
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_HEALTHCHECK = float(os.getenv("DB_POOL_HEALTHCHECK", "30"))
+
+DB_POOL_WAIT_SECONDS = metrics.histogram(
+    "grandcrux_db_pool_wait_seconds", "Attente d'une connexion du pool PostgreSQL"
+)
+DB_POOL_CONNECTIONS_TOTAL = metrics.counter(
+    "grandcrux_db_pool_connections_total", "Connexions PostgreSQL ouvertes ou écartées par le pool", ["evenement"]
+)
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, connect, minconn=DB_POOL_MIN, maxconn=DB_POOL_MAX, timeout=DB_POOL_TIMEOUT,
+                 healthcheck=DB_POOL_HEALTHCHECK):
+        """`connect()` ouvre une nouvelle connexion psycopg2."""
+        self.connect = connect
+        self.minconn = minconn
+        self.maxconn = max(maxconn, 1)
+        self.timeout = timeout
+        self.healthcheck = healthcheck
+        self._cond = threading.Condition()
+        self._reset()
+
+    def _reset(self):
+        # Connexions libres (connexion, dernière utilisation), connexions prêtées
+        # et nombre de connexions ouvertes
+        self._idle = deque()
+        self._pretes = set()
+        self._size = 0
+        self._pid = os.getpid()
+
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            # Les connexions du parent restent au parent : surtout ne pas les fermer ici,
+            # la fermeture terminerait aussi sa session
+            self._reset()
+
+    def _open(self):
+        try:
+            conn = self.connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        DB_POOL_CONNECTIONS_TOTAL.inc(evenement="ouverture")
+        return conn
+
+    def _healthy(self, conn, last_used):
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.healthcheck:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _discard(self, conn):
+        DB_POOL_CONNECTIONS_TOTAL.inc(evenement="ecartee")
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+    def fill(self):
+        """Ouvre les DB_POOL_MIN premières connexions."""
+        with self._cond:
+            self._check_fork()
+            manquantes = max(0, self.minconn - self._size)
+            self._size += manquantes
+        for _ in range(manquantes):
+            conn = self._open()
+            with self._cond:
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+
+    def acquire(self, timeout=None):
+        """Emprunte une connexion ; lève PoolTimeout si aucune ne se libère à temps."""
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        while True:
+            with self._cond:
+                self._check_fork()
+                while not self._idle and self._size >= self.maxconn:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeout(f"Aucune connexion PostgreSQL libre après {timeout:g} s")
+                    self._cond.wait(remaining)
+                if self._idle:
+                    # La plus récemment rendue : connexion chaude, les autres peuvent vieillir
+                    conn, last_used = self._idle.pop()
+                else:
+                    conn, last_used = None, None
+                    self._size += 1
+
+            if conn is None:
+                conn = self._open()
+            elif not self._healthy(conn, last_used):
+                self._discard(conn)
+                with self._cond:
+                    self._size -= 1
+                continue
+            with self._cond:
+                self._pretes.add(conn)
+            DB_POOL_WAIT_SECONDS.observe(time.monotonic() - start)
+            return conn
+
+    def release(self, conn, discard=False):
+        """Rend une connexion empruntée ; `discard` la ferme (connexion en erreur)."""
+        with self._cond:
+            self._check_fork()
+            if conn not in self._pretes:
+                # Empruntée avant un fork (socket du parent) ou déjà rendue : on n'y touche pas
+                return
+            self._pretes.discard(conn)
+            pid = self._pid
+
+        if not discard and not conn.closed:
+            try:
+                if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except psycopg2.Error:
+                discard = True
+
+        with self._cond:
+            if self._pid != pid:
+                return
+            if discard or conn.closed:
+                self._size -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+        if discard and not conn.closed:
+            self._discard(conn)
+
+    @contextmanager
+    def connection(self):
+        """Connexion empruntée le temps du bloc `with`, rendue même en cas d'erreur."""
+        conn = self.acquire()
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            self.release(conn, discard=True)
+            raise
+        except BaseException:
+            self.release(conn)
+            raise
+        self.release(conn)
+
+    def close(self):
+        """Ferme les connexions libres ; le pool ne rouvre plus de connexions d'avance."""
+        with self._cond:
+            self._check_fork()
+            idle, self._idle = self._idle, deque()
+            self._size -= len(idle)
+            self.minconn = 0
+        for conn, _ in idle:
+            conn.close()
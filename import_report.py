@@ -0,0 +1,84 @@
+"""
+Rapport des temps d'import au démarrage d'un worker.
+
+Compare le coût d'import du rendu PDF seul avec celui qu'il avait quand
+matplotlib/numpy étaient chargés dès le démarrage. Chaque scénario est
+exécuté dans un interpréteur neuf avec `python -X importtime`.
+
+Usage :
+    python import_report.py              # module `report`
+    python import_report.py app --top 15  # nécessite la base de données
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Ligne imprimée par l'enfant après les imports : mémoire résidente maximale en Ko
+RSS_SCRIPT = "import resource; print('RSS', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+
+
+def run_scenario(imports, repeat=3):
+    """Importe `imports` dans un interpréteur neuf ; renvoie (ms, rss Ko, {module: ms cumulés})."""
+    code = "; ".join(f"import {name}" for name in imports) + "; " + RSS_SCRIPT
+    meilleur = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+        modules = {}
+        total_us = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative = int(cumulative)
+            # Seuls les modules de premier niveau (sans indentation) s'additionnent
+            if not name.startswith("  "):
+                total_us += cumulative
+            modules[name.strip()] = modules.get(name.strip(), 0) + cumulative / 1000
+
+        rss = int(result.stdout.split("RSS")[-1])
+        if meilleur is None or total_us < meilleur[0] * 1000:
+            meilleur = (total_us / 1000, rss, modules)
+    return meilleur
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Temps d'import et mémoire au démarrage.")
+    parser.add_argument("module", nargs="?", default="report", help="module importé par le worker")
+    parser.add_argument("--top", type=int, default=10, help="nombre de modules les plus lents affichés")
+    parser.add_argument("--repeat", type=int, default=3, help="essais par scénario (le meilleur est gardé)")
+    args = parser.parse_args()
+
+    scenarios = [
+        ("différé (actuel)", [args.module]),
+        ("matplotlib au démarrage", ["numpy", "matplotlib.pyplot", args.module]),
+    ]
+
+    resultats = []
+    for label, imports in scenarios:
+        try:
+            ms, rss, modules = run_scenario(imports, args.repeat)
+        except RuntimeError as e:
+            print(f"{label} : échec de l'import ({e})")
+            continue
+        resultats.append((label, ms, rss))
+
+        print(f"=== {label} : import {' + '.join(imports)} ===")
+        print(f"Temps d'import : {ms:8.1f} ms   RSS max : {rss / 1024:6.1f} Mo")
+        for name, cumul in sorted(modules.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"  {cumul:8.1f} ms  {name}")
+        print()
+
+    if len(resultats) == 2:
+        (_, ms_actuel, rss_actuel), (_, ms_avant, rss_avant) = resultats
+        print(f"Gain : {ms_avant - ms_actuel:.1f} ms et {(rss_avant - rss_actuel) / 1024:.1f} Mo par worker")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Traitement des réponses au formulaire depuis la file d'attente PostgreSQL.
+
+Le POST du formulaire enregistre seulement un job (table SubmissionJob) et
+redirige aussitôt vers /merci. Les workers réservent les jobs avec
+`FOR UPDATE SKIP LOCKED` et exécutent trois étapes indépendantes :
+
+    enregistrement  ajout du prospect dans la table Person
+    rendu           PDF rendus et stockés avec le job
+    email           envoi des PDF stockés au client
+
+Le prospect est enregistré en premier : un rendu ou un envoi en échec
+définitif ne le fait pas perdre.
+
+Chaque étape validée est enregistrée : après un échec ou un redémarrage,
+le job reprend à l'étape où il s'était arrêté. Une étape qui échoue parce
+qu'un service externe est indisponible (erreur avec `retry_after`, par
+exemple le disjoncteur SMTP de mailer.py) est différée d'autant, sans
+compter d'essai. Une erreur due aux données du job elles-mêmes (champ
+manquant ou invalide, en-tête d'email refusé) ne se corrige pas en
+réessayant : le job passe aussitôt en `echec`.
+
+Configuration (variables d'environnement) :
+    JOB_WORKER_THREADS   threads de traitement lancés par l'application (0 = aucun)
+    JOB_POLL_INTERVAL    attente entre deux lectures de la file vide, en secondes
+    JOB_LEASE_SECONDS    délai après lequel un job `en_cours` abandonné est repris
+                         (la reprise compte un essai)
+    JOB_MAX_ATTEMPTS     essais par étape avant l'état `echec`
+    JOB_RETRY_DELAY      délai avant le premier nouvel essai (doublé à chaque échec)
+
+Lancement en processus séparé :
+    RENDER_WORKERS=4 JOB_WORKER_THREADS=0 python job_worker.py
+"""
+import os
+import threading
+
+from flask_mail import BadHeaderError
+
+JOB_WORKER_THREADS = int(os.getenv("JOB_WORKER_THREADS", "1"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+JOB_RETRY_DELAY = float(os.getenv("JOB_RETRY_DELAY", "30"))
+
+# Erreurs qu'un nouvel essai reproduirait à l'identique
+ERREURS_DEFINITIVES = (KeyError, TypeError, ValueError, BadHeaderError)
+
+# Étape -> étape suivante
+ETAPES = {
+    "enregistrement": "rendu",
+    "rendu": "email",
+    "email": "termine",
+}
+
+
+class JobWorker:
+    def __init__(self, db_handler, render, send_email, persist, context=None):
+        """
+        `render(data)` renvoie les pièces jointes, `send_email(data, attachments)`
+        les envoie et `persist(data)` enregistre le prospect. `context` fournit
+        le contexte Flask nécessaire à l'envoi des emails.
+        """
+        self.db_handler = db_handler
+        self.render = render
+        self.send_email = send_email
+        self.persist = persist
+        self.context = context
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def enqueue(self, data, etape="enregistrement", attachments=None):
+        """Enregistre une réponse au formulaire et réveille les workers locaux ; renvoie (id, jeton)."""
+        job = self.db_handler.enqueue_job(data, etape, attachments)
+        self._wake.set()
+        return job
+
+    def run_step(self, job_id, etape, data):
+        if etape == "rendu":
+            self.db_handler.save_job_pieces(job_id, self.render(data))
+        elif etape == "email":
+            self.send_email(data, self.db_handler.get_job_pieces(job_id))
+        elif etape == "enregistrement":
+            self.persist(data)
+
+    def process(self, job):
+        """Exécute les étapes restantes d'un job réservé."""
+        job_id, etape, data = job["id"], job["etape"], job["donnees"]
+        # Essais de l'étape courante (remis à zéro à chaque étape validée)
+        tentatives = job["tentatives"]
+        while etape != "termine":
+            try:
+                self.run_step(job_id, etape, data)
+            except Exception as e:
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after is not None:
+                    self.db_handler.defer_job(job_id, f"{etape} : {e}", retry_after)
+                    print(f"⏸️ Job {job_id}, étape {etape} différée de {retry_after:.0f} s : {e}")
+                    return False
+                if isinstance(e, ERREURS_DEFINITIVES):
+                    statut = self.db_handler.fail_job(job_id, f"{etape} : {e!r}", 0, 1)
+                else:
+                    delai = JOB_RETRY_DELAY * 2 ** tentatives
+                    statut = self.db_handler.fail_job(job_id, f"{etape} : {e}", delai, JOB_MAX_ATTEMPTS)
+                print(f"❌ Job {job_id}, étape {etape} en erreur ({statut}) : {e}")
+                return False
+            etape = ETAPES[etape]
+            tentatives = 0
+            self.db_handler.advance_job(job_id, etape)
+        print(f"✅ Job {job_id} terminé")
+        return True
+
+    def run_once(self):
+        """Traite un job s'il y en a un ; renvoie False si la file est vide."""
+        job = self.db_handler.claim_job(JOB_LEASE_SECONDS, JOB_MAX_ATTEMPTS)
+        if job is None:
+            return False
+        if self.context is not None:
+            with self.context():
+                self.process(job)
+        else:
+            self.process(job)
+        return True
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception as e:
+                print(f"❌ Erreur de lecture de la file des jobs : {e}")
+            self._wake.wait(JOB_POLL_INTERVAL)
+            self._wake.clear()
+
+    def start(self, threads=JOB_WORKER_THREADS):
+        """Lance `threads` workers en tâche de fond dans le processus courant."""
+        for _ in range(threads):
+            thread = threading.Thread(target=self.run_forever, name="job-worker", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+
+if __name__ == "__main__":
+    from app import job_worker
+
+    print("Worker de la file des jobs démarré")
+    try:
+        job_worker.run_forever()
+    except KeyboardInterrupt:
+        pass
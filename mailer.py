@@ -0,0 +1,360 @@
+"""
+Envoi des emails sur des connexions SMTP persistantes.
+
+`mail.send(msg)` de Flask-Mail ouvre une connexion SSL, s'authentifie, envoie
+un seul message puis se déconnecte : la poignée de main TLS et l'AUTH
+dominent le temps d'envoi. Ici, quelques threads d'envoi gardent chacun une
+connexion authentifiée ouverte et vident la file des messages par lots sur
+cette connexion. Une connexion sans message pendant MAIL_IDLE_TIMEOUT
+secondes est fermée ; elle est rouverte au message suivant.
+
+Une erreur de connexion (serveur déconnecté, réseau) ferme la connexion et le
+message est renvoyé une fois sur une nouvelle connexion ; les autres erreurs
+SMTP sont remontées à l'appelant du message concerné.
+
+Les connexions ont des délais de connexion et d'envoi : un relais qui ne
+répond plus fait échouer le message au lieu de bloquer son appelant. Après
+MAIL_BREAKER_THRESHOLD échecs de connexion consécutifs, le disjoncteur
+s'ouvre : pendant MAIL_BREAKER_RESET secondes, les messages échouent
+aussitôt avec MailUnavailable (la file des jobs les diffère d'autant), puis un
+seul message d'essai décide de sa fermeture. Seules les erreurs de
+connexion comptent comme échecs ; un message d'essai refusé pour lui-même
+(en-tête invalide, adresse refusée) laisse sa place au message suivant. Son
+état est exporté sur /metrics (grandcrux_mail_circuit_state).
+
+Configuration :
+    MAIL_POOL_SIZE          connexions SMTP ouvertes au plus (threads d'envoi)
+    MAIL_BATCH_SIZE         messages pris dans la file à chaque passage
+    MAIL_IDLE_TIMEOUT       secondes sans message avant de fermer une connexion
+    MAIL_CONNECT_TIMEOUT    délai de connexion et d'authentification, en secondes
+    MAIL_SEND_TIMEOUT       délai de chaque échange avec le serveur, en secondes
+    MAIL_WAIT_TIMEOUT       attente maximale de l'appelant de `send`, file comprise
+    MAIL_BREAKER_THRESHOLD  échecs consécutifs avant l'ouverture du disjoncteur
+    MAIL_BREAKER_RESET      secondes d'ouverture avant un nouvel essai
+"""
+import os
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+from flask_mail import BadHeaderError, Connection
+
+import metrics
+
+MAIL_POOL_SIZE = int(os.getenv("MAIL_POOL_SIZE", "2"))
+MAIL_BATCH_SIZE = int(os.getenv("MAIL_BATCH_SIZE", "20"))
+MAIL_IDLE_TIMEOUT = float(os.getenv("MAIL_IDLE_TIMEOUT", "60"))
+MAIL_CONNECT_TIMEOUT = float(os.getenv("MAIL_CONNECT_TIMEOUT", "10"))
+MAIL_SEND_TIMEOUT = float(os.getenv("MAIL_SEND_TIMEOUT", "30"))
+MAIL_WAIT_TIMEOUT = float(os.getenv("MAIL_WAIT_TIMEOUT", "120"))
+MAIL_BREAKER_THRESHOLD = int(os.getenv("MAIL_BREAKER_THRESHOLD", "5"))
+MAIL_BREAKER_RESET = float(os.getenv("MAIL_BREAKER_RESET", "60"))
+
+MAIL_CONNECTIONS_TOTAL = metrics.counter(
+    "grandcrux_mail_connections_total", "Connexions SMTP ouvertes par les threads d'envoi"
+)
+MAIL_MESSAGES_TOTAL = metrics.counter(
+    "grandcrux_mail_messages_total", "Messages traités par les threads d'envoi", ["resultat"]
+)
+MAIL_CIRCUIT_STATE = metrics.gauge(
+    "grandcrux_mail_circuit_state", "État du disjoncteur SMTP (0 fermé, 1 semi-ouvert, 2 ouvert)"
+)
+MAIL_CIRCUIT_TRANSITIONS_TOTAL = metrics.counter(
+    "grandcrux_mail_circuit_transitions_total", "Changements d'état du disjoncteur SMTP", ["etat"]
+)
+
+# État du disjoncteur -> valeur de la jauge
+ETATS_DISJONCTEUR = {"ferme": 0, "semi_ouvert": 1, "ouvert": 2}
+
+
+class MailUnavailable(Exception):
+    """Envoi refusé d'avance : le serveur SMTP est considéré indisponible pendant `retry_after` secondes."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"serveur SMTP indisponible, nouvel essai dans {retry_after:.0f} s")
+        self.retry_after = retry_after
+
+
+def connexion_perdue(error):
+    """Vrai pour une erreur de la connexion elle-même (et non du message envoyé)."""
+    if isinstance(error, smtplib.SMTPResponseException):
+        # 421 : le serveur ferme la connexion
+        return error.smtp_code == 421
+    return isinstance(error, smtplib.SMTPServerDisconnected) or not isinstance(error, smtplib.SMTPException)
+
+
+class TimedConnection(Connection):
+    """Connexion Flask-Mail avec délais : `connect_timeout` jusqu'à l'AUTH, puis `send_timeout`."""
+
+    def __init__(self, mail, connect_timeout=MAIL_CONNECT_TIMEOUT, send_timeout=MAIL_SEND_TIMEOUT):
+        super().__init__(mail)
+        self.connect_timeout = connect_timeout
+        self.send_timeout = send_timeout
+
+    def configure_host(self):
+        if self.mail.use_ssl:
+            host = smtplib.SMTP_SSL(self.mail.server, self.mail.port, timeout=self.connect_timeout)
+        else:
+            host = smtplib.SMTP(self.mail.server, self.mail.port, timeout=self.connect_timeout)
+
+        host.set_debuglevel(int(self.mail.debug))
+
+        if self.mail.use_tls:
+            host.starttls()
+
+        if self.mail.username and self.mail.password:
+            host.login(self.mail.username, self.mail.password)
+
+        host.sock.settimeout(self.send_timeout)
+        return host
+
+
+class CircuitBreaker:
+    def __init__(self, threshold=MAIL_BREAKER_THRESHOLD, reset_timeout=MAIL_BREAKER_RESET):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = "ferme"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._essai = False
+        self._lock = threading.Lock()
+        MAIL_CIRCUIT_STATE.set(ETATS_DISJONCTEUR[self.state])
+
+    def _set_state(self, state):
+        if state != self.state:
+            self.state = state
+            MAIL_CIRCUIT_STATE.set(ETATS_DISJONCTEUR[state])
+            MAIL_CIRCUIT_TRANSITIONS_TOTAL.inc(etat=state)
+            print(f"⚡ Disjoncteur SMTP : {state}")
+
+    def retry_after(self):
+        """Secondes avant le prochain essai (0 si le disjoncteur laisse passer)."""
+        if self.state != "ouvert":
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self):
+        """Vrai si un message peut être envoyé ; en semi-ouvert, un seul message d'essai passe."""
+        if self.threshold <= 0:
+            return True
+        with self._lock:
+            if self.state == "ouvert":
+                if self.retry_after() > 0:
+                    return False
+                self._set_state("semi_ouvert")
+                self._essai = False
+            if self.state == "semi_ouvert":
+                if self._essai:
+                    return False
+                self._essai = True
+            return True
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self._set_state("ferme")
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "semi_ouvert" or (self.threshold > 0 and self.failures >= self.threshold):
+                self._opened_at = time.monotonic()
+                self._set_state("ouvert")
+
+    def release(self):
+        """Message d'essai abandonné sans verdict sur le serveur : le suivant servira d'essai."""
+        with self._lock:
+            if self.state == "semi_ouvert":
+                self._essai = False
+
+    def settle(self, error):
+        """Verdict d'un envoi (`error` None s'il a réussi) ; tout message d'essai doit passer par ici."""
+        if error is None or (isinstance(error, OSError) and not connexion_perdue(error)):
+            # Le serveur a répondu, même pour refuser le message
+            self.success()
+        elif isinstance(error, OSError):
+            self.failure()
+        else:
+            self.release()
+
+
+class PooledMailer:
+    def __init__(self, app, mail, size=MAIL_POOL_SIZE, batch_size=MAIL_BATCH_SIZE, idle_timeout=MAIL_IDLE_TIMEOUT,
+                 connect_timeout=MAIL_CONNECT_TIMEOUT, send_timeout=MAIL_SEND_TIMEOUT, wait_timeout=MAIL_WAIT_TIMEOUT,
+                 breaker=None):
+        self.app = app
+        self.mail = mail
+        self.size = size
+        self.batch_size = batch_size
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.send_timeout = send_timeout
+        self.wait_timeout = wait_timeout
+        self.breaker = breaker or CircuitBreaker()
+        self._queue = queue.Queue()
+        self._threads = []
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_threads(self):
+        # Après un fork, les threads d'envoi du parent n'existent plus dans l'enfant
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.Queue()
+                self._threads = []
+                self._pid = os.getpid()
+            while len(self._threads) < self.size:
+                thread = threading.Thread(target=self._run, args=(self._queue,), name="smtp-sender", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            return self._queue
+
+    @property
+    def available(self):
+        """Faux tant que le disjoncteur est ouvert."""
+        return self.breaker.retry_after() <= 0
+
+    def submit(self, msg):
+        """Met un message en file ; renvoie un Future résolu une fois le message envoyé."""
+        future = Future()
+        if msg.has_bad_headers():
+            # Refusé avant le disjoncteur : le message ne dit rien de l'état du serveur
+            self._fail(future, BadHeaderError("En-tête invalide (retour à la ligne) dans le message"))
+            return future
+        if not self.breaker.allow():
+            MAIL_MESSAGES_TOTAL.inc(resultat="differe")
+            # Semi-ouvert : le message d'essai est en cours, le temps de sa connexion et de son envoi
+            retry_after = self.breaker.retry_after() or self.connect_timeout + self.send_timeout
+            future.set_exception(MailUnavailable(retry_after))
+            return future
+        if self.size <= 0 or self.mail.state.suppress:
+            # Sans pool (ou envoi désactivé en test) : envoi direct par Flask-Mail
+            try:
+                self.mail.send(msg)
+            except Exception as e:
+                self.breaker.settle(e)
+                future.set_exception(e)
+            else:
+                self.breaker.settle(None)
+                future.set_result(None)
+            return future
+        self._ensure_threads().put((msg, future, False))
+        return future
+
+    def send(self, msg):
+        """
+        Envoie un message et attend le résultat (lève l'erreur SMTP éventuelle).
+
+        L'attente est bornée par `wait_timeout` : au-delà, le message encore en
+        file en est retiré et TimeoutError est levée ; l'appelant peut le
+        renvoyer sans risque de doublon. Un message déjà en cours d'envoi est
+        attendu jusqu'à la fin de l'échange (au plus `send_timeout` de plus).
+        """
+        future = self.submit(msg)
+        try:
+            future.result(timeout=self.wait_timeout)
+        except FutureTimeout:
+            if future.cancel():
+                # Pas encore parti : sa place de message d'essai revient au suivant
+                self.breaker.release()
+                MAIL_MESSAGES_TOTAL.inc(resultat="retire")
+                raise TimeoutError(f"Email non envoyé après {self.wait_timeout:.0f} s") from None
+            try:
+                future.result(timeout=self.send_timeout)
+            except FutureTimeout:
+                raise TimeoutError(f"Envoi de l'email toujours en cours après "
+                                   f"{self.wait_timeout + self.send_timeout:.0f} s") from None
+
+    def send_many(self, messages):
+        """Envoie une série de messages ; renvoie l'erreur de chacun (None si envoyé)."""
+        futures = [self.submit(msg) for msg in messages]
+        return [future.exception() for future in futures]
+
+    def _next_batch(self, file, timeout):
+        """Jusqu'à `batch_size` messages ; attend le premier au plus `timeout` secondes."""
+        try:
+            batch = [file.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(file.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self, file):
+        with self.app.app_context():
+            while True:
+                batch = self._next_batch(file, None)
+                while batch:
+                    batch = self._send_batch(file, batch)
+
+    def _send_batch(self, file, batch):
+        """
+        Envoie un lot sur une connexion, gardée ouverte tant que des messages
+        arrivent ; renvoie les messages à reprendre sur une nouvelle connexion.
+        """
+        connection = self._connect(batch)
+        if connection is None:
+            return []
+        try:
+            while batch:
+                for index, (msg, future, repris) in enumerate(batch):
+                    # Message retiré par son appelant (délai d'attente dépassé) : jamais envoyé
+                    if not repris and not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        connection.send(msg)
+                    except OSError as e:
+                        if not connexion_perdue(e):
+                            self.breaker.settle(e)
+                            self._fail(future, e)
+                            continue
+                        print(f"⚠️ Connexion SMTP perdue : {e}")
+                        # Un serveur qui ne répond plus dans les délais n'est pas réessayé
+                        if repris or isinstance(e, TimeoutError):
+                            self.breaker.failure()
+                            self._fail(future, e)
+                            return batch[index + 1:]
+                        return [(msg, future, True)] + batch[index + 1:]
+                    except Exception as e:
+                        # Erreur du message lui-même : pas de verdict sur le serveur
+                        self.breaker.settle(e)
+                        self._fail(future, e)
+                    else:
+                        self.breaker.settle(None)
+                        MAIL_MESSAGES_TOTAL.inc(resultat="envoye")
+                        future.set_result(None)
+                batch = self._next_batch(file, self.idle_timeout)
+        finally:
+            self._close(connection)
+        return []
+
+    def _fail(self, future, error):
+        if future.cancelled():
+            return
+        MAIL_MESSAGES_TOTAL.inc(resultat="erreur")
+        future.set_exception(error)
+
+    def _connect(self, batch):
+        try:
+            connection = TimedConnection(self.app.extensions["mail"], self.connect_timeout, self.send_timeout)
+            connection.__enter__()
+        except Exception as e:
+            print(f"❌ Connexion SMTP impossible : {e}")
+            self.breaker.failure()
+            for _, future, _ in batch:
+                self._fail(future, e)
+            return None
+        MAIL_CONNECTIONS_TOTAL.inc()
+        return connection
+
+    def _close(self, connection):
+        try:
+            connection.__exit__(None, None, None)
+        except Exception:
+            # Serveur déjà déconnecté : rien à fermer
+            pass
@@ -0,0 +1,242 @@
+"""
+Métriques internes (compteurs, jauges et histogrammes) au format texte Prometheus.
+
+Les valeurs sont propres à chaque processus. Les rendus faits dans le pool de
+processus (render_service) capturent leurs observations et les renvoient au
+processus de l'application, qui les rejoue dans ses propres métriques. Les
+jauges décrivent un état du processus qui les expose : elles ne sont pas
+capturées.
+
+Les compteurs et histogrammes ignorent ce qui est fait sous `suppress()`
+(rendus de préchauffage, par exemple), pour ne pas fausser les percentiles.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Nom -> métrique, dans l'ordre d'enregistrement
+REGISTRY = {}
+
+_capture = threading.local()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames, values, extra=None):
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    inner = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + inner + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        if getattr(_capture, "suppressed", False):
+            return
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+        captured = getattr(_capture, "samples", None)
+        if captured is not None:
+            captured.append((self.name, labels, amount))
+
+    def value(self, **labels):
+        return self._values.get(tuple(labels.get(name, "") for name in self.labelnames), 0)
+
+    def expose(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def set(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels):
+        return self._values.get(tuple(labels.get(name, "") for name in self.labelnames), 0)
+
+    def expose(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Clé des labels -> [compteurs par borne, somme, nombre]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        if getattr(_capture, "suppressed", False):
+            return
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+        captured = getattr(_capture, "samples", None)
+        if captured is not None:
+            captured.append((self.name, labels, value))
+
+    @contextmanager
+    def time(self, **labels):
+        """Mesure la durée du bloc `with`, même s'il lève une exception."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels):
+        state = self._values.get(tuple(labels.get(name, "") for name in self.labelnames))
+        return state[2] if state else 0
+
+    def expose(self):
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        for key, (counts, total, count) in items:
+            for bound, cumulative in zip(self.buckets, counts):
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(float(bound))))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', '+Inf'))} {count}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {count}"
+
+
+def counter(name, documentation, labelnames=()):
+    """Crée (ou renvoie, si déjà enregistré) un compteur."""
+    if name not in REGISTRY:
+        REGISTRY[name] = Counter(name, documentation, labelnames)
+    return REGISTRY[name]
+
+
+def gauge(name, documentation, labelnames=()):
+    """Crée (ou renvoie, si déjà enregistrée) une jauge."""
+    if name not in REGISTRY:
+        REGISTRY[name] = Gauge(name, documentation, labelnames)
+    return REGISTRY[name]
+
+
+def histogram(name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+    """Crée (ou renvoie, si déjà enregistré) un histogramme."""
+    if name not in REGISTRY:
+        REGISTRY[name] = Histogram(name, documentation, labelnames, buckets)
+    return REGISTRY[name]
+
+
+def render_text():
+    """Toutes les métriques au format d'exposition texte de Prometheus."""
+    lines = []
+    for metric in list(REGISTRY.values()):
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.expose())
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def capture():
+    """Collecte les observations faites dans le bloc (voir `replay`)."""
+    previous = getattr(_capture, "samples", None)
+    _capture.samples = samples = []
+    try:
+        yield samples
+    finally:
+        _capture.samples = previous
+
+
+@contextmanager
+def suppress():
+    """Les compteurs et histogrammes ne voient rien de ce qui est fait dans le bloc (dans ce thread)."""
+    previous = getattr(_capture, "suppressed", False)
+    _capture.suppressed = True
+    try:
+        yield
+    finally:
+        _capture.suppressed = previous
+
+
+def replay(samples):
+    """Rejoue dans ce processus des observations capturées dans un autre."""
+    for name, labels, value in samples:
+        metric = REGISTRY.get(name)
+        if isinstance(metric, Histogram):
+            metric.observe(value, **labels)
+        elif isinstance(metric, Counter):
+            metric.inc(value, **labels)
+
+
+# --- Opérations de l'application ---
+
+OPERATION_SECONDS = histogram(
+    "grandcrux_operation_seconds", "Durée des opérations (envoi d'email, écriture en base...)", ["operation"]
+)
+OPERATION_TOTAL = counter(
+    "grandcrux_operation_total", "Nombre d'opérations, par résultat", ["operation", "resultat"]
+)
+
+
+def track(operation):
+    """Décorateur : durée et nombre d'appels de la fonction, par résultat (ok / erreur)."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            resultat = "erreur"
+            try:
+                with OPERATION_SECONDS.time(operation=operation):
+                    value = func(*args, **kwargs)
+                resultat = "ok"
+                return value
+            finally:
+                OPERATION_TOTAL.inc(operation=operation, resultat=resultat)
+        return wrapper
+    return decorator
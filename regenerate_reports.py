@@ -0,0 +1,133 @@
+"""
+Régénération en masse des rapports, hors du formulaire HTTP.
+
+Lit des réponses au formulaire depuis un fichier JSONL ou CSV (mêmes clés que
+le dictionnaire construit par `grandcrux_form`), les rend en parallèle dans
+des processus préchauffés et écrit les PDF dans un répertoire de sortie.
+
+Usage :
+    python regenerate_reports.py reponses.jsonl -o rapports/ -j 8
+    python regenerate_reports.py export.csv -o rapports/ --no-print
+
+Dans un CSV, `presentation` est une liste séparée par des « ; » et
+`printOption` vaut on/true/1/oui pour demander la version imprimable.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from werkzeug.utils import secure_filename
+
+from render_service import render_attachments, warm_worker
+
+VRAI = {"on", "true", "1", "oui", "yes"}
+
+
+def read_submissions(path):
+    """Lit les réponses au formulaire (JSONL ou CSV selon l'extension)."""
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            for row in csv.DictReader(f):
+                data = {k: (v if v != "" else None) for k, v in row.items()}
+                data["presentation"] = [p for p in (row.get("presentation") or "").split(";") if p]
+                data["printOption"] = (row.get("printOption") or "").strip().lower() in VRAI
+                yield data
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def render_timed(item):
+    """Rendu d'une réponse dans un processus du pool : (index, pièces jointes, secondes, erreur)."""
+    index, data, with_print = item
+    if not with_print:
+        data = {**data, "printOption": False}
+    start = time.perf_counter()
+    try:
+        attachments = render_attachments(data)
+    except Exception as e:
+        return index, [], time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    return index, attachments, time.perf_counter() - start, None
+
+
+def write_attachments(output, index, attachments, noms):
+    """Écrit les PDF d'une réponse dans `output` ; renvoie le nombre d'octets écrits."""
+    written = 0
+    for filename, content in attachments:
+        # Le nom vient des prénom et nom saisis : rien ne doit sortir de `output`
+        filename = secure_filename(filename) or f"rapport_{index}.pdf"
+        # Deux réponses d'un même client ne s'écrasent pas
+        if filename in noms:
+            filename = f"{index}_{filename}"
+        noms.add(filename)
+        with open(os.path.join(output, filename), "wb") as f:
+            f.write(content)
+        written += len(content)
+    return written
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))
+    return values[rank]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Régénère des rapports PDF à partir de réponses au formulaire.")
+    parser.add_argument("input", help="fichier .jsonl ou .csv")
+    parser.add_argument("-o", "--output", default="rapports", help="répertoire de sortie")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="nombre de processus de rendu")
+    parser.add_argument("--no-print", action="store_true", help="ne pas rendre les versions imprimables")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    items = [(i, data, not args.no_print) for i, data in enumerate(read_submissions(args.input), 1)]
+    if not items:
+        print("Aucune réponse à traiter.")
+        return 0
+
+    latences = []
+    erreurs = 0
+    total_bytes = 0
+    noms = set()
+
+    print(f"{len(items)} rapports à régénérer avec {args.jobs} processus")
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=warm_worker) as pool:
+        start = time.perf_counter()
+        chunksize = max(1, min(16, len(items) // (args.jobs * 4)))
+        for done, (index, attachments, elapsed, erreur) in enumerate(
+                pool.map(render_timed, items, chunksize=chunksize), 1):
+            if erreur:
+                erreurs += 1
+                print(f"❌ Ligne {index} : {erreur}")
+                continue
+
+            try:
+                total_bytes += write_attachments(args.output, index, attachments, noms)
+            except OSError as e:
+                erreurs += 1
+                print(f"❌ Ligne {index} : écriture impossible : {e}")
+                continue
+            latences.append(elapsed)
+
+            if done % 100 == 0:
+                print(f"  {done}/{len(items)} ({done / (time.perf_counter() - start):.1f} rapports/s)")
+        wall = time.perf_counter() - start
+
+    print("=== Régénération terminée ===")
+    print(f"Rapports        : {len(latences)} ok, {erreurs} en erreur")
+    print(f"Durée           : {wall:.2f} s ({len(latences) / wall:.1f} rapports/s)")
+    print(f"Latence p50/p95 : {percentile(latences, 50) * 1000:.0f} ms / {percentile(latences, 95) * 1000:.0f} ms")
+    print(f"Octets écrits   : {total_bytes} ({total_bytes / 1024 / 1024:.1f} Mo) dans {args.output}")
+    return 1 if erreurs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""
+Service de rendu des rapports dans un pool de processus.
+
+La mise en page fpdf2 est du calcul pur : rendue dans le thread de la requête
+Flask, elle se sérialise sur le GIL dès que plusieurs formulaires arrivent en
+même temps. Les rapports sont donc rendus dans des processus dédiés, préchauffés
+au démarrage : chaque processus rend un rapport jetable par langue (imports,
+images, polices, caches de fpdf2 et des sections) avant son premier vrai rendu.
+Le service n'est prêt (`RenderService.ready`) qu'une fois chacun de ses
+processus préchauffé ; un préchauffage en échec est recommencé, à intervalles
+croissants.
+
+Le pool appartient au processus qui l'a créé : chaque processus web a le sien
+(sous gunicorn, `-w 4` avec RENDER_WORKERS=2 donne 8 processus de rendu). Un
+processus enfant (fork, par exemple `gunicorn --preload`) n'utilise pas le
+pool hérité de son parent : il crée et préchauffe le sien.
+
+Configuration (variables d'environnement) :
+    RENDER_WORKERS        nombre de processus de rendu par processus web
+                          (2 par défaut, 0 = rendu dans le processus courant)
+    RENDER_TIMEOUT        délai maximal d'un rendu, en secondes
+    RENDER_START_METHOD   méthode de démarrage multiprocessing (forkserver, spawn, fork)
+    RENDER_WARMUP_RETRY   délai avant de recommencer un préchauffage en échec,
+                          en secondes (doublé à chaque échec, 5 minutes au plus)
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import metrics
+
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", min(2, os.cpu_count() or 1)))
+RENDER_TIMEOUT = float(os.getenv("RENDER_TIMEOUT", "30"))
+RENDER_START_METHOD = os.getenv("RENDER_START_METHOD", "forkserver")
+RENDER_WARMUP_RETRY = float(os.getenv("RENDER_WARMUP_RETRY", "5"))
+RENDER_WARMUP_RETRY_MAX = 300.0
+# Attente de l'arrêt d'un processus de rendu abandonné avant de le tuer (SIGKILL)
+RENDER_KILL_TIMEOUT = 1.0
+
+
+# Réponses fictives rendues au préchauffage, une fois par langue
+WARMUP_LANGUAGES = ("fr", "en", "nl")
+WARMUP_DATA = {
+    "age": "45",
+    "relation_vin": "les_deux",
+    "connaissance_vin": "amateur",
+    "region_preferee": "bordeaux",
+    "budget_vin": "500_2000",
+    "forme_possession": "cave_personnelle",
+    "motivation": "transmission",
+    "risque": "modere",
+    "enfants": "oui",
+    "nombre_enfants": "2",
+    "mariage": "oui",
+    "regime": "communautelegale",
+    "societe": "non",
+    "type_societe": "",
+    "donations": "non",
+    "importance_patrimoine": "elevee",
+    "presentation": ["transmission"],
+    "remarques": "",
+    "nom": "Prechauffage",
+    "prenom": "Rapport",
+    "mail": "",
+    "tel": "",
+    "domicile": "",
+    "printOption": True,
+}
+
+
+class RenderTimeout(Exception):
+    pass
+
+
+def warm_worker():
+    """
+    Initialisation d'un processus de rendu : images et polices chargées, puis un
+    rapport et une page d'impression jetables rendus dans chaque langue.
+    """
+    from report import REPORT_UNICODE_FONT, generate_pdf, generate_print_pdf, preload_print_pdfs
+    from report_assets import IMAGE_ASSETS, REPORT_SIZE_PROFILE
+    from report_fonts import FONT_ASSETS
+
+    start = time.perf_counter()
+    IMAGE_ASSETS.load()
+    IMAGE_ASSETS.load(REPORT_SIZE_PROFILE)
+    if REPORT_UNICODE_FONT:
+        FONT_ASSETS.load()
+
+    # Rendus jetables : hors des histogrammes de rendu et de sections
+    with metrics.suppress():
+        for lang in WARMUP_LANGUAGES:
+            data = {**WARMUP_DATA, "lang": lang}
+            generate_pdf(**data)
+            generate_print_pdf(**data)
+        preload_print_pdfs()
+    print(f"🔥 Processus de rendu {os.getpid()} préchauffé en {time.perf_counter() - start:.2f} s")
+
+
+def init_worker(prets):
+    """Initialiseur des processus du pool : préchauffage, puis signalé au service par `prets`."""
+    warm_worker()
+    prets.put(os.getpid())
+
+
+def render_attachments(data):
+    """Rend les pièces jointes d'une réponse au formulaire : liste de (nom de fichier, bytes)."""
+    from report import generate_pdf, generate_print_pdf, generate_summary_pdf, report_filename, print_report_filename
+
+    # `rapport` = `resume` : seulement les sections demandées (clé `sections`)
+    generate = generate_summary_pdf if data.get("rapport") == "resume" else generate_pdf
+    attachments = [(report_filename(data), generate(**data))]
+    if data.get("printOption"):
+        attachments.append((print_report_filename(data), generate_print_pdf(**data)))
+    return attachments
+
+
+def render_job(data):
+    """Exécuté dans un processus du pool : pièces jointes et observations des métriques de rendu."""
+    with metrics.capture() as samples:
+        attachments = render_attachments(data)
+    return attachments, samples
+
+
+class RenderService:
+    def __init__(self, workers=RENDER_WORKERS, timeout=RENDER_TIMEOUT, start_method=RENDER_START_METHOD):
+        self.workers = workers
+        self.timeout = timeout
+        self.start_method = start_method
+        # Délai de `start_background` (None : préchauffage jamais demandé)
+        self._retry = None
+        self._reset()
+
+    def _reset(self):
+        self._pool = None
+        self._prets = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._warmup = None
+        self._pid = os.getpid()
+
+    def _check_fork(self):
+        if self._pid == os.getpid():
+            return
+        # Processus enfant : le pool, son thread de gestion et le thread de
+        # préchauffage restent au parent (surtout ne pas les arrêter d'ici)
+        self._reset()
+        if self._retry is not None:
+            self.start_background(self._retry)
+
+    def _get_pool(self):
+        self._check_fork()
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    if self.start_method in multiprocessing.get_all_start_methods():
+                        context = multiprocessing.get_context(self.start_method)
+                    else:
+                        context = multiprocessing.get_context()
+                    # Chaque processus y signale la fin de son préchauffage
+                    self._prets = context.Queue()
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=context,
+                        initializer=init_worker,
+                        initargs=(self._prets,),
+                    )
+        return self._pool
+
+    def _discard_pool(self, pool):
+        """Abandonne un pool cassé ou bloqué ; le suivant est recréé au prochain rendu."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+                self._ready.clear()
+        # shutdown() n'interrompt pas un rendu en cours : le processus bloqué
+        # continuerait de tourner à côté du pool suivant
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(RENDER_KILL_TIMEOUT)
+            if process.is_alive():
+                process.kill()
+
+    def _reset_pool(self, pool):
+        self._discard_pool(pool)
+        # Le pool suivant est préchauffé tout de suite plutôt qu'au prochain formulaire
+        self.start_background()
+
+    @property
+    def ready(self):
+        """Vrai une fois tous les processus de rendu démarrés et préchauffés."""
+        self._check_fork()
+        return self._ready.is_set()
+
+    def start(self):
+        """
+        Démarre et préchauffe tous les processus du pool (sinon fait au premier
+        rendu). Renvoie False si le pool a été remplacé entre-temps.
+        """
+        self._check_fork()
+        start = time.perf_counter()
+        if self.workers <= 0:
+            warm_worker()
+            self._ready.set()
+        else:
+            pool = self._get_pool()
+            try:
+                self._wait_warm(pool, self._prets)
+            except Exception:
+                self._discard_pool(pool)
+                raise
+            with self._lock:
+                if self._pool is not pool:
+                    return False
+                self._ready.set()
+        print(f"✅ Service de rendu prêt ({self.workers} processus) en {time.perf_counter() - start:.2f} s")
+        return True
+
+    def _wait_warm(self, pool, prets):
+        """Attend que chacun des processus du pool ait signalé la fin de son préchauffage."""
+        # Le préchauffage rend trois rapports : délai de rendu triplé
+        deadline = time.monotonic() + self.timeout * len(WARMUP_LANGUAGES)
+        prechauffes = set()
+        # Le pool démarre un processus par tâche tant qu'aucun n'est libre
+        futures = [pool.submit(os.getpid) for _ in range(self.workers)]
+        while len(prechauffes) < self.workers:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{len(prechauffes)}/{self.workers} processus de rendu préchauffés "
+                                   f"après {self.timeout * len(WARMUP_LANGUAGES):g} s")
+            try:
+                prechauffes.add(prets.get(timeout=min(remaining, 1.0)))
+                continue
+            except queue.Empty:
+                pass
+            for future in futures:
+                # Pool cassé : préchauffage d'un processus en erreur
+                if future.done() and future.exception() is not None:
+                    raise future.exception()
+            if all(future.done() for future in futures):
+                # Un processus déjà prêt a pris plusieurs tâches : d'autres pour démarrer les derniers
+                futures = [pool.submit(os.getpid) for _ in range(self.workers - len(prechauffes))]
+
+    def start_background(self, retry=RENDER_WARMUP_RETRY):
+        """
+        Préchauffe le service dans un thread : `ready` passe à vrai à la fin.
+        Un préchauffage en échec est recommencé après `retry` secondes, puis
+        un délai doublé à chaque échec.
+        """
+        def run():
+            delai = retry
+            while True:
+                # Décidé sous le verrou : un pool abandonné entre-temps relance ce même thread
+                with self._lock:
+                    if self._ready.is_set():
+                        self._warmup = None
+                        return
+                try:
+                    self.start()
+                    continue
+                except Exception as e:
+                    print(f"❌ Préchauffage du service de rendu en échec : {e} (nouvel essai dans {delai:g} s)")
+                time.sleep(delai)
+                delai = min(delai * 2, RENDER_WARMUP_RETRY_MAX)
+
+        self._check_fork()
+        self._retry = retry
+        with self._lock:
+            # Un seul préchauffage à la fois : celui en cours reprend sur le nouveau pool
+            if self._warmup is not None:
+                return
+            self._warmup = threading.Thread(target=run, name="render-warmup", daemon=True)
+            self._warmup.start()
+
+    def render(self, data):
+        """Rend les PDF de `data` dans un processus du pool et renvoie les pièces jointes."""
+        if self.workers <= 0:
+            return render_attachments(data)
+
+        # Après un fork, `_get_pool` remplace le pool hérité du parent
+        pool = self._get_pool()
+        try:
+            future = pool.submit(render_job, data)
+            attachments, samples = future.result(timeout=self.timeout)
+            # Durées des sections mesurées dans le processus de rendu
+            metrics.replay(samples)
+            return attachments
+        except TimeoutError:
+            print(f"❌ Rendu du rapport interrompu après {self.timeout:g} s")
+            self._reset_pool(pool)
+            raise RenderTimeout(f"Rendu du rapport non terminé après {self.timeout:g} s")
+        except BrokenProcessPool:
+            print("❌ Pool de rendu cassé, il sera recréé")
+            self._reset_pool(pool)
+            raise
+
+    def shutdown(self):
+        self._check_fork()
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
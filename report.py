@@ -0,0 +1,758 @@
+"""
+Génération du rapport personnalisé GrandcruX (PDF).
+
+Le rapport est découpé en sections enregistrées dans `SECTIONS`, rendues
+dans l'ordre par `generate_pdf`. Chaque section lit ses textes dans les
+tables de `report_texts`, construites une seule fois à l'import.
+
+`generate_summary_pdf` rend un résumé : seulement les sections choisies,
+mises en page à la suite les unes des autres, sans le canevas décoratif.
+
+Avec REPORT_DETERMINISTIC=1, des réponses identiques donnent les mêmes
+octets (date de création fixée par SOURCE_DATE_EPOCH). Les rapports envoyés
+étant stockés par empreinte SHA-256 (report_store), ils ne sont alors écrits
+qu'une fois et gardent le même ETag d'un envoi à l'autre.
+"""
+import hashlib
+import json
+import os
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from fpdf import FPDF
+from fpdf.enums import XPos, YPos
+from fpdf.fonts import CoreFont
+
+import metrics
+from report_assets import IMAGE_ASSETS, REPORT_SIZE_PROFILE
+from report_charts import CHENE_CLAIR, PALETTE_VIN, pie_chart
+from report_fonts import FONT_ASSETS
+from report_fragments import FRAGMENT_CACHE
+from report_lines import LINE_CACHE
+from report_texts import (
+    MENTIONS_INVESTISSEMENT,
+    MENTIONS_PRESENTATION,
+    PHRASES_NOMBRE_ENFANTS,
+    PHRASES_PROFIL,
+    PHRASES_REGION,
+    PHRASES_REGION_AUTRE,
+    TEXTES_ANNEXE,
+    TEXTES_BUDGET,
+    TEXTES_CONCLUSION,
+    TEXTES_CONNAISSANCE,
+    TEXTES_DONATIONS,
+    TEXTES_IMPRESSION,
+    TEXTES_INTRODUCTION,
+    TEXTES_MATRIMONIAL,
+    TEXTES_POSSESSION,
+    TEXTES_REGION,
+    TEXTES_RELATION,
+    TEXTES_RISQUE,
+    TEXTES_SOCIETE,
+    TEXTES_TRANSMISSION,
+    TITRES_ANNEXE,
+    TITRES_CONCLUSION,
+    TITRES_DIVERSIFICATION,
+    TITRES_DONATION,
+    TITRES_INTRODUCTION,
+    TITRES_OPTIMISATION,
+    TITRES_PATRIMOINE,
+    TITRES_RAPPORT,
+    TITRES_RAPPORT_VIN,
+    TITRES_REGIME,
+    TITRES_RESERVE,
+    TITRES_RISQUE,
+    TITRES_TRANSMISSION,
+)
+
+BORDEAUX = (128, 0, 32)
+BORDEAUX_FONCE = (106, 27, 27)  # #6a1b1b
+
+# Position des titres à bouteille : (x bouteille, x titre, x titre sans bouteille)
+TITRE_CENTRE = (55, 67, 60)
+TITRE_GAUCHE = (35, 48, 43)
+
+# Mode déterministe (REPORT_DETERMINISTIC=1) : mêmes réponses -> mêmes octets.
+# La date de création est fixe (SOURCE_DATE_EPOCH) et l'/ID du fichier, dérivé
+# du contenu et de cette date, devient stable lui aussi.
+REPORT_DETERMINISTIC = os.getenv("REPORT_DETERMINISTIC", "0") == "1"
+DATE_DETERMINISTE = datetime.fromtimestamp(int(os.getenv("SOURCE_DATE_EPOCH", "1735689600")), tz=timezone.utc)
+
+# Mode Unicode : le texte courant est rendu en DejaVu Sans (voir report_fonts),
+# sans passer par clean_text (euro, guillemets et tirets conservés)
+REPORT_UNICODE_FONT = os.getenv("REPORT_UNICODE_FONT", "0") == "1"
+
+# Résumé : sections rendues par défaut, espace entre deux sections (mm) et
+# hauteur libre minimale pour commencer une section sur la page en cours
+SECTIONS_RESUME = ("titre", "transmission", "regime_matrimonial", "conclusion")
+ESPACE_RESUME = 8
+HAUTEUR_MIN_RESUME = 60
+
+# Bornes des réponses libres qui font grossir le rendu : parts du diagramme
+# successoral et longueur des remarques reprises en annexe
+NOMBRE_ENFANTS_MAX = 20
+REMARQUES_MAX = 2000
+
+# Illustration affichée selon le régime matrimonial
+IMAGES_REGIME = {
+    "communautelegale": "regime_legal",
+    "separationbien": "separation_biens",
+    "communauteuniverselle": "communaute_universelle",
+}
+
+
+def clean_text(txt):
+    """
+    Nettoie le texte pour éviter les erreurs d'encodage avec FPDF (Helvetica non Unicode).
+    Remplace les apostrophes typographiques, guillemets, tirets et caractères spéciaux courants.
+    """
+    if not txt:
+        return ""
+
+    return (
+        txt.replace("’", "'")
+           .replace("‘", "'")
+           .replace("‛", "'")
+           .replace("“", '"')
+           .replace("”", '"')
+           .replace("„", '"')
+           .replace("«", '"')
+           .replace("»", '"')
+           .replace("–", "-")
+           .replace("—", "-")
+           .replace("−", "-")
+           .replace("…", "...")
+           .replace("•", "-")
+           .replace("€", "EUR")
+           .replace("°", " deg ")
+           .replace("¼", "1/4")
+           .replace("½", "1/2")
+           .replace("¾", "3/4")
+           .replace("\u00A0", " ")  # espace insécable
+           .replace("\u202F", " ")  # espace fine insécable
+           .strip()
+    )
+
+
+def texte(table, lang):
+    """Renvoie l'entrée de `table` pour la langue demandée (FR par défaut)."""
+    return table.get(lang, table["fr"])
+
+
+class ReportPDF(FPDF):
+    """FPDF avec les éléments de mise en page récurrents du rapport."""
+
+    # Polices du rapport, enregistrées dans un ordre fixe : leurs index (/F1, /F2...)
+    # sont alors les mêmes dans tous les documents (voir report_fragments)
+    FONTS = ("", "B", "I")
+
+    def __init__(self, *args, deterministic=False, unicode=REPORT_UNICODE_FONT,
+                 size_profile=REPORT_SIZE_PROFILE, compact=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Résumé : sections à la suite, sans canevas (voir add_canvas_page)
+        self.compact = compact
+        # Profil des images (voir report_assets), partie de la clé du cache des fragments
+        self.size_profile = size_profile
+        if deterministic:
+            self.set_creation_date(DATE_DETERMINISTE)
+        IMAGE_ASSETS.attach(self, size_profile)
+        for style in self.FONTS:
+            if not (unicode and FONT_ASSETS.attach(self, style)):
+                self.fonts["helvetica" + style] = CoreFont(self, "helvetica" + style, style)
+
+    def clean(self, txt):
+        """Texte prêt pour la police courante : clean_text seulement pour une police non Unicode."""
+        if self.is_ttf_font:
+            return (txt or "").strip()
+        return clean_text(txt)
+
+    def asset_image(self, key, **kwargs):
+        """Dessine une image du registre si elle est disponible ; renvoie True si dessinée."""
+        if not IMAGE_ASSETS.available(key):
+            return False
+        self.image(IMAGE_ASSETS.path(key), **kwargs)
+        return True
+
+    @property
+    def layout(self):
+        """Mise en page du document, partie de la clé du cache des fragments."""
+        return "resume" if self.compact else "complet"
+
+    def add_canvas_page(self, y=None, space_before=0):
+        """
+        Nouvelle page avec le canevas décoratif en fond, texte à partir de `y`
+        ou après `space_before` mm. En résumé, la section suit la précédente
+        sur la même page s'il y reste assez de place.
+        """
+        if self.compact:
+            if self.page and self.y + HAUTEUR_MIN_RESUME < self.page_break_trigger:
+                self.ln(ESPACE_RESUME)
+            else:
+                self.add_page()
+            return
+
+        self.add_page()
+        self.asset_image("canevas", x=0, y=0, w=210, h=297)
+        if y is not None:
+            self.set_y(y)
+        if space_before:
+            self.ln(space_before)
+
+    def centered_title(self, titre):
+        """Grand titre centré couleur vin, souligné d'une ligne décorative."""
+        self.set_font("Helvetica", style="B", size=22)
+        self.set_text_color(*BORDEAUX)
+        self.ln(5 if self.compact else 17)
+        self.cell(0, 20, titre, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+
+        self.set_draw_color(*BORDEAUX)
+        self.set_line_width(0.8)
+        margin = 60
+        y_line = self.get_y()
+        self.line(margin, y_line, self.w - margin, y_line)
+        self.ln(15)
+
+        self.set_text_color(0, 0, 0)
+        self.set_font("Helvetica", size=12)
+
+    def bottle_title(self, titre, position, space_after=6):
+        """Titre de section précédé de la petite bouteille, à la hauteur courante."""
+        bottle_x, text_x, text_x_seul = position
+        # On dessine la bouteille légèrement à gauche du texte
+        if not self.asset_image("bouteille", x=bottle_x, y=self.get_y() + 1, w=8):
+            text_x = text_x_seul
+
+        self.set_font("Helvetica", "B", 16)
+        self.set_text_color(*BORDEAUX_FONCE)
+        self.set_x(text_x)
+        self.cell(0, 10, titre, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="L")
+        self.ln(space_after)
+
+        self.set_text_color(0, 0, 0)
+        self.set_font("Helvetica", size=12)
+
+    def paragraph(self, txt, space_after, align="L", cache=True):
+        """
+        Paragraphe de texte courant (police courante), suivi d'un espacement.
+        `cache=False` pour un texte saisi par le visiteur : coupé en lignes sans
+        passer par le cache de lignes.
+        """
+        if cache:
+            LINE_CACHE.multi_cell(self, 8, self.clean(txt), align=align)
+        else:
+            self.multi_cell(0, 8, text=self.clean(txt), align=align)
+        if space_after:
+            self.ln(space_after)
+
+    def centered_image(self, key, width, space_after=10):
+        """Image du registre centrée horizontalement, à la hauteur courante."""
+        if self.asset_image(key, x=(210 - width) / 2, y=None, w=width) and space_after:
+            self.ln(space_after)
+
+
+# === Registre des sections ===
+Section = namedtuple("Section", ["name", "render", "inputs", "texte_libre"])
+
+SECTIONS = []
+
+# Durées exportées sur /metrics
+SECTION_SECONDS = metrics.histogram(
+    "grandcrux_report_section_seconds", "Durée de rendu de chaque section du rapport", ["section"]
+)
+RENDER_SECONDS = metrics.histogram(
+    "grandcrux_report_render_seconds", "Durée de rendu d'un PDF complet, sérialisation comprise", ["document"]
+)
+
+
+def section(name, inputs=None, texte_libre=()):
+    """
+    Enregistre un rendu de section ; les sections sont rendues dans l'ordre d'enregistrement.
+
+    `inputs` liste les clés du formulaire lues par la section : sa mise en page
+    est alors mise en cache (report_fragments). Sans `inputs`, elle est refaite
+    à chaque rapport. `texte_libre` liste les champs saisis librement par le
+    visiteur : quand l'un d'eux est rempli, la section est mise en page sans
+    passer par le cache.
+    """
+    def register(render):
+        SECTIONS.append(Section(name, render, tuple(inputs) if inputs is not None else None, tuple(texte_libre)))
+        return render
+    return register
+
+
+@section("titre")
+def render_titre(pdf, data):
+    # Résumé : en-tête en haut de la première page, les sections suivent
+    if not pdf.compact:
+        pdf.add_page()
+
+    # === Logo centré ===
+    img_width = 60 if pdf.compact else 100
+    pdf.asset_image("logo", x=(pdf.w - img_width) / 2, y=5, w=img_width)
+
+    pdf.set_font("Helvetica", style='B', size=20)
+    pdf.set_text_color(*BORDEAUX)
+
+    if pdf.compact:
+        pdf.set_y(45)
+    else:
+        block_height = 20 + 10 + 10
+        pdf.set_y((pdf.h - block_height) / 2 - 10)
+
+    titre = texte(TITRES_RAPPORT, data.get("lang", "fr")).format(
+        prenom=data.get("prenom") or "",
+        nom=data.get("nom") or "",
+    )
+    pdf.multi_cell(0, 12, text=titre, align="C")
+
+    # === Ligne décorative ===
+    pdf.set_draw_color(*BORDEAUX)
+    pdf.set_line_width(0.8)
+    line_margin = 60
+    current_y = pdf.get_y()
+    pdf.line(line_margin, current_y + 3, pdf.w - line_margin, current_y + 3)
+
+    pdf.ln(15)
+
+
+@section("introduction", inputs=("lang",))
+def render_introduction(pdf, data):
+    lang = data.get("lang", "fr")
+
+    pdf.add_canvas_page()
+    pdf.centered_title(texte(TITRES_INTRODUCTION, lang))
+    pdf.paragraph(texte(TEXTES_INTRODUCTION, lang), 10)
+
+
+@section("connaissance", inputs=("lang", "connaissance_vin", "relation_vin"))
+def render_connaissance(pdf, data):
+    lang = data.get("lang", "fr")
+    connaissance = data.get("connaissance_vin") or ""
+    relation = data.get("relation_vin") or ""
+
+    pdf.add_canvas_page()
+    pdf.centered_title(texte(TITRES_RAPPORT_VIN, lang))
+
+    phrase_intro = texte(PHRASES_PROFIL, lang).format(
+        connaissance=connaissance.replace('_', ' '),
+        relation=relation.replace('_', ' '),
+    )
+    textes_connaissance = texte(TEXTES_CONNAISSANCE, lang)
+    textes_relation = texte(TEXTES_RELATION, lang)
+
+    pdf.paragraph(phrase_intro, 6)
+    pdf.paragraph(textes_connaissance.get(connaissance, textes_connaissance["autre"]), 6)
+    pdf.paragraph(textes_relation.get(relation, textes_relation["autre"]), 10)
+
+
+@section("region", inputs=("lang", "region_preferee"))
+def render_region(pdf, data):
+    lang = data.get("lang", "fr")
+    region = data.get("region_preferee") or ""
+
+    # Phrase spécifique pour “autre”, phrase standard sinon
+    if region == "autre":
+        phrase_intro_region = texte(PHRASES_REGION_AUTRE, lang)
+    else:
+        phrase_intro_region = texte(PHRASES_REGION, lang).format(region=region.replace('_', ' '))
+
+    textes_region = texte(TEXTES_REGION, lang)
+
+    pdf.paragraph(phrase_intro_region, 6)
+    pdf.paragraph(textes_region.get(region, textes_region["autre"]), 10)
+
+
+@section("diversification", inputs=("lang", "budget_vin"))
+def render_diversification(pdf, data):
+    lang = data.get("lang", "fr")
+    budget_vin = data.get("budget_vin", "moins_500")
+    textes_budget = texte(TEXTES_BUDGET, lang)
+
+    pdf.add_canvas_page(y=30)
+    pdf.bottle_title(texte(TITRES_DIVERSIFICATION, lang), TITRE_CENTRE)
+
+    pdf.paragraph(textes_budget.get(budget_vin, TEXTES_BUDGET["fr"]["moins_500"]), 6)
+    pdf.paragraph(textes_budget["explication"], 10)
+
+    page_width = pdf.w - 2 * pdf.l_margin
+    graph_width = 80
+    if pdf.asset_image("graph", x=(page_width - graph_width) / 2 + pdf.l_margin, w=graph_width):
+        pdf.ln(10)
+
+        if budget_vin:  # si un choix de budget a été fait, peu importe lequel
+            pdf.set_font("Helvetica", "I", 11)
+            pdf.set_text_color(80, 80, 80)  # gris doux
+            pdf.ln(4)
+            pdf.paragraph(texte(MENTIONS_INVESTISSEMENT, lang), 10, align="C")
+
+
+@section("possession", inputs=("lang", "forme_possession", "motivation"))
+def render_possession(pdf, data):
+    lang = data.get("lang", "fr")
+    forme_possession = data.get("forme_possession", "pas_encore")
+    motivation = data.get("motivation", "plaisir")
+    textes_possession = texte(TEXTES_POSSESSION, lang)
+
+    pdf.add_canvas_page(y=30)
+    pdf.bottle_title(texte(TITRES_PATRIMOINE, lang), TITRE_GAUCHE)
+
+    pdf.paragraph(textes_possession.get(forme_possession, TEXTES_POSSESSION["fr"]["pas_encore"]), 6)
+
+    pdf.set_font("Helvetica", "I", size=12)
+    pdf.paragraph(textes_possession["intro_motivation"], 4)
+
+    pdf.set_font("Helvetica", size=12)
+    pdf.paragraph(textes_possession.get(motivation, TEXTES_POSSESSION["fr"]["plaisir"]), 10)
+
+
+@section("risque", inputs=("lang", "risque"))
+def render_risque(pdf, data):
+    lang = data.get("lang", "fr")
+    risque = data.get("risque", "modere")
+    textes_risque = texte(TEXTES_RISQUE, lang)
+
+    # Suite de la page « patrimoine »
+    pdf.bottle_title(texte(TITRES_RISQUE, lang), TITRE_GAUCHE)
+
+    pdf.paragraph(textes_risque["intro"], 6)
+    pdf.paragraph(textes_risque.get(risque, TEXTES_RISQUE["fr"]["modere"]), 10)
+
+
+def diagramme_successoral(pdf, nombre_enfants):
+    """Camembert quotité disponible / réserve de chaque enfant, centré sur la page."""
+    labels = ['Quotité disponible']
+    sizes = [50]
+    colors = [CHENE_CLAIR]
+
+    part_reserve = 50 / nombre_enfants
+    for i in range(1, nombre_enfants + 1):
+        labels.append(f"Réserve enfant {i}")
+        sizes.append(part_reserve)
+        colors.append(PALETTE_VIN[i % len(PALETTE_VIN)])
+
+    pie_chart(pdf, sizes, labels, colors, title="Masse successorale (ou 'fictive')", width=100)
+
+
+@section("transmission", inputs=("lang", "enfants", "nombre_enfants"))
+def render_transmission(pdf, data):
+    lang = data.get("lang", "fr")
+    enfants = data.get("enfants", "non")
+    nombre_enfants_str = (data.get("nombre_enfants") or "").strip()
+    nombre_enfants = min(int(nombre_enfants_str), NOMBRE_ENFANTS_MAX) if nombre_enfants_str.isdigit() else 0
+    textes_transmission = texte(TEXTES_TRANSMISSION, lang)
+
+    pdf.add_canvas_page()
+    pdf.centered_title(texte(TITRES_TRANSMISSION, lang))
+
+    pdf.paragraph(textes_transmission["intro"], 6)
+    pdf.paragraph(textes_transmission["enfants_oui" if enfants == "oui" else "enfants_non"], 10)
+
+    # === Si enfants, on affiche l’analyse et le diagramme ===
+    if enfants == "oui" and nombre_enfants > 0:
+        pdf.add_canvas_page(y=30)
+        pdf.bottle_title(texte(TITRES_RESERVE, lang), TITRE_GAUCHE, space_after=10)
+
+        pdf.paragraph(textes_transmission["analyse_intro"], 6)
+
+        singulier, pluriel = texte(PHRASES_NOMBRE_ENFANTS, lang)
+        phrase = singulier if nombre_enfants == 1 else pluriel
+        pdf.cell(0, 8, phrase.format(nombre=nombre_enfants), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+        diagramme_successoral(pdf, nombre_enfants)
+
+        pdf.ln(10)
+        pdf.paragraph(textes_transmission["analyse_suite"], 10)
+
+
+@section("regime_matrimonial", inputs=("lang", "mariage", "regime"))
+def render_regime_matrimonial(pdf, data):
+    lang = data.get("lang", "fr")
+    mariage = data.get("mariage", "non")
+    regime = data.get("regime", "")
+    textes_matrimonial = texte(TEXTES_MATRIMONIAL, lang)
+
+    pdf.add_canvas_page(y=30)
+    pdf.bottle_title(texte(TITRES_REGIME, lang), TITRE_CENTRE)
+
+    pdf.paragraph(textes_matrimonial["intro"], 6)
+
+    if mariage == "non":
+        pdf.paragraph(textes_matrimonial["non"], 10)
+    else:
+        texte_regime = textes_matrimonial.get(regime, "")
+        if texte_regime:
+            pdf.paragraph(texte_regime, 8)
+
+            # --- Illustration selon le régime ---
+            image_key = IMAGES_REGIME.get(regime)
+            if image_key:
+                pdf.centered_image(image_key, 100)
+
+
+@section("societe", inputs=("lang", "societe"), texte_libre=("type_societe",))
+def render_societe(pdf, data):
+    lang = data.get("lang", "fr")
+    societe = data.get("societe", "non")
+    type_societe = (data.get("type_societe") or "").strip()
+    textes_societe = texte(TEXTES_SOCIETE, lang)
+
+    pdf.add_canvas_page(y=30)
+    pdf.bottle_title(texte(TITRES_OPTIMISATION, lang), TITRE_CENTRE)
+
+    pdf.paragraph(textes_societe["intro"], 6)
+
+    if societe == "oui":
+        if type_societe:
+            pdf.paragraph(textes_societe["type"].format(type_societe=type_societe), 8, cache=False)
+    else:
+        pdf.paragraph(textes_societe["non"], 0)
+
+    pdf.ln(10)
+
+
+@section("donations", inputs=("lang", "donations"))
+def render_donations(pdf, data):
+    lang = data.get("lang", "fr")
+    donations = data.get("donations", "non")
+    textes_donations = texte(TEXTES_DONATIONS, lang)
+
+    pdf.add_canvas_page(y=30)
+    pdf.bottle_title(texte(TITRES_DONATION, lang), TITRE_CENTRE)
+
+    pdf.paragraph(textes_donations["intro"], 6)
+    pdf.paragraph(textes_donations["types"], 6)
+    pdf.paragraph(textes_donations["pacte"], 10)
+
+    # --- NOUVELLE PAGE avant la transition ---
+    pdf.add_canvas_page(space_before=25)
+
+    pdf.paragraph(textes_donations["transition_oui" if donations == "oui" else "transition_non"], 6)
+    pdf.paragraph(textes_donations["vin"], 10)
+
+
+@section("conclusion", inputs=("lang", "importance_patrimoine", "presentation"))
+def render_conclusion(pdf, data):
+    lang = data.get("lang", "fr")
+    importance_patrimoine = data.get("importance_patrimoine", "moyenne")
+
+    pdf.add_canvas_page()
+    pdf.centered_title(texte(TITRES_CONCLUSION, lang))
+
+    textes_conclusion = texte(TEXTES_CONCLUSION, lang)
+    pdf.paragraph(textes_conclusion.get(importance_patrimoine, TEXTES_CONCLUSION["fr"]["moyenne"]), 15)
+
+    # === Coordonnées finales ===
+    pdf.set_font("Helvetica", "I", size=11)
+    pdf.set_text_color(90, 0, 20)
+    pdf.cell(0, 10, "info@grandcruX.com  |  www.grandcruX.com", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+    pdf.ln(30)
+    # petite largeur pour un rendu discret et chic
+    pdf.centered_image("slice", 80)
+
+    # === Mention complémentaire uniquement si une case est cochée ===
+    if data.get("presentation"):
+        pdf.set_font("Helvetica", "I", 11)
+        pdf.set_text_color(80, 80, 80)  # gris doux
+        pdf.ln(4)
+        pdf.paragraph(texte(MENTIONS_PRESENTATION, lang), 10, align="C")
+
+
+@section("remarques")
+def render_remarques(pdf, data):
+    remarques = (data.get("remarques") or "").strip()[:REMARQUES_MAX]
+    if not remarques:  # uniquement si le champ n'est pas vide
+        return
+
+    lang = data.get("lang", "fr")
+    pdf.add_page()
+
+    # === Fond / style global ===
+    pdf.set_font("Helvetica", "B", 28)
+    pdf.set_text_color(*BORDEAUX)
+    pdf.ln(20)
+    pdf.cell(0, 20, texte(TITRES_ANNEXE, lang), new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+
+    # Ligne décorative sous le titre
+    pdf.set_draw_color(*BORDEAUX)
+    pdf.set_line_width(1)
+    margin = 60
+    y_line = pdf.get_y()
+    pdf.line(margin, y_line, pdf.w - margin, y_line)
+    pdf.ln(20)
+
+    # === Introduction texte selon la langue ===
+    pdf.set_font("Helvetica", "I", 12)
+    pdf.set_text_color(0, 0, 0)
+    pdf.paragraph(texte(TEXTES_ANNEXE, lang), 12)
+
+    # === Encadré pointillé pour réponse ===
+    y_start = pdf.get_y()
+    box_height = 70
+    margin_x = 20
+    page_width = pdf.w
+    pdf.set_draw_color(150, 150, 150)  # gris doux
+    pdf.set_line_width(0.4)
+    pdf.dashed_line(margin_x, y_start, page_width - margin_x, y_start)
+    pdf.dashed_line(margin_x, y_start + box_height, page_width - margin_x, y_start + box_height)
+    pdf.dashed_line(margin_x, y_start, margin_x, y_start + box_height)
+    pdf.dashed_line(page_width - margin_x, y_start, page_width - margin_x, y_start + box_height)
+
+    pdf.ln(box_height + 10)
+
+    # === Reprise du commentaire du client ===
+    pdf.set_font("Helvetica", size=12)
+    pdf.set_text_color(90, 0, 20)
+
+    y_start = pdf.get_y()
+
+    # 1️⃣ Logo à gauche
+    pdf.asset_image("question", x=10, y=y_start - 5, w=55)
+
+    # 2️⃣ Remarque du client centrée
+    pdf.set_xy(55, y_start + 8)
+    pdf.multi_cell(120, 8, f"« {remarques} »", align="C")
+
+    # 3️⃣ Espace après le bloc
+    pdf.ln(40)
+
+
+def _client_prefix(data):
+    return f"{(data.get('prenom') or '').replace(' ', '_')}_{(data.get('nom') or '').replace(' ', '_')}"
+
+
+def report_filename(data):
+    """Nom de pièce jointe du rapport (ou du résumé) d'un client."""
+    if data.get("rapport") == "resume":
+        return f"{_client_prefix(data)}_resume.pdf"
+    return f"{_client_prefix(data)}_conditions.pdf"
+
+
+def print_report_filename(data):
+    """Nom de pièce jointe des formules d'impression d'un client."""
+    return f"{_client_prefix(data)}_print_version_{data.get('lang', 'fr')}.pdf"
+
+
+def _render_report(data, deterministic, size_profile, sections=None):
+    """Rend toutes les sections, ou seulement `sections` (noms) en résumé."""
+    compact = sections is not None
+    with RENDER_SECONDS.time(document="resume" if compact else "rapport"):
+        pdf = ReportPDF(deterministic=deterministic, size_profile=size_profile, compact=compact)
+        if compact:
+            pdf.add_page()
+
+        for report_section in SECTIONS:
+            if compact and report_section.name not in sections:
+                continue
+            with SECTION_SECONDS.time(section=report_section.name):
+                FRAGMENT_CACHE.render(pdf, report_section, data)
+
+        return bytes(pdf.output())
+
+
+def generate_pdf(size_profile=REPORT_SIZE_PROFILE, deterministic=REPORT_DETERMINISTIC, **data):
+    """
+    Rend le rapport complet et renvoie le PDF en mémoire (bytes).
+
+    `size_profile` choisit les images embarquées : `email` (variantes
+    allégées, par défaut) ou `print` (fichiers d'origine). `deterministic`
+    fixe la date de création (voir REPORT_DETERMINISTIC).
+    """
+    return _render_report(data, deterministic, size_profile)
+
+
+def summary_sections(data):
+    """Sections choisies pour le résumé (clé `sections`), dans l'ordre du rapport."""
+    noms = set(data.get("sections") or ())
+    choisies = tuple(s.name for s in SECTIONS if s.name in noms)
+    return choisies or SECTIONS_RESUME
+
+
+def generate_summary_pdf(size_profile=REPORT_SIZE_PROFILE, deterministic=REPORT_DETERMINISTIC, **data):
+    """
+    Rend le résumé du rapport et renvoie le PDF en mémoire (bytes).
+
+    Seules les sections listées dans `sections` (noms du registre, par défaut
+    SECTIONS_RESUME) sont rendues, à la suite les unes des autres et sans le
+    canevas de fond : quelques pages au lieu d'une quinzaine.
+    """
+    return _render_report(data, deterministic, size_profile, summary_sections(data))
+
+
+# Page des formules d'impression déjà rendue : (langue, profil) -> (empreinte des textes, bytes)
+_PRINT_PDFS = {}
+
+
+def _print_fingerprint(t):
+    """Empreinte des textes de la page d'impression : un changement de tarif invalide le cache."""
+    return hashlib.sha256(json.dumps(t, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def generate_print_pdf(size_profile=REPORT_SIZE_PROFILE, **data):
+    """
+    Page des formules d'impression en mémoire (bytes).
+
+    Elle ne dépend que de la langue et du profil de taille des images (voir
+    `generate_pdf`) : chaque variante est rendue une fois par processus, en
+    mode déterministe, puis resservie telle quelle ; seul le nom du fichier
+    joint (`print_report_filename`) est propre au client.
+    """
+    lang = data.get("lang", "fr")
+    if lang not in TEXTES_IMPRESSION:
+        lang = "fr"
+    t = TEXTES_IMPRESSION[lang]
+
+    empreinte = _print_fingerprint(t)
+    cached = _PRINT_PDFS.get((lang, size_profile))
+    if cached is None or cached[0] != empreinte:
+        cached = _PRINT_PDFS[lang, size_profile] = (empreinte, render_print_pdf(t, size_profile))
+    return cached[1]
+
+
+def preload_print_pdfs():
+    """Rend à l'avance les pages d'impression de toutes les langues."""
+    for lang in TEXTES_IMPRESSION:
+        generate_print_pdf(lang=lang)
+
+
+@RENDER_SECONDS.time(document="impression")
+def render_print_pdf(t, size_profile=REPORT_SIZE_PROFILE):
+    """Rend la page des formules d'impression à partir de ses textes `t`."""
+    pdf = ReportPDF(deterministic=True, size_profile=size_profile)
+    pdf.add_page()
+
+    # === Logo centré ===
+    img_width = 100
+    pdf.asset_image("logo", x=(pdf.w - img_width) / 2, y=10, w=img_width)
+    pdf.ln(60)
+
+    # === Titre principal ===
+    pdf.set_text_color(*BORDEAUX)
+    pdf.set_font("Helvetica", style='B', size=16)
+    pdf.cell(0, 10, pdf.clean(t["title"]), new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+
+    pdf.set_font("Helvetica", style='', size=12)
+    pdf.cell(0, 8, pdf.clean(t["subtitle"]), new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+    pdf.ln(10)
+
+    # === Tableau des formules ===
+    col1_width = 120
+    col2_width = 70
+
+    for desc, price in t["rows"]:
+        pdf.set_font("Helvetica", size=12)
+        pdf.cell(col1_width, 10, pdf.clean(desc), border=0)
+        pdf.set_font("Helvetica", style='B', size=12)
+        pdf.cell(col2_width, 10, pdf.clean(price), border=0, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+    # === Message final ===
+    pdf.ln(8)
+    pdf.set_font("Helvetica", style='', size=12)
+    pdf.multi_cell(0, 8, pdf.clean(t["footer"]), align="C")
+    pdf.ln(10)
+    pdf.set_font("Helvetica", style='B', size=12)
+    pdf.cell(0, 8, pdf.clean(t["team"]), new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+    pdf.ln(5)
+    pdf.set_font("Helvetica", style='', size=11)
+    pdf.cell(0, 8, pdf.clean(t["contact"]), new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+
+    return bytes(pdf.output())
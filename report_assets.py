@@ -0,0 +1,185 @@
+"""
+Registre des images statiques du rapport.
+
+Chaque image de `static/` est lue et décodée une seule fois par processus,
+puis enregistrée dans le cache d'images de chaque nouveau document FPDF :
+fpdf2 ne dédoublonne les images qu'à l'intérieur d'un même document. Les images
+déjà décodées dans le paquet de ressources (report_pack) n'y sont que lues.
+
+Profils de taille : `print` garde les fichiers d'origine ; `email` utilise des
+variantes ré-échantillonnées pour leur largeur d'affichage sur A4 (150 dpi),
+préparées dans le paquet ou, à défaut, au premier rendu du processus. Les
+variantes sont enregistrées sous le même nom que l'original et dessinées à la
+même largeur ; leur hauteur, déduite de leurs dimensions en pixels, peut
+différer d'une fraction de point : les fragments de sections en cache sont
+donc propres à chaque profil (voir report_fragments).
+
+Configuration : REPORT_SIZE_PROFILE (profil par défaut des rapports, `email`).
+"""
+import math
+import os
+import threading
+from io import BytesIO
+
+from fpdf.image_datastructures import RasterImageInfo
+from fpdf.image_parsing import get_img_info
+from PIL import Image
+
+from report_pack import ASSET_PACK, source_stamp
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# Clé -> fichier dans static/
+IMAGES = {
+    "logo": "grandcrux.png",
+    "canevas": "canevas.jpg",
+    "bouteille": "bouteille.jpg",
+    "graph": "graph.jpg",
+    "slice": "slice.jpg",
+    "question": "question_grandcrux.jpg",
+    "regime_legal": "regime_legal.jpg",
+    "separation_biens": "separation_biens.jpg",
+    "communaute_universelle": "communaute_universelle.jpg",
+}
+
+# Clé -> plus grande largeur (mm) à laquelle l'image est dessinée dans les PDF
+LARGEURS_MM = {
+    "logo": 100,
+    "canevas": 210,
+    "bouteille": 8,
+    "graph": 80,
+    "slice": 80,
+    "question": 55,
+    "regime_legal": 100,
+    "separation_biens": 100,
+    "communaute_universelle": 100,
+}
+
+# Profil de taille -> (résolution en dpi, qualité JPEG) des variantes ; None = fichiers d'origine
+PROFILS = {
+    "print": None,
+    "email": (150, 80),
+}
+
+REPORT_SIZE_PROFILE = os.getenv("REPORT_SIZE_PROFILE", "email")
+
+
+def resized_image(path, width_mm, dpi, quality):
+    """Image ré-encodée pour `width_mm` à `dpi` (bytes), ou None si elle n'est pas plus grande."""
+    with Image.open(path) as img:
+        largeur = math.ceil(width_mm / 25.4 * dpi)
+        if img.width <= largeur:
+            return None
+        hauteur = max(1, round(img.height * largeur / img.width))
+        icc_profile = img.info.get("icc_profile")
+        jpeg = img.format == "JPEG"
+        resized = img.resize((largeur, hauteur), Image.LANCZOS)
+
+    output = BytesIO()
+    if jpeg:
+        resized.save(output, "JPEG", quality=quality, optimize=True, icc_profile=icc_profile)
+    else:
+        resized.save(output, "PNG", optimize=True, icc_profile=icc_profile)
+    return output.getvalue()
+
+
+class PackedImageInfo(RasterImageInfo):
+    """Image du paquet : ses flux sont des vues sur la projection, copiés à la lecture."""
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        return bytes(value) if isinstance(value, memoryview) else value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+class ImageRegistry:
+    def __init__(self, static_dir=STATIC_DIR, images=IMAGES, pack=ASSET_PACK):
+        self.static_dir = static_dir
+        self.images = images
+        self.pack = pack
+        # Profil -> clé -> infos décodées
+        self._infos = {}
+        self._lock = threading.RLock()
+
+    def path(self, key):
+        """Chemin de l'image, utilisé aussi comme nom dans le cache fpdf2."""
+        return os.path.join(self.static_dir, self.images[key])
+
+    def load(self, profile="print"):
+        """Lit et décode les images présentes sur disque pour `profile` (une seule fois)."""
+        infos = self._infos.get(profile)
+        if infos is not None:
+            return infos
+        if profile not in PROFILS:
+            raise ValueError(f"Profil de taille inconnu : {profile}")
+
+        with self._lock:
+            if profile not in self._infos:
+                infos = {}
+                for key in self.images:
+                    path = self.path(key)
+                    packed = self.from_pack(profile, key, path)
+                    if packed is not None:
+                        infos[key] = packed
+                    elif os.path.exists(path):
+                        infos[key] = self.decode(profile, key, path)
+                self._infos[profile] = infos
+        return self._infos[profile]
+
+    def decode(self, profile, key, path):
+        if PROFILS[profile] is None or key not in LARGEURS_MM:
+            return get_img_info(path)
+        dpi, quality = PROFILS[profile]
+        data = resized_image(path, LARGEURS_MM[key], dpi, quality)
+        if data is None:
+            return self.load("print")[key]
+        return get_img_info(path, img=data)
+
+    def from_pack(self, profile, key, path):
+        entry = self.pack.entry(f"images/{profile}", key, path) if self.pack else None
+        if entry is None:
+            return None
+        info = PackedImageInfo(entry["fields"])
+        for field, ref in entry["blobs"].items():
+            info[field] = self.pack.blob(ref)
+        return info
+
+    def pack_entry(self, key, info, writer):
+        """Entrée du paquet pour une image décodée (None si elle ne peut pas y figurer)."""
+        if not isinstance(info, RasterImageInfo):
+            return None
+        fields, blobs = {}, {}
+        for field, value in info.items():
+            if isinstance(value, (bytes, bytearray)):
+                blobs[field] = writer.add_blob(value)
+            elif value is None or isinstance(value, (bool, int, float, str)):
+                fields[field] = value
+            else:
+                return None
+        return {"source": source_stamp(self.path(key)), "fields": fields, "blobs": blobs}
+
+    def available(self, key):
+        return key in self.load()
+
+    def attach(self, pdf, profile="print"):
+        """Enregistre les images pré-décodées du profil dans le cache d'images du document `pdf`."""
+        cache = pdf.image_cache
+        for key, info in self.load(profile).items():
+            # Copie par document : seuls l'index et le compteur d'usages sont propres au PDF,
+            # les flux d'image décodés sont partagés.
+            doc_info = info.__class__(info)
+            doc_info["i"] = len(cache.images) + 1
+            doc_info["usages"] = 0
+            doc_info["iccp_i"] = None
+            iccp = info.get("iccp")
+            if iccp:
+                if iccp not in cache.icc_profiles:
+                    cache.icc_profiles[iccp] = len(cache.icc_profiles)
+                doc_info["iccp_i"] = cache.icc_profiles[iccp]
+            doc_info["iccp"] = None
+            cache.images[self.path(key)] = doc_info
+
+
+IMAGE_ASSETS = ImageRegistry()
@@ -0,0 +1,170 @@
+"""
+Graphiques du rapport, dessinés directement en tracés vectoriels fpdf2.
+
+Le backend `matplotlib` (image PNG rasterisée) reste disponible via la
+variable d'environnement REPORT_CHART_BACKEND=matplotlib ; matplotlib est
+alors importé au premier graphique seulement.
+"""
+import math
+import os
+from io import BytesIO
+
+CHART_BACKEND = os.getenv("REPORT_CHART_BACKEND", "vector")
+
+# Palette du rapport
+CHENE_CLAIR = '#C29E75'  # beige doré (chêne clair)
+PALETTE_VIN = ['#6A1B1B', '#7B2D26', '#8C3F32', '#9E5040', '#B5651D']  # bordeaux / vin
+
+
+def hex_to_rgb(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def _format_pct(value, total):
+    return f"{100 * value / total:1.1f}%"
+
+
+def draw_pie_chart(pdf, values, labels, colors, title=None, width=100):
+    """
+    Camembert vectoriel centré sur la page, à la hauteur courante.
+
+    Les parts démarrent à midi et tournent dans le sens antihoraire (comme
+    `startangle=90` de matplotlib). Le curseur est replacé sous le graphique.
+    """
+    radius = width * 0.3
+    label_gap = 8
+    title_height = 10 if title else 0
+    height = title_height + 2 * (radius + label_gap)
+
+    if pdf.get_y() + height > pdf.page_break_trigger:
+        pdf.add_page()
+
+    top = pdf.get_y()
+    cx = pdf.w / 2
+    cy = top + title_height + label_gap + radius
+    total = float(sum(values))
+
+    with pdf.local_context():
+        if title:
+            pdf.set_font("Helvetica", "", 11)
+            pdf.set_text_color(0, 0, 0)
+            pdf.text(cx - pdf.get_string_width(title) / 2, top + 6, title)
+
+        # Angles en degrés dans le repère de la page (y vers le bas) : -90 = midi
+        pdf.set_draw_color(255, 255, 255)
+        pdf.set_line_width(0.7)
+        start = -90.0
+        slices = []
+        for value, color in zip(values, colors):
+            sweep = 360.0 * value / total
+            if sweep <= 0:
+                continue
+            end = start - sweep
+            pdf.set_fill_color(*hex_to_rgb(color))
+            pdf.solid_arc(cx - radius, cy - radius, 2 * radius, end, start, style="DF")
+            slices.append((value, math.radians((start + end) / 2)))
+            start = end
+
+        pdf.set_font("Helvetica", "", 9)
+        for (value, mid), label in zip(slices, labels):
+            cos_mid, sin_mid = math.cos(mid), math.sin(mid)
+
+            # Libellé à l'extérieur de la part
+            pdf.set_text_color(0, 0, 0)
+            lx = cx + 1.1 * radius * cos_mid
+            ly = cy + 1.1 * radius * sin_mid + 1.5
+            if cos_mid < 0:
+                lx -= pdf.get_string_width(label)
+            pdf.text(lx, ly, label)
+
+            # Pourcentage au centre de la part
+            pct = _format_pct(value, total)
+            pdf.set_text_color(255, 255, 255)
+            pdf.text(
+                cx + 0.6 * radius * cos_mid - pdf.get_string_width(pct) / 2,
+                cy + 0.6 * radius * sin_mid + 1.5,
+                pct,
+            )
+
+    pdf.set_y(top + height)
+
+
+def draw_bar_chart(pdf, values, labels, colors, title=None, width=120, height=60, value_format="{:g}"):
+    """
+    Histogramme vectoriel centré sur la page, à la hauteur courante.
+
+    Chaque barre porte sa valeur au-dessus et son libellé en dessous. Le
+    curseur est replacé sous le graphique.
+    """
+    title_height = 10 if title else 0
+    label_height = 8
+    total_height = title_height + height + label_height
+
+    if pdf.get_y() + total_height > pdf.page_break_trigger:
+        pdf.add_page()
+
+    top = pdf.get_y()
+    left = (pdf.w - width) / 2
+    baseline = top + title_height + height
+    slot = width / max(len(values), 1)
+    bar_width = slot * 0.6
+    max_value = max(values) if values and max(values) > 0 else 1
+
+    with pdf.local_context():
+        pdf.set_text_color(0, 0, 0)
+        if title:
+            pdf.set_font("Helvetica", "", 11)
+            pdf.text((pdf.w - pdf.get_string_width(title)) / 2, top + 6, title)
+
+        # Axe horizontal
+        pdf.set_draw_color(*hex_to_rgb(PALETTE_VIN[0]))
+        pdf.set_line_width(0.3)
+        pdf.line(left, baseline, left + width, baseline)
+
+        pdf.set_font("Helvetica", "", 9)
+        for i, (value, label, color) in enumerate(zip(values, labels, colors)):
+            bar_height = (height - 6) * value / max_value
+            x = left + i * slot + (slot - bar_width) / 2
+            if bar_height > 0:
+                pdf.set_fill_color(*hex_to_rgb(color))
+                pdf.rect(x, baseline - bar_height, bar_width, bar_height, style="F")
+
+            value_text = value_format.format(value)
+            pdf.text(x + (bar_width - pdf.get_string_width(value_text)) / 2, baseline - bar_height - 1.5, value_text)
+            pdf.text(x + (bar_width - pdf.get_string_width(label)) / 2, baseline + 5, label)
+
+    pdf.set_y(top + total_height)
+
+
+def pie_chart_png(values, labels, colors, title=None):
+    """
+    Camembert matplotlib rendu en PNG, en mémoire.
+
+    matplotlib n'est importé qu'ici, au premier appel : les workers qui
+    utilisent le backend vectoriel ne le chargent jamais.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    ax.pie(
+        values, labels=labels, autopct='%1.1f%%', colors=colors,
+        startangle=90, wedgeprops={'edgecolor': 'white', 'linewidth': 2}
+    )
+    ax.axis('equal')
+    if title:
+        plt.title(title)
+    buffer = BytesIO()
+    plt.savefig(buffer, format="png", bbox_inches='tight')
+    plt.close(fig)
+    return buffer
+
+
+def pie_chart(pdf, values, labels, colors, title=None, width=100):
+    """Camembert centré à la hauteur courante, avec le backend configuré."""
+    if CHART_BACKEND == "matplotlib":
+        pdf.image(pie_chart_png(values, labels, colors, title), x=(pdf.w - width) / 2, y=None, w=width)
+    else:
+        draw_pie_chart(pdf, values, labels, colors, title, width)
@@ -0,0 +1,242 @@
+"""
+Police Unicode du rapport (DejaVu Sans).
+
+Le fichier TTF est lu et analysé une seule fois par processus (largeurs,
+table des caractères, descripteur) ; chaque document reçoit une copie légère
+de la police, avec sa propre table fontTools chargée paresseusement depuis
+les octets en mémoire : fpdf2 la réduit aux glyphes utilisés à la sortie du
+document, ce qui la modifie.
+
+Les polices sont enregistrées sous les clés de la famille Helvetica du
+rapport : les sections n'ont pas à changer leurs `set_font`. Un style dont le
+fichier est absent de static/fonts reste en Helvetica.
+
+Les glyphes d'un répertoire fixe (ASCII, Latin-1 et caractères des textes du
+rapport) reçoivent leurs codes dans le même ordre dans chaque document : les
+flux de contenu sont alors identiques d'un document à l'autre, ce que le cache
+des fragments (report_fragments) exige pour rejouer une section. La police est
+aussi réduite une fois à ce répertoire : un document qui n'en sort pas est
+sous-ensemblé à partir de cette copie d'une trentaine de Ko plutôt que du
+fichier complet.
+
+Le fichier DejaVuSans.pkl livré avec les polices est au format de l'ancien
+PyFPDF, que fpdf2 refuse de charger : c'est ce registre qui en tient lieu. Le
+paquet de ressources (report_pack) contient les métriques déjà analysées et
+la police réduite : un processus qui le projette n'a plus à lire le TTF.
+"""
+import copy
+import os
+import threading
+from collections import defaultdict
+from io import BytesIO
+
+from fontTools import subset as ftsubset
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.enums import FontDescriptorFlags, TextEmphasis
+from fpdf.fonts import PDFFontDescriptor, SubsetMap, TTFFont
+
+import report_texts
+from report_assets import STATIC_DIR
+from report_pack import ASSET_PACK, source_stamp
+
+FONTS_DIR = os.path.join(STATIC_DIR, "fonts")
+
+# Famille remplacée dans le rapport
+FAMILLE = "helvetica"
+
+# Style -> fichier dans static/fonts
+FONT_FILES = {
+    "": "DejaVuSans.ttf",
+    "B": "DejaVuSans-Bold.ttf",
+    "I": "DejaVuSans-Oblique.ttf",
+}
+
+# Attributs de la police analysée, partagés (en lecture seule) par tous les documents
+PARTAGES = ("type", "ttffile", "name", "scale", "up", "ut", "sp", "ss", "emphasis", "cmap", "cw", "glyph_ids")
+
+# Champs du descripteur de police (PDFFontDescriptor)
+DESCRIPTEUR = ("ascent", "descent", "cap_height", "flags", "font_b_box", "italic_angle", "stem_v", "missing_width")
+
+
+def _caracteres(valeur, trouves):
+    if isinstance(valeur, str):
+        trouves.update(valeur)
+    elif isinstance(valeur, dict):
+        for v in valeur.values():
+            _caracteres(v, trouves)
+    elif isinstance(valeur, (list, tuple)):
+        for v in valeur:
+            _caracteres(v, trouves)
+    return trouves
+
+
+def repertoire():
+    """Caractères dont les codes sont réservés d'avance, dans un ordre fixe."""
+    trouves = {chr(c) for c in range(0x20, 0x7F)} | {chr(c) for c in range(0xA0, 0x100)}
+    for nom in dir(report_texts):
+        if nom.isupper():
+            _caracteres(getattr(report_texts, nom), trouves)
+    return sorted(ord(c) for c in trouves if c.isprintable())
+
+
+def reduce_font(data, codes):
+    """Octets de la police réduite aux caractères `codes` (noms de glyphes conservés)."""
+    ttfont = ttLib.TTFont(BytesIO(data), recalcTimestamp=False, fontNumber=0, lazy=True)
+    options = ftsubset.Options(notdef_outline=True, recommended_glyphs=True, glyph_names=True)
+    options.drop_tables += ["FFTM"]
+    subsetter = ftsubset.Subsetter(options)
+    subsetter.populate(unicodes=codes)
+    subsetter.subset(ttfont)
+    output = BytesIO()
+    ttfont.save(output)
+    ttfont.close()
+    return output.getvalue()
+
+
+def font_metrics(font):
+    """Métriques analysées d'une police, sérialisables en JSON (voir font_from_metrics)."""
+    return {
+        "name": font.name,
+        "scale": font.scale,
+        "lignes": [font.up, font.ut, font.sp, font.ss],
+        "desc": {champ: getattr(font.desc, champ).value if champ == "flags" else getattr(font.desc, champ)
+                 for champ in DESCRIPTEUR},
+        "glyphes": [[code, font.cmap[code], font.glyph_ids[code], font.cw[code]] for code in font.cmap],
+    }
+
+
+def font_from_metrics(metrics, path, style):
+    """Police analysée reconstruite depuis ses métriques, sans relire le fichier TTF."""
+    font = TTFFont.__new__(TTFFont)
+    font.type = "TTF"
+    font.ttffile = path
+    font.fontkey = FAMILLE + style
+    font.name = metrics["name"]
+    font.scale = metrics["scale"]
+    font.up, font.ut, font.sp, font.ss = metrics["lignes"]
+    font.emphasis = TextEmphasis.coerce(style)
+
+    desc = dict(metrics["desc"])
+    desc["flags"] = FontDescriptorFlags(desc["flags"])
+    font.desc = PDFFontDescriptor(**desc)
+
+    font.cw = defaultdict(lambda: desc["missing_width"])
+    font.cmap, font.glyph_ids = {}, {}
+    for code, glyph, glyph_id, width in metrics["glyphes"]:
+        font.cmap[code] = glyph
+        font.glyph_ids[code] = glyph_id
+        font.cw[code] = width
+    return font
+
+
+class ReportFont(TTFFont):
+    """
+    Copie par document d'une police du registre.
+
+    La table fontTools n'est chargée qu'au premier accès, à la sortie du
+    document (le rapport n'utilise pas la mise en forme HarfBuzz) : depuis la
+    police réduite si tous les glyphes utilisés font partie du répertoire.
+    """
+
+    __slots__ = ("_ttfont", "_loaded", "_reserves")
+
+    @property
+    def ttfont(self):
+        if self._ttfont is None:
+            _, data, reduced, _ = self._loaded
+            if len(self.subset) > self._reserves:
+                reduced = data
+            self._ttfont = ttLib.TTFont(BytesIO(reduced), recalcTimestamp=False, fontNumber=0, lazy=True)
+        return self._ttfont
+
+    @ttfont.setter
+    def ttfont(self, value):
+        self._ttfont = value
+
+
+class FontRegistry:
+    def __init__(self, fonts_dir=FONTS_DIR, fonts=FONT_FILES, pack=ASSET_PACK):
+        self.fonts_dir = fonts_dir
+        self.fonts = fonts
+        self.pack = pack
+        self._loaded = None
+        self._lock = threading.Lock()
+
+    def path(self, style):
+        return os.path.join(self.fonts_dir, self.fonts[style])
+
+    def load(self):
+        """Lit et analyse les fichiers TTF présents sur disque (une seule fois)."""
+        if self._loaded is not None:
+            return self._loaded
+
+        with self._lock:
+            if self._loaded is None:
+                loaded = {}
+                for style in self.fonts:
+                    path = self.path(style)
+                    packed = self.from_pack(style, path)
+                    if packed is not None:
+                        loaded[style] = packed
+                        continue
+                    if not os.path.exists(path):
+                        continue
+                    with open(path, "rb") as f:
+                        data = f.read()
+                    font = TTFFont(FPDF(), path, FAMILLE + style, style)
+                    font.close()
+                    codes = [c for c in repertoire() if c in font.glyph_ids]
+                    loaded[style] = (font, data, reduce_font(data, codes), codes)
+                self._loaded = loaded
+        return self._loaded
+
+    def from_pack(self, style, path):
+        entry = self.pack.entry("fonts", style, path) if self.pack else None
+        # Le répertoire dépend des textes du rapport : un paquet plus ancien que ceux-ci est ignoré
+        if entry is None or entry["repertoire"] != repertoire():
+            return None
+        template = font_from_metrics(self.pack.json_blob(entry["metrics"]), path, style)
+        return template, self.pack.blob(entry["ttf"]), self.pack.blob(entry["reduced"]), entry["codes"]
+
+    def pack_entry(self, style, loaded, writer):
+        """Entrée du paquet pour une police analysée."""
+        template, data, reduced, codes = loaded
+        return {
+            "source": source_stamp(self.path(style)),
+            "repertoire": repertoire(),
+            "codes": codes,
+            "metrics": writer.add_json(font_metrics(template)),
+            "ttf": writer.add_blob(data),
+            "reduced": writer.add_blob(reduced),
+        }
+
+    def available(self, style):
+        return style in self.load()
+
+    def attach(self, pdf, style):
+        """Enregistre dans `pdf` une copie de la police du style ; renvoie False si absente."""
+        loaded = self.load().get(style)
+        if loaded is None:
+            return False
+        template, _, _, codes = loaded
+
+        font = ReportFont.__new__(ReportFont)
+        for attr in PARTAGES:
+            setattr(font, attr, getattr(template, attr))
+        font.i = len(pdf.fonts) + 1
+        font.fontkey = FAMILLE + style
+        # Le descripteur reçoit son numéro d'objet PDF à la sortie du document
+        font.desc = copy.copy(template.desc)
+        font.ttfont = None
+        font._loaded = loaded
+        font.missing_glyphs = []
+        font.subset = SubsetMap(font)
+        for code in codes:
+            font.subset.pick(code)
+        font._reserves = len(font.subset)
+        pdf.fonts[font.fontkey] = font
+        return True
+
+
+FONT_ASSETS = FontRegistry()
@@ -0,0 +1,190 @@
+"""
+Cache des fragments de sections du rapport.
+
+La plupart des sections ne dépendent que d'une ou deux réponses (langue,
+région, budget...). Une section qui déclare ses entrées (`@section(name,
+inputs=...)`) est mise en page une seule fois par combinaison de ces entrées
+et de l'état du document à son début (mise en page complète ou résumé,
+profil de taille des images, position, police, couleurs) : le fragment
+enregistré (flux de contenu des pages, ressources utilisées, état final) est
+ensuite rejoué dans les documents suivants.
+
+Les sections sans entrées déclarées (page de titre nominative, remarques
+libres) sont toujours mises en page, de même qu'une section dont un champ de
+texte libre (`texte_libre`, type de société par exemple) est rempli : ces
+textes n'apparaissent qu'une fois et ne restent pas en mémoire. Un fragment
+qui enregistre une nouvelle police, une nouvelle image ou un lien n'est pas
+mis en cache : leurs index dans le PDF ne seraient pas les mêmes d'un
+document à l'autre. Il en va de même
+d'un fragment qui utilise un glyphe hors du répertoire réservé d'une police
+Unicode (voir report_fonts) : son code dépend de l'ordre d'apparition.
+
+Configuration : REPORT_FRAGMENT_CACHE_SIZE (nombre de fragments, 0 = désactivé).
+"""
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+from fpdf.enums import PDFResourceType
+
+import metrics
+
+REPORT_FRAGMENT_CACHE_SIZE = int(os.getenv("REPORT_FRAGMENT_CACHE_SIZE", "512"))
+
+# Ressources dont les index sont stables d'un document à l'autre (voir ReportPDF)
+RESSOURCES_REJOUABLES = (PDFResourceType.FONT, PDFResourceType.X_OBJECT)
+
+FRAGMENT_CACHE_TOTAL = metrics.counter(
+    "grandcrux_report_fragment_cache_total", "Sections rejouées depuis le cache ou mises en page", ["resultat"]
+)
+
+Fragment = namedtuple("Fragment", ["contents", "resources", "usages", "state"])
+
+_ABSENT = object()
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def capture_state(pdf):
+    """État du document qui influence la suite de la mise en page."""
+    gs = pdf._get_current_graphics_state()
+    gs["current_font"] = getattr(gs["current_font"], "fontkey", None)
+    return pdf.x, pdf.y, pdf._lasth, gs
+
+
+def state_key(state):
+    x, y, lasth, gs = state
+    return x, y, lasth, _freeze(gs)
+
+
+def restore_state(pdf, state):
+    x, y, lasth, gs = state
+    gs = dict(gs)
+    gs["current_font"] = pdf.fonts[gs["current_font"]] if gs["current_font"] else {}
+    pdf._pop_local_stack()
+    pdf._push_local_stack(gs)
+    pdf.x, pdf.y, pdf._lasth = x, y, lasth
+
+
+def glyph_count(pdf):
+    """Nombre de glyphes dans les sous-ensembles des polices Unicode du document."""
+    return sum(len(font.subset) for font in pdf.fonts.values() if font.type == "TTF")
+
+
+def record(pdf, render, data):
+    """Met en page une section et renvoie son fragment rejouable, ou None."""
+    page0 = pdf.page
+    if not page0:
+        render(pdf, data)
+        return None
+
+    offset = len(pdf.pages[page0].contents)
+    catalog = pdf._resource_catalog.resources_per_page
+    avant = {key: set(ids) for key, ids in catalog.items() if key[0] >= page0}
+    images = pdf.image_cache.images
+    usages = {name: info["usages"] for name, info in images.items()}
+    counts = (len(pdf.fonts), len(images), len(pdf.links), glyph_count(pdf))
+
+    render(pdf, data)
+
+    if (len(pdf.fonts), len(images), len(pdf.links), glyph_count(pdf)) != counts:
+        return None
+
+    resources = []
+    for (page, resource_type), ids in catalog.items():
+        if page < page0:
+            continue
+        nouveaux = ids - avant.get((page, resource_type), set())
+        if not nouveaux:
+            continue
+        if resource_type not in RESSOURCES_REJOUABLES:
+            return None
+        resources.append((page - page0, resource_type, frozenset(nouveaux)))
+
+    contents = [bytes(pdf.pages[page0].contents[offset:])]
+    contents.extend(bytes(pdf.pages[page].contents) for page in range(page0 + 1, pdf.page + 1))
+
+    return Fragment(
+        contents=tuple(contents),
+        resources=tuple(resources),
+        usages=tuple((name, info["usages"] - usages[name]) for name, info in images.items()
+                     if info["usages"] != usages[name]),
+        state=capture_state(pdf),
+    )
+
+
+def replay(pdf, fragment):
+    """Rejoue un fragment à la position courante du document."""
+    pdf.pages[pdf.page].contents += fragment.contents[0]
+    for content in fragment.contents[1:]:
+        pdf.add_page()
+        pdf.pages[pdf.page].contents = bytearray(content)
+
+    page0 = pdf.page - (len(fragment.contents) - 1)
+    catalog = pdf._resource_catalog.resources_per_page
+    for offset, resource_type, ids in fragment.resources:
+        catalog[(page0 + offset, resource_type)].update(ids)
+
+    images = pdf.image_cache.images
+    for name, delta in fragment.usages:
+        images[name]["usages"] += delta
+
+    restore_state(pdf, fragment.state)
+
+
+class FragmentCache:
+    def __init__(self, maxsize=REPORT_FRAGMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, pdf, report_section, data):
+        """Rend `report_section` dans `pdf`, depuis le cache si possible."""
+        if (report_section.inputs is None or self.maxsize <= 0 or not pdf.page
+                or any((data.get(name) or "").strip() for name in report_section.texte_libre)):
+            FRAGMENT_CACHE_TOTAL.inc(resultat="direct")
+            report_section.render(pdf, data)
+            return
+
+        key = (
+            report_section.name,
+            getattr(pdf, "layout", None),
+            # Hauteur des images dessinées : arrondie différemment d'un profil à l'autre
+            getattr(pdf, "size_profile", None),
+            tuple(_freeze(data.get(name, _ABSENT)) for name in report_section.inputs),
+            state_key(capture_state(pdf)),
+        )
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+
+        if fragment is not None:
+            FRAGMENT_CACHE_TOTAL.inc(resultat="cache")
+            replay(pdf, fragment)
+            return
+
+        FRAGMENT_CACHE_TOTAL.inc(resultat="mise_en_page")
+        fragment = record(pdf, report_section.render, data)
+        if fragment is None:
+            return
+        with self._lock:
+            self._fragments[key] = fragment
+            while len(self._fragments) > self.maxsize:
+                self._fragments.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._fragments.clear()
+
+    def __len__(self):
+        return len(self._fragments)
+
+
+FRAGMENT_CACHE = FragmentCache()
@@ -0,0 +1,139 @@
+"""
+Cache de la coupure en lignes des paragraphes du rapport.
+
+Les paragraphes (`ReportPDF.paragraph`) sont pour la plupart des textes fixes
+de report_texts, mis en page avec la même police, la même taille et la même
+largeur d'un rapport à l'autre. Leur découpage en lignes (MultiLineBreak de
+fpdf2 : largeur de chaque caractère, recherche des coupures) est gardé en
+cache, clé (texte, police, taille, largeur, alignement), puis rejoué : seul
+le dessin des lignes est refait dans chaque document, comme le ferait
+`multi_cell`.
+
+Les lignes mises en cache ne gardent que leurs caractères : l'état graphique
+(police du document, couleurs) est celui du document au moment du rendu.
+
+Configuration : REPORT_LINE_CACHE_SIZE (nombre de paragraphes, 0 = désactivé).
+"""
+import os
+import threading
+from collections import OrderedDict
+
+from fpdf.enums import Align, WrapMode, XPos, YPos
+from fpdf.line_break import Fragment, MultiLineBreak, TextLine
+from fpdf.util import Padding
+
+import metrics
+
+REPORT_LINE_CACHE_SIZE = int(os.getenv("REPORT_LINE_CACHE_SIZE", "1024"))
+
+LINE_CACHE_TOTAL = metrics.counter(
+    "grandcrux_report_line_cache_total", "Paragraphes dont la coupure en lignes vient du cache ou est calculée",
+    ["resultat"]
+)
+
+
+def split_lines(pdf, text, w, align):
+    """Coupure en lignes de `text` sur la largeur `w`, comme dans `multi_cell`."""
+    fragments = pdf._preload_font_styles(pdf.normalize_text(text).replace("\r", ""), False)
+    line_break = MultiLineBreak(
+        fragments, w, [pdf.c_margin, pdf.c_margin], align=align, print_sh=False, wrapmode=WrapMode.WORD,
+    )
+    lines = []
+    line = line_break.get_line()
+    while line is not None:
+        lines.append(line)
+        line = line_break.get_line()
+    return lines
+
+
+def render_lines(pdf, lines, h, w, align):
+    """Dessine des lignes déjà coupées : boucle de rendu de `multi_cell` (sans bordure ni marge interne)."""
+    if not lines:
+        lines = [TextLine("", text_width=0, number_of_spaces=0, align=align, height=h, max_width=w, trailing_nl=False)]
+
+    for index, line in enumerate(lines):
+        pdf._perform_page_break_if_need_be(h)
+        dernier = index == len(lines) - 1
+        pdf._render_styled_text_line(
+            line,
+            h=h,
+            new_x=XPos.RIGHT if dernier else XPos.LEFT,
+            new_y=YPos.NEXT,
+            border=0,
+            fill=False,
+            link="",
+            padding=Padding(0, 0, 0, 0),
+            prevent_font_change=False,
+        )
+
+    if lines[-1] and lines[-1].trailing_nl:
+        pdf.ln()
+
+
+def _strip(lines):
+    """Lignes sans état graphique (caractères seulement), ou None si elles ne peuvent pas être rejouées."""
+    stripped = []
+    for line in lines:
+        if any(type(fragment) is not Fragment for fragment in line.fragments):
+            return None
+        stripped.append(line._replace(fragments=tuple(fragment.characters for fragment in line.fragments)))
+    return tuple(stripped)
+
+
+def _bind(pdf, lines):
+    """Lignes du cache rattachées à l'état graphique courant du document."""
+    gs = pdf._get_current_graphics_state()
+    return [
+        line._replace(fragments=tuple(Fragment(characters, gs, pdf.k) for characters in line.fragments))
+        for line in lines
+    ]
+
+
+class LineCache:
+    def __init__(self, maxsize=REPORT_LINE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lines = OrderedDict()
+        self._lock = threading.Lock()
+
+    def multi_cell(self, pdf, h, text, align="L"):
+        """Équivalent de `pdf.multi_cell(0, h, text=text, align=align)`, coupure en lignes depuis le cache."""
+        if self.maxsize <= 0 or pdf.text_shaping or pdf._fallback_font_ids:
+            pdf.multi_cell(0, h, text=text, align=align)
+            return
+
+        align = Align.coerce(align)
+        w = pdf.w - pdf.r_margin - pdf.x
+        key = (
+            text, pdf.current_font.fontkey, pdf.font_size_pt, pdf.font_stretching, pdf.char_spacing,
+            pdf.char_vpos, w, align,
+        )
+        with self._lock:
+            lines = self._lines.get(key)
+            if lines is not None:
+                self._lines.move_to_end(key)
+
+        if lines is not None:
+            LINE_CACHE_TOTAL.inc(resultat="cache")
+            render_lines(pdf, _bind(pdf, lines), h, w, align)
+            return
+
+        LINE_CACHE_TOTAL.inc(resultat="calcul")
+        lines = split_lines(pdf, text, w, align)
+        render_lines(pdf, lines, h, w, align)
+        stripped = _strip(lines)
+        if stripped is None:
+            return
+        with self._lock:
+            self._lines[key] = stripped
+            while len(self._lines) > self.maxsize:
+                self._lines.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._lines.clear()
+
+    def __len__(self):
+        return len(self._lines)
+
+
+LINE_CACHE = LineCache()
@@ -0,0 +1,167 @@
+"""
+Paquet des ressources du rapport, partagé entre les processus d'une machine.
+
+`python report_pack.py` décode une fois les images de static/ (et leurs
+variantes par profil de taille, voir report_assets) et prépare les polices
+(métriques analysées, police réduite au répertoire) dans un seul fichier
+binaire. Chaque processus le projette en mémoire en lecture seule
+(mmap) : ses pages sont partagées par tous les workers via le cache du
+système, et un worker qui démarre n'a plus rien à décoder.
+
+Les flux d'images et de polices restent dans la projection ; fpdf2 n'en reçoit
+une copie qu'au moment de les écrire dans un document. Une entrée dont le
+fichier source a changé depuis la construction (taille ou date) est ignorée :
+la ressource est alors chargée comme sans paquet.
+
+Format : MAGIC, longueur de l'index (8 octets, little-endian), index JSON,
+puis les blocs binaires, référencés dans l'index par [position, longueur]
+(position comptée depuis la fin de l'index).
+
+Configuration : REPORT_ASSET_PACK (chemin du paquet, vide = désactivé).
+
+Usage :
+    python report_pack.py
+    python report_pack.py -o /srv/grandcrux/report_assets.pack
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+
+MAGIC = b"GRANDCRUX-PACK\x01\n"
+LONGUEUR = struct.Struct("<Q")
+
+DEFAULT_PACK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "report_assets.pack")
+REPORT_ASSET_PACK = os.getenv("REPORT_ASSET_PACK", DEFAULT_PACK)
+
+
+def source_stamp(path):
+    """Taille et date de modification du fichier source, enregistrées avec l'entrée."""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class AssetPack:
+    def __init__(self, path=REPORT_ASSET_PACK):
+        self.path = path
+        self._index = None
+        self._view = None
+        self._base = 0
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Projette le paquet en mémoire (une seule fois) ; renvoie son index, vide si absent."""
+        if self._index is not None:
+            return self._index
+
+        with self._lock:
+            if self._index is None:
+                index = {}
+                if self.path and os.path.exists(self.path):
+                    try:
+                        index = self._open()
+                    except (OSError, ValueError) as e:
+                        print(f"⚠️ Paquet de ressources {self.path} ignoré : {e}")
+                self._index = index
+        return self._index
+
+    def _open(self):
+        with open(self.path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapping)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            raise ValueError("format inconnu")
+        start = len(MAGIC) + LONGUEUR.size
+        (longueur,) = LONGUEUR.unpack(view[len(MAGIC):start])
+        index = json.loads(bytes(view[start:start + longueur]))
+        self._view = view
+        self._base = start + longueur
+        return index
+
+    def entry(self, kind, key, source):
+        """Entrée `kind`/`key` du paquet, si elle a été construite depuis `source` inchangé."""
+        entry = self.load().get(kind, {}).get(key)
+        if entry is None or not os.path.exists(source) or entry["source"] != source_stamp(source):
+            return None
+        return entry
+
+    def blob(self, ref):
+        """Vue en lecture seule sur un bloc du paquet (sans copie)."""
+        offset, length = ref
+        offset += self._base
+        return self._view[offset:offset + length]
+
+    def json_blob(self, ref):
+        return json.loads(bytes(self.blob(ref)))
+
+
+ASSET_PACK = AssetPack()
+
+
+class PackWriter:
+    def __init__(self):
+        self.index = {"fonts": {}}
+        self.blobs = []
+        self.size = 0
+
+    def add_blob(self, data):
+        """Ajoute un bloc ; renvoie sa référence [position, longueur]."""
+        ref = [self.size, len(data)]
+        self.blobs.append(bytes(data))
+        self.size += len(data)
+        return ref
+
+    def add_json(self, value):
+        return self.add_blob(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    def write(self, path):
+        """Écrit le paquet dans un fichier temporaire, puis le renomme : les processus
+        qui projettent déjà l'ancien paquet continuent de le lire sans erreur."""
+        index = json.dumps(self.index, separators=(",", ":")).encode("utf-8")
+        tmp = f"{path}.tmp{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(LONGUEUR.pack(len(index)))
+            f.write(index)
+            for blob in self.blobs:
+                f.write(blob)
+        os.replace(tmp, path)
+        return len(MAGIC) + LONGUEUR.size + len(index) + self.size
+
+
+def build_pack(path):
+    """Construit le paquet à partir des fichiers de static/ ; renvoie sa taille en octets."""
+    from report_assets import PROFILS, ImageRegistry
+    from report_fonts import FontRegistry
+
+    writer = PackWriter()
+    images = ImageRegistry(pack=None)
+    for profile in PROFILS:
+        kind = writer.index[f"images/{profile}"] = {}
+        for key, info in images.load(profile).items():
+            entry = images.pack_entry(key, info, writer)
+            if entry is not None:
+                kind[key] = entry
+
+    fonts = FontRegistry(pack=None)
+    for style, loaded in fonts.load().items():
+        writer.index["fonts"][style] = fonts.pack_entry(style, loaded, writer)
+
+    return writer.write(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Construit le paquet des ressources du rapport.")
+    parser.add_argument("-o", "--output", default=REPORT_ASSET_PACK or DEFAULT_PACK, help="fichier du paquet")
+    args = parser.parse_args()
+
+    size = build_pack(args.output)
+    print(f"Paquet de ressources écrit : {args.output} ({size / 1024:.0f} Ko)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Stockage des rapports envoyés et liens de téléchargement signés.
+
+Chaque PDF envoyé est écrit dans le stockage ; la table RapportEnvoye en garde
+la trace (destinataire, langue, date, empreinte), à la place de la copie
+cachée qui doublait chaque envoi par SMTP.
+
+En mode d'envoi `lien` (REPORT_EMAIL_MODE), les PDF ne sont plus joints au
+mail : le client reçoit un lien `/reports/<jeton>` signé qui expire. Le
+téléchargement est servi par morceaux depuis le fichier, avec
+Content-Length, Range et ETag.
+
+Les fichiers sont rangés par contenu (empreinte SHA-256) : un même PDF n'est
+écrit qu'une fois, et son empreinte sert d'ETag.
+
+Configuration :
+    REPORT_STORE_DIR       répertoire des PDF stockés
+    REPORT_LINK_SECRET     clé de signature des liens (obligatoire en mode `lien` ;
+                           sans clé, aucun lien n'est valide)
+    REPORT_LINK_MAX_AGE    durée de validité des liens, en secondes (7 jours)
+    REPORT_BASE_URL        adresse publique de l'application, préfixe des liens
+                           (obligatoire en mode `lien`)
+"""
+import hashlib
+import os
+import re
+
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+REPORT_STORE_DIR = os.getenv(
+    "REPORT_STORE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "instance", "reports")
+)
+REPORT_LINK_SECRET = os.getenv("REPORT_LINK_SECRET", "")
+REPORT_LINK_MAX_AGE = int(os.getenv("REPORT_LINK_MAX_AGE", str(7 * 24 * 3600)))
+REPORT_BASE_URL = os.getenv("REPORT_BASE_URL", "")
+
+EMPREINTE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class ReportStore:
+    def __init__(self, root=REPORT_STORE_DIR):
+        self.root = root
+
+    def path(self, key):
+        """Chemin du PDF d'empreinte `key` (sous-répertoire sur ses deux premiers caractères)."""
+        if not EMPREINTE.match(key):
+            raise ValueError(f"Empreinte invalide : {key}")
+        return os.path.join(self.root, key[:2], f"{key}.pdf")
+
+    def put(self, content):
+        """Stocke un PDF (bytes) ; renvoie son empreinte SHA-256."""
+        key = hashlib.sha256(content).hexdigest()
+        path = self.path(key)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Fichier temporaire puis renommage : un téléchargement ne lit jamais un PDF incomplet
+            tmp = f"{path}.tmp{os.getpid()}"
+            with open(tmp, "wb") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        return key
+
+    def exists(self, key):
+        return os.path.exists(self.path(key))
+
+    def get(self, key):
+        """Octets du PDF d'empreinte `key` (rapport archivé)."""
+        with open(self.path(key), "rb") as f:
+            return f.read()
+
+
+class ReportLinks:
+    def __init__(self, secret=REPORT_LINK_SECRET, max_age=REPORT_LINK_MAX_AGE, base_url=REPORT_BASE_URL):
+        self.secret = secret
+        self.max_age = max_age
+        self.base_url = base_url.rstrip("/")
+
+    def check(self):
+        """Vérifie au démarrage la configuration nécessaire aux liens (mode `lien`)."""
+        manquants = [nom for nom, valeur in (("REPORT_LINK_SECRET", self.secret), ("REPORT_BASE_URL", self.base_url))
+                     if not valeur]
+        if manquants:
+            raise RuntimeError(f"Mode d'envoi `lien` : {', '.join(manquants)} à configurer")
+
+    def _serializer(self):
+        if not self.secret:
+            raise RuntimeError("REPORT_LINK_SECRET n'est pas configuré : liens de téléchargement indisponibles")
+        return URLSafeTimedSerializer(self.secret, salt="grandcrux-report")
+
+    def sign(self, key, filename):
+        """Jeton signé désignant le PDF `key`, téléchargé sous le nom `filename`."""
+        return self._serializer().dumps({"k": key, "f": filename})
+
+    def url(self, key, filename):
+        return f"{self.base_url}/reports/{self.sign(key, filename)}"
+
+    def verify(self, token):
+        """
+        (empreinte, nom de fichier) d'un jeton valide. Lève SignatureExpired si
+        le lien a expiré, BadSignature s'il est invalide (ou si les liens ne
+        sont pas configurés).
+        """
+        if not self.secret:
+            raise BadSignature("Liens de téléchargement non configurés")
+        payload = self._serializer().loads(token, max_age=self.max_age)
+        if not isinstance(payload, dict) or not EMPREINTE.match(str(payload.get("k", ""))):
+            raise BadSignature("Contenu du jeton invalide")
+        return payload["k"], payload.get("f") or f"{payload['k']}.pdf"
+
+
+REPORT_STORE = ReportStore()
+REPORT_LINKS = ReportLinks()
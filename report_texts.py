@@ -0,0 +1,1626 @@
+"""
+Textes multilingues (FR / EN / NL) du rapport personnalisé.
+
+Les tables sont construites une seule fois à l'import du module et
+partagées par tous les rendus de `report.generate_pdf` et
+`report.generate_print_pdf`.
+"""
+
+# === Page de titre ===
+TITRES_RAPPORT = {
+    "fr": "Rapport personnalisé sur le vin\n{prenom} {nom}",
+    "en": "Personalized Wine Report\n{prenom} {nom}",
+    "nl": "Gepersonaliseerd wijnrapport\n{prenom} {nom}"
+}
+
+# === Introduction ===
+TITRES_INTRODUCTION = {
+    "fr": "Introduction",
+    "en": "Introduction",
+    "nl": "Inleiding"
+}
+
+TEXTES_INTRODUCTION = {
+    "fr": (
+        "Chez GrandcruX, nous pensons que chaque amateur de vin possède ses propres préférences, "
+        "ses convictions et sa manière d'appréhender le plaisir comme la valeur d'une bouteille. "
+        "Avant chaque achat ou investissement, il est essentiel de s'informer, de comprendre les "
+        "enjeux et les opportunités qu'offre cet univers unique. "
+        "\n\nCe document n'a pas vocation à fournir de conseils en matière financière ou juridique. "
+        "Il s'agit avant tout d'une présentation personnalisée visant à vous informer et à nourrir "
+        "votre réflexion, afin de faire de votre passion pour le vin une démarche éclairée et durable."
+    ),
+    "en": (
+        "At GrandcruX, we believe that every wine enthusiast has their own preferences, "
+        "convictions, and way of appreciating both the pleasure and the value of a bottle. "
+        "Before any purchase or investment, it is essential to stay informed, to understand "
+        "the challenges and opportunities offered by this unique world. "
+        "\n\nThis document is not intended to provide financial or legal advice. "
+        "It is above all a personalized presentation designed to inform and inspire you, "
+        "so that your passion for wine becomes an enlightened and sustainable pursuit."
+    ),
+    "nl": (
+        "Bij GrandcruX geloven wij dat elke wijnliefhebber zijn eigen voorkeuren, "
+        "overtuigingen en manier heeft om het plezier en de waarde van een fles te benaderen. "
+        "Voor elke aankoop of investering is het essentieel om zich goed te informeren, "
+        "de uitdagingen en kansen van deze unieke wereld te begrijpen. "
+        "\n\nDit document is niet bedoeld als financieel of juridisch advies. "
+        "Het is bovenal een persoonlijke voorstelling die u wil informeren en inspireren, "
+        "zodat uw passie voor wijn een doordachte en duurzame benadering wordt."
+    )
+}
+
+# === Votre rapport au vin ===
+TITRES_RAPPORT_VIN = {
+    "fr": "Votre rapport au vin et à son patrimoine",
+    "en": "Your Relationship with Wine and Heritage",
+    "nl": "Uw relatie met wijn en erfgoed"
+}
+
+PHRASES_PROFIL = {
+    "fr": "Nous avons noté que vous êtes {connaissance} et que votre relation principale au vin est orientée vers {relation}.",
+    "en": "We noted that you are {connaissance} and that your main relationship to wine is focused on {relation}.",
+    "nl": "We hebben genoteerd dat u {connaissance} bent en dat uw belangrijkste relatie met wijn gericht is op {relation}."
+}
+
+# Texte selon le niveau de connaissance
+TEXTES_CONNAISSANCE = {
+    "fr": {
+        "debutant": (
+            "Votre intérêt pour le vin constitue un excellent point de départ. "
+            "Le monde du vin est vaste et passionnant : apprendre à distinguer les régions, les millésimes et les styles "
+            "est une démarche enrichissante qui peut se vivre à travers la dégustation, la lecture ou la visite de domaines."
+        ),
+        "amateur": (
+            "Votre profil d’amateur éclairé traduit une curiosité solide pour le vin. "
+            "Approfondir vos connaissances sur les producteurs, les terroirs et les millésimes vous permettra d’affiner votre sélection "
+            "et de renforcer la dimension plaisir et culturelle de votre cave."
+        ),
+        "connaisseur": (
+            "Votre profil de connaisseur(se) ou collectionneur(se) révèle une approche experte du vin. "
+            "Vous êtes sans doute attentif(ve) à la provenance, à la conservation et à la rareté, des éléments essentiels pour préserver "
+            "la valeur culturelle et potentielle de vos bouteilles dans le temps."
+        ),
+        "professionnel": (
+            "Votre profil de professionnel(le) du vin implique une compréhension approfondie du marché. "
+            "Votre expérience vous permet d’envisager le vin comme un univers à la fois économique, sensoriel et culturel. "
+            "Ce document vise avant tout à compléter cette expertise par une perspective patrimoniale."
+        ),
+        "autre": (
+            "Votre rapport au vin témoigne d’un intérêt authentique pour cet univers de passion et de transmission. "
+            "Chaque approche du vin est unique, qu’elle soit gustative, culturelle ou patrimoniale."
+        ),
+    },
+    "en": {
+        "debutant": (
+            "Your interest in wine is an excellent starting point. "
+            "The world of wine is vast and fascinating: learning to distinguish regions, vintages, and styles "
+            "is a rewarding journey that can be experienced through tasting, reading, and visiting estates."
+        ),
+        "amateur": (
+            "Your profile as an informed wine enthusiast shows a strong curiosity. "
+            "Deepening your knowledge of producers, terroirs, and vintages will refine your selections "
+            "and strengthen the pleasure and cultural dimension of your cellar."
+        ),
+        "connaisseur": (
+            "Your profile as a connoisseur or collector reflects an expert approach to wine. "
+            "You are likely attentive to provenance, storage, and rarity — key aspects for preserving "
+            "the cultural and potential value of your bottles over time."
+        ),
+        "professionnel": (
+            "Your profile as a wine professional implies a deep understanding of the market. "
+            "Your experience allows you to see wine as both an economic, sensory, and cultural universe. "
+            "This document aims to complement that expertise with a patrimonial perspective."
+        ),
+        "autre": (
+            "Your relationship with wine reflects a genuine interest in this world of passion and heritage. "
+            "Each approach to wine is unique — gustatory, cultural, or patrimonial."
+        ),
+    },
+    "nl": {
+        "debutant": (
+            "Uw interesse in wijn vormt een uitstekend vertrekpunt. "
+            "De wijnwereld is rijk en boeiend: het leren onderscheiden van regio’s, jaargangen en stijlen "
+            "is een verrijkende ervaring die men kan beleven via proeverijen, lectuur of bezoeken aan wijnhuizen."
+        ),
+        "amateur": (
+            "Uw profiel als goed geïnformeerde wijnliefhebber toont een sterke nieuwsgierigheid. "
+            "Door uw kennis van producenten, terroirs en jaargangen te verdiepen, kunt u uw keuzes verfijnen "
+            "en het plezier en de culturele dimensie van uw kelder versterken."
+        ),
+        "connaisseur": (
+            "Uw profiel als kenner of verzamelaar weerspiegelt een deskundige benadering van wijn. "
+            "U hecht waarschijnlijk belang aan herkomst, bewaring en zeldzaamheid — essentiële elementen "
+            "voor het behoud van de culturele en potentiële waarde van uw flessen op lange termijn."
+        ),
+        "professionnel": (
+            "Uw profiel als wijnprofessional impliceert een grondig begrip van de markt. "
+            "Uw ervaring laat u toe wijn te benaderen als zowel een economisch, zintuiglijk als cultureel universum. "
+            "Dit document wil die expertise aanvullen met een patrimoniale invalshoek."
+        ),
+        "autre": (
+            "Uw relatie tot wijn getuigt van een oprechte belangstelling voor deze wereld van passie en overdracht. "
+            "Elke benadering van wijn is uniek, of ze nu smaakgericht, cultureel of patrimoniaal is."
+        ),
+    }
+}
+
+# Texte selon la relation au vin
+TEXTES_RELATION = {
+    "fr": {
+        "consommation": (
+            "Le vin reste avant tout un produit de plaisir et de convivialité. "
+            "L’apprécier dans un cadre personnel ou familial fait partie intégrante de son essence culturelle. "
+            "Choisir, déguster et conserver le vin permettent de tisser un lien vivant avec le patrimoine et les traditions viticoles."
+        ),
+        "investissement": (
+            "Vous semblez envisager le vin comme un placement. "
+            "Il convient toutefois de rappeler que le vin n’est pas un produit financier mais un bien tangible dont la valeur dépend de nombreux facteurs : "
+            "millésime, conservation, rareté, notoriété du domaine et conditions de marché. "
+            "Les informations fournies ici sont d’ordre général et ne constituent en aucun cas une recommandation en matière d’investissement."
+        ),
+        "les_deux": (
+            "Vous associez à la fois plaisir et approche patrimoniale dans votre rapport au vin. "
+            "C’est une vision équilibrée, à condition de toujours garder à l’esprit que le vin reste avant tout un produit de passion. "
+            "Toute considération financière doit être envisagée avec prudence, en tenant compte des aléas du marché et des conditions de conservation. "
+            "Les éléments présentés dans ce document n’ont pas vocation à constituer un conseil en investissement."
+        ),
+        "autre": (
+            "Votre lien au vin illustre une approche personnelle et sincère, ancrée dans la découverte et le plaisir. "
+            "Chaque bouteille représente une expérience unique et un fragment de patrimoine vivant."
+        ),
+    },
+    "en": {
+        "consommation": (
+            "Wine is above all a product of pleasure and conviviality. "
+            "Enjoying it in a personal or family setting is part of its cultural essence. "
+            "Choosing, tasting, and storing wine creates a living connection to heritage and tradition."
+        ),
+        "investissement": (
+            "You seem to consider wine as an investment. "
+            "It should be remembered, however, that wine is not a financial product but a tangible good whose value depends on many factors: "
+            "vintage, storage, rarity, reputation of the estate, and market conditions. "
+            "The information provided here is general and should not be taken as investment advice."
+        ),
+        "les_deux": (
+            "You combine both pleasure and patrimonial perspective in your approach to wine. "
+            "This is a balanced vision, provided you keep in mind that wine remains first and foremost a product of passion. "
+            "Any financial consideration must be approached with prudence, taking into account market fluctuations and storage conditions. "
+            "The information presented here does not constitute investment advice."
+        ),
+        "autre": (
+            "Your connection to wine reflects a sincere and personal approach rooted in discovery and pleasure. "
+            "Each bottle represents a unique experience and a living piece of heritage."
+        ),
+    },
+    "nl": {
+        "consommation": (
+            "Wijn is bovenal een product van plezier en gezelligheid. "
+            "Het waarderen ervan in een persoonlijke of familiale context maakt deel uit van zijn culturele essentie. "
+            "Het kiezen, proeven en bewaren van wijn schept een levendige band met het erfgoed en de tradities van de wijnbouw."
+        ),
+        "investissement": (
+            "U lijkt wijn te beschouwen als een vorm van investering. "
+            "Het is echter belangrijk te onthouden dat wijn geen financieel product is, maar een tastbaar goed waarvan de waarde afhangt van vele factoren: "
+            "jaargang, bewaring, zeldzaamheid, reputatie van het domein en marktomstandigheden. "
+            "De hier verstrekte informatie is algemeen en vormt op geen enkele manier beleggingsadvies."
+        ),
+        "les_deux": (
+            "U combineert plezier en een patrimoniale benadering in uw relatie tot wijn. "
+            "Dat is een evenwichtige visie, op voorwaarde dat men niet vergeet dat wijn in de eerste plaats een product van passie blijft. "
+            "Elke financiële overweging moet met voorzichtigheid worden bekeken, rekening houdend met markt- en bewaaromstandigheden. "
+            "De informatie in dit document is louter informatief en vormt geen beleggingsadvies."
+        ),
+        "autre": (
+            "Uw band met wijn weerspiegelt een persoonlijke en oprechte benadering, geworteld in ontdekking en plezier. "
+            "Elke fles vertegenwoordigt een unieke ervaring en een levend stuk cultureel erfgoed."
+        ),
+    }
+}
+
+# === Région viticole préférée ===
+PHRASES_REGION = {
+    "fr": "Vous avez exprimé une préférence pour la région viticole suivante : {region}.",
+    "en": "You have expressed a preference for the following wine region: {region}.",
+    "nl": "U hebt een voorkeur aangegeven voor de volgende wijnregio: {region}."
+}
+
+# Phrase spécifique lorsque la région choisie est « autre »
+PHRASES_REGION_AUTRE = {
+    "fr": (
+        "Vous avez indiqué ne pas avoir de préférence particulière pour une région viticole. "
+        "Cela peut être une excellente occasion d’explorer plusieurs horizons et de recevoir des conseils personnalisés "
+        "selon vos goûts et objectifs."
+    ),
+    "en": (
+        "You mentioned not having a specific preference for any wine region. "
+        "This can be a great opportunity to explore various options and receive personalized guidance "
+        "based on your tastes and goals."
+    ),
+    "nl": (
+        "U hebt aangegeven geen specifieke voorkeur te hebben voor een wijnregio. "
+        "Dit biedt een mooie gelegenheid om verschillende horizonten te verkennen en persoonlijk advies te ontvangen "
+        "volgens uw smaak en doelstellingen."
+    )
+}
+
+# Texte selon la région
+TEXTES_REGION = {
+    "fr": {
+        "bordeaux": (
+            "La région de Bordeaux est une référence mondiale, connue pour ses grands crus classés et son équilibre entre puissance et élégance. "
+            "C’est une excellente approche pour comprendre la notion de terroir et de longévité des vins.\n\n"
+            "Posez-vous la question : préférez-vous les vins de la rive gauche (Cabernet Sauvignon, Médoc) ou de la rive droite (Merlot, Saint-Émilion) ?\n\n"
+            "Quelques noms emblématiques : Château Margaux, Lafite Rothschild, Pétrus, Cheval Blanc."
+        ),
+        "bourgogne": (
+            "La Bourgogne séduit par son raffinement et sa complexité. C’est une région de vignerons, où chaque parcelle raconte une histoire. "
+            "S’intéresser à la Bourgogne, c’est explorer la subtilité des climats et l’expression du Pinot Noir et du Chardonnay.\n\n"
+            "Posez-vous la question : préférez-vous les rouges structurés (Côte de Nuits) ou les blancs prestigieux (Côte de Beaune) ? \n\n"
+            "Quelques noms : Romanée-Conti, Meursault, Puligny-Montrachet, Chambertin."
+        ),
+        "vallee_du_rhone": (
+            "La Vallée du Rhône offre des vins généreux, solaires et puissants. "
+            "Du nord (Côte-Rôtie, Hermitage) au sud (Châteauneuf-du-Pape), la diversité y est remarquable.\n\n"
+            "Posez-vous la question : recherchez-vous des vins à forte identité (Syrah) ou plus épicés et ronds (Grenache, Mourvèdre) ?\n\n"
+            "Quelques domaines réputés : E. Guigal, Chapoutier, Château de Beaucastel."
+        ),
+        "loire": (
+            "La Loire est un fleuve de fraîcheur et de diversité : rouges, blancs, rosés ou effervescents, elle a tout pour plaire. "
+            "C’est une région idéale pour les amateurs de vins digestes et francs.\n\n"
+            "Posez-vous la question : êtes-vous plutôt Sauvignon (Sancerre, Pouilly-Fumé) ou Chenin (Vouvray, Anjou) ?\n\n"
+            "Quelques producteurs : Didier Dagueneau, Huet, Domaine des Roches Neuves."
+        ),
+        "champagne": (
+            "Le Champagne allie tradition et prestige. Derrière les bulles se cache un savoir-faire exceptionnel. "
+            "S’intéresser au Champagne, c’est comprendre l’art de l’assemblage et la patience du vieillissement.\n\n"
+            "Posez-vous la question : préférez-vous les grandes maisons (Dom Pérignon, Bollinger) ou les vignerons indépendants (Jacques Selosse, Egly-Ouriet) ?"
+        ),
+        "alsace": (
+            "L’Alsace séduit par ses vins aromatiques et précis. Riesling, Gewurztraminer, Pinot Gris… chaque cépage y révèle sa pureté. "
+            "Posez-vous la question : aimez-vous les vins secs et tendus, ou plus riches et exotiques ? \n\n"
+            "Quelques domaines : Trimbach, Zind-Humbrecht, Weinbach.\n\n"
+        ),
+        "provence": (
+            "La Provence évoque la douceur du Sud et la convivialité. Si ses rosés sont célèbres, ses rouges et blancs gagnent aussi en noblesse.\n\n"
+            "Posez-vous la question : cherchez-vous un vin d’été ou un vin de gastronomie ? \n\n"
+            "Quelques domaines : Domaine Tempier, Château d’Esclans, Minuty, Ott."
+        ),
+        "italie": (
+            "L’Italie est un continent viticole à elle seule, avec des vins de caractère et d’identité. "
+            "Du Piémont (Barolo, Barbaresco) à la Toscane (Brunello, Chianti, Super Toscans), la diversité est immense.\n\n"
+            "Posez-vous la question : aimez-vous les vins puissants et tanniques, ou plus élégants et floraux ? \n\n"
+            "Quelques icônes : Gaja, Antinori, Sassicaia, Ornellaia."
+        ),
+        "espagne": (
+            "L’Espagne combine tradition et renouveau, avec des terroirs remarquables. "
+            "Du Rioja à la Ribera del Duero, les Tempranillo offrent puissance et velours. \n\n"
+            "Posez-vous la question : recherchez-vous un vin boisé et intense, ou plus moderne et fruité ? \n\n"
+            "Quelques domaines : Vega Sicilia, Alvaro Palacios, La Rioja Alta."
+        ),
+        "portugal": (
+            "Le Portugal, longtemps discret, séduit aujourd’hui par son authenticité. "
+            "Au-delà des vins de Porto, on y trouve de grands rouges du Douro et de l’Alentejo. \n\n"
+            "Posez-vous la question : préférez-vous la tradition des vins mutés ou la modernité des vins tranquilles ? \n\n"
+            "Quelques références : Niepoort, Quinta do Noval, Esporão."
+        ),
+        "nouveau_monde": (
+            "Les vins du Nouveau Monde incarnent la modernité et la liberté de style : Chili, Argentine, Australie, Californie, Nouvelle-Zélande... \n\n"
+            "Posez-vous la question : préférez-vous la puissance du soleil ou la fraîcheur du fruit ? \n\n"
+            "Quelques producteurs emblématiques : Penfolds (Australie), Catena Zapata (Argentine), Opus One (États-Unis)."
+        ),
+        "autre": (
+            "Chaque région du monde offre ses trésors et ses particularités. \n\n"
+            "Il existe de nombreuses options passionnantes selon vos goûts et vos objectifs. \n\n"
+            "N’hésitez pas à nous contacter pour en discuter avec un conseiller GrandcruX : nous serons ravis de vous orienter vers les meilleures découvertes."
+        ),
+    },
+
+    # 🇬🇧 ENGLISH VERSION
+    "en": {
+        "bordeaux": (
+            "The Bordeaux region is a global benchmark, known for its classified growths and balance between power and elegance. "
+            "It’s ideal for understanding the notion of terroir and wine longevity. \n\n"
+            "Ask yourself: do you prefer Left Bank wines (Cabernet Sauvignon, Médoc) or Right Bank (Merlot, Saint-Émilion)? \n\n"
+            "Notable names include Château Margaux, Lafite Rothschild, Pétrus, Cheval Blanc."
+        ),
+        "bourgogne": (
+            "Burgundy seduces with its refinement and complexity. It’s a region of growers where every parcel tells a story. "
+            "Exploring Burgundy means discovering the subtleties of terroir through Pinot Noir and Chardonnay. \n\n"
+            "Ask yourself: do you prefer structured reds (Côte de Nuits) or prestigious whites (Côte de Beaune)? \n\n"
+            "Icons include Romanée-Conti, Meursault, Puligny-Montrachet, Chambertin."
+        ),
+        "vallee_du_rhone": (
+            "The Rhône Valley offers generous, sun-filled, and powerful wines. "
+            "From the north (Côte-Rôtie, Hermitage) to the south (Châteauneuf-du-Pape), diversity abounds. \n\n"
+            "Ask yourself: do you prefer Syrah’s character or the round, spicy blends of Grenache and Mourvèdre? \n\n"
+            "Renowned estates: E. Guigal, Chapoutier, Château de Beaucastel."
+        ),
+        "loire": (
+            "The Loire embodies freshness and diversity: reds, whites, rosés, and sparkling wines. "
+            "It’s perfect for those who love bright, lively wines. \n\n"
+            "Ask yourself: Sauvignon (Sancerre, Pouilly-Fumé) or Chenin (Vouvray, Anjou)? \n\n"
+            "Recommended producers: Didier Dagueneau, Huet, Domaine des Roches Neuves."
+        ),
+        "champagne": (
+            "Champagne combines prestige and tradition. Behind the bubbles lies centuries of craftsmanship. \n\n"
+            "Ask yourself: do you prefer great houses (Dom Pérignon, Bollinger) or grower champagnes (Jacques Selosse, Egly-Ouriet)?"
+        ),
+        "alsace": (
+            "Alsace shines through its aromatic and precise wines — Riesling, Gewurztraminer, Pinot Gris. \n\n"
+            "Ask yourself: do you enjoy dry, crisp wines or richer, exotic ones? \n\n"
+            "Key estates: Trimbach, Zind-Humbrecht, Weinbach."
+        ),
+        "provence": (
+            "Provence evokes warmth and conviviality. Known for its rosés, it also produces elegant reds and whites. \n\n"
+            "Ask yourself: do you seek a summer wine or a gastronomic one? \n\n"
+            "Top names: Domaine Tempier, Château d’Esclans, Minuty, Ott."
+        ),
+        "italie": (
+            "Italy is a world of wine on its own, full of diversity and soul. "
+            "From Piedmont (Barolo, Barbaresco) to Tuscany (Brunello, Chianti, Super Tuscans), the range is immense. \n\n"
+            "Ask yourself: powerful and tannic, or floral and refined? \n\n"
+            "Famous producers: Gaja, Antinori, Sassicaia, Ornellaia."
+        ),
+        "espagne": (
+            "Spain blends tradition and innovation. From Rioja to Ribera del Duero, Tempranillo expresses depth and elegance. \n\n"
+            "Ask yourself: do you prefer classic, oaky wines or modern, fruit-forward styles? \n\n"
+            "Key producers: Vega Sicilia, Alvaro Palacios, La Rioja Alta."
+        ),
+        "portugal": (
+            "Portugal’s charm lies in its authenticity. Beyond Port, great red wines from Douro and Alentejo deserve attention. \n\n"
+            "Ask yourself: fortified heritage or modern still wines? \n\n"
+            "Recommended estates: Niepoort, Quinta do Noval, Esporão."
+        ),
+        "nouveau_monde": (
+            "The New World represents modernity and creativity — from Chile and Argentina to Australia and California. \n\n"
+            "Ask yourself: do you prefer power or fruit freshness? \n\n"
+            "Notable producers: Penfolds, Catena Zapata, Opus One."
+        ),
+        "autre": (
+            "Every region has its hidden gems and stories. \n\n"
+            "There are many fascinating possibilities depending on your tastes and goals. \n\n"
+            "Do not hesitate to contact a GrandcruX advisor for a personalized discussion."
+        ),
+    },
+
+    # 🇳🇱 DUTCH VERSION
+    "nl": {
+        "bordeaux": (
+            "De Bordeauxstreek is een wereldwijde referentie, bekend om haar geclassificeerde wijnen en haar balans tussen kracht en elegantie. "
+            "Het is een ideale regio om het begrip terroir en de lange levensduur van wijn te begrijpen. \n\n"
+            "Stel uzelf de vraag: geeft u de voorkeur aan de linkeroever (Cabernet Sauvignon, Médoc) of de rechteroever (Merlot, Saint-Émilion)? \n\n"
+            "Enkele iconen: Château Margaux, Lafite Rothschild, Pétrus, Cheval Blanc."
+        ),
+        "bourgogne": (
+            "Bourgogne verleidt door haar verfijning en complexiteit. "
+            "Elke wijngaard vertelt er zijn eigen verhaal, met Pinot Noir en Chardonnay als hoofdrolspelers. \n\n"
+            "Stel uzelf de vraag: houdt u van gestructureerde rode wijnen (Côte de Nuits) of prestigieuze witte (Côte de Beaune)? \n\n"
+            "Enkele referenties: Romanée-Conti, Meursault, Puligny-Montrachet, Chambertin."
+        ),
+        "vallee_du_rhone": (
+            "De Rhônevallei biedt genereuze, zonnige en krachtige wijnen. "
+            "Van het noorden (Côte-Rôtie, Hermitage) tot het zuiden (Châteauneuf-du-Pape) is de diversiteit indrukwekkend. \n\n"
+            "Stel uzelf de vraag: verkiest u de kracht van Syrah of de kruidige rondheid van Grenache en Mourvèdre? \n\n"
+            "Bekende domeinen: E. Guigal, Chapoutier, Château de Beaucastel."
+        ),
+        "loire": (
+            "De Loire staat voor frisheid en diversiteit: rood, wit, rosé en mousserend. "
+            "Ideaal voor wie houdt van levendige, evenwichtige wijnen. \n\n"
+            "Stel uzelf de vraag: Sauvignon (Sancerre, Pouilly-Fumé) of Chenin (Vouvray, Anjou)? \n\n"
+            "Aanbevolen producenten: Didier Dagueneau, Huet, Domaine des Roches Neuves."
+        ),
+        "champagne": (
+            "Champagne verenigt prestige en traditie. Achter de bubbels schuilt een eeuwenoud vakmanschap. \n\n"
+            "Stel uzelf de vraag: verkiest u de grote huizen (Dom Pérignon, Bollinger) of onafhankelijke wijnmakers (Jacques Selosse, Egly-Ouriet)?"
+        ),
+        "alsace": (
+            "De Elzas betovert met haar aromatische precisie. Riesling, Gewurztraminer, Pinot Gris – elk druivenras drukt zijn eigen karakter uit. \n\n"
+            "Stel uzelf de vraag: houdt u van droge, frisse wijnen of eerder van rijke en exotische stijlen? \n\n"
+            "Referenties: Trimbach, Zind-Humbrecht, Weinbach."
+        ),
+        "provence": (
+            "De Provence roept de sfeer van het Zuiden en gezelligheid op. "
+            "Naast rosé produceert men er ook steeds vaker nobele rode en witte wijnen. \n\n"
+            "Stel uzelf de vraag: zoekt u een zomerwijn of een gastronomische wijn? \n\n"
+            "Domeinen: Domaine Tempier, Château d’Esclans, Minuty, Ott."
+        ),
+        "italie": (
+            "Italië is een wijncontinent op zich, vol diversiteit en karakter. "
+            "Van Piemonte (Barolo, Barbaresco) tot Toscane (Brunello, Chianti, Super Tuscans) is de variatie enorm. \n\n"
+            "Stel uzelf de vraag: krachtig en tanninerijk of elegant en bloemig? \n\n"
+            "Enkele iconen: Gaja, Antinori, Sassicaia, Ornellaia."
+        ),
+        "espagne": (
+            "Spanje combineert traditie met vernieuwing. "
+            "Van Rioja tot Ribera del Duero brengt de Tempranillo kracht en fluweelzachtheid samen. \n\n"
+            "Stel uzelf de vraag: houdt u van klassieke houtgerijpte wijnen of moderne fruitige stijlen? \n\n"
+            "Bekende namen: Vega Sicilia, Alvaro Palacios, La Rioja Alta."
+        ),
+        "portugal": (
+            "Portugal charmeert door zijn authenticiteit. "
+            "Naast de beroemde portwijnen biedt het Douro- en Alentejo-gebied uitstekende rode wijnen. \n\n"
+            "Stel uzelf de vraag: houdt u van versterkte wijnen of moderne stille wijnen? \n\n"
+            "Aanbevolen producenten: Niepoort, Quinta do Noval, Esporão."
+        ),
+        "nouveau_monde": (
+            "De Nieuwe Wereld staat voor moderne expressie en vrijheid: Chili, Argentinië, Australië, Californië, Nieuw-Zeeland. \n\n"
+            "Stel uzelf de vraag: verkiest u kracht of fruitige frisheid? \n\n"
+            "Referenties: Penfolds, Catena Zapata, Opus One."
+        ),
+        "autre": (
+            "Elke wijnregio ter wereld biedt haar eigen rijkdommen en verrassingen. \n\n"
+            "Er bestaan talloze boeiende mogelijkheden, afhankelijk van uw smaak en doelstellingen. \n\n"
+            "Aarzel niet om contact op te nemen met een GrandcruX-adviseur om samen de beste opties te ontdekken."
+        ),
+    }
+}
+
+# === Le vin comme outil de diversification ===
+TITRES_DIVERSIFICATION = {
+    "fr": "Le vin comme outil de diversification",
+    "en": "Wine as a Tool for Diversification",
+    "nl": "Wijn als middel tot diversificatie"
+}
+
+# Texte selon le budget annuel
+TEXTES_BUDGET = {
+    "fr": {
+        "moins_500": (
+            "Nous notons que vous consacrez un budget inférieur à 500 EUR par an au vin. "
+            "Ce choix témoigne d’une approche mesurée et axée sur le plaisir simple, sans excès ni contrainte."
+        ),
+        "500_2000": (
+            "Nous notons que vous consacrez un budget compris entre 500 EUR et 2 000 EUR par an au vin. "
+            "Un équilibre appréciable entre plaisir et curiosité, permettant d’explorer de belles appellations tout en gardant la maîtrise de votre budget."
+        ),
+        "2000_10000": (
+            "Nous notons que vous consacrez un budget compris entre 2 000 EUR et 10 000 EUR par an au vin. "
+            "Ce niveau reflète un véritable engagement et une passion affirmée, mêlant plaisir, découverte et valorisation du patrimoine."
+        ),
+        "plus_10000": (
+            "Nous notons que vous consacrez un budget supérieur à 10 000 EUR par an au vin. "
+            "Une telle enveloppe témoigne d’un intérêt profond, voire d’une approche patrimoniale ou collectionneuse du vin."
+        ),
+        "explication": (
+            "Nous vous invitons à un petit exercice personnel : déterminer à quel pourcentage ou fréquence vous trouvez votre satisfaction dans le vin. "
+            "Si votre rapport au vin est avant tout lié à la consommation, il peut être intéressant de ressentir votre « pourcentage plaisir » — quitte, si la passion évolue, à déployer le budget en conséquence. \n\n"
+            "Si votre approche s’oriente davantage vers l’investissement, nous ne fournissons pas de conseil en investissement, "
+            "mais le cadre général du graphique ci-dessous pourrait vous aider à visualiser une répartition équilibrée. "
+            "Le vin peut ainsi être envisagé comme un placement alternatif, au même titre que des oeuvres d’art, des voitures de collection ou des montres d’exception. "
+
+        )
+    },
+    "en": {
+        "moins_500": (
+            "We note that you dedicate a yearly wine budget below EUR500. "
+            "This suggests a measured approach focused on enjoyment and simplicity."
+        ),
+        "500_2000": (
+            "We note that you dedicate a yearly wine budget between EUR500 and EUR2,000. "
+            "A balanced level allowing you to explore interesting appellations while keeping spending under control."
+        ),
+        "2000_10000": (
+            "We note that you dedicate a yearly wine budget between EUR2,000 and EUR10,000. "
+            "This reflects a genuine enthusiasm and passion, combining pleasure, discovery, and heritage value."
+        ),
+        "plus_10000": (
+            "We note that you dedicate a yearly wine budget above EUR10,000. "
+            "Such a commitment reflects a deep passion or a collector’s mindset regarding fine wine."
+        ),
+        "explication": (
+            "We invite you to a brief personal exercise: consider at what percentage or frequency you find your satisfaction in wine. "
+            "If your relationship with wine is primarily about consumption, it may be interesting to sense your 'pleasure ratio' — and, as your passion grows, adjust your budget accordingly. \n\n"
+            "If your focus leans more toward investment, please note that we do not provide investment advice; however, "
+            "the general framework shown in the chart below may help you visualize a balanced proportion. "
+            "Wine can thus be seen as an alternative asset, much like art, collectible cars, or fine watches. "
+
+        )
+    },
+    "nl": {
+        "moins_500": (
+            "We merken op dat u een jaarlijks wijnbudget van minder dan EUR500 voorziet. "
+            "Dit wijst op een nuchtere benadering die draait om eenvoudig genot en ontdekking."
+        ),
+        "500_2000": (
+            "We merken op dat u een jaarlijks wijnbudget tussen EUR500 en EUR2.000 voorziet. "
+            "Een mooi evenwicht tussen plezier en nieuwsgierigheid, waarmee u interessante wijnen kunt ontdekken binnen een beheersbaar budget."
+        ),
+        "2000_10000": (
+            "We merken op dat u een jaarlijks wijnbudget tussen EUR2.000 en EUR10.000 voorziet. "
+            "Dit toont een oprechte passie en betrokkenheid bij wijn, waarbij genot en waardebehoud samengaan."
+        ),
+        "plus_10000": (
+            "We merken op dat u een jaarlijks wijnbudget van meer dan EUR10.000 voorziet. "
+            "Dat getuigt van een diepe interesse of zelfs een verzamelaarshouding ten opzichte van fijne wijn."
+        ),
+        "explication": (
+            "Wij nodigen u uit om even stil te staan bij de vraag in welke mate of frequentie wijn u voldoening schenkt. "
+            "Indien uw relatie met wijn vooral betrekking heeft op consumptie, kan het interessant zijn om uw ‘plezierpercentage’ te voelen — en, naarmate de passie groeit, uw budget daarop af te stemmen. \n\n"
+            "Indien u wijn eerder als investering ziet, geven wij geen beleggingsadvies, maar het algemene kader in de onderstaande grafiek kan u helpen een evenwichtige verdeling te visualiseren. "
+            "Wijn kan in dat geval worden beschouwd als een alternatief beleggingsmiddel, vergelijkbaar met kunstwerken, oldtimers of luxehorloges. "
+        )
+    }
+}
+
+# Mention sous le graphique de répartition
+MENTIONS_INVESTISSEMENT = {
+    "fr": "ATTENTION : Ceci ne constitue pas un conseil en investissement.",
+    "en": "ATTENTION:  This does not constitute investment advice.",
+    "nl": "OPGELET: Dit vormt geen beleggingsadvies."
+}
+
+# === Conserver et valoriser le vin comme un patrimoine ===
+TITRES_PATRIMOINE = {
+    "fr": "Conserver et valoriser le vin comme un patrimoine",
+    "en": "Preserving and Enhancing Wine as Heritage",
+    "nl": "Wijn bewaren en waarderen als erfgoed"
+}
+
+# Texte selon la forme de possession et la motivation
+TEXTES_POSSESSION = {
+    "fr": {
+
+        "cave_personnelle": (
+            "Vous possédez (ou envisagez de posséder) une cave personnelle. "
+            "Un choix empreint d’authenticité, symbole d’un lien intime avec vos bouteilles. "
+            "Pensez à privilégier une orientation nord ou nord-est pour éviter les variations thermiques, "
+            "à maintenir une température stable autour de 12 °C et une hygrométrie proche de 70 %. "
+            "Évitez la lumière directe, et assurez une ventilation douce pour garantir le vieillissement optimal de vos vins."
+        ),
+
+        "cave_externalisee": (
+            "Vous avez opté pour une cave externalisée ou une garde professionnelle. "
+            "Une solution pratique pour garantir des conditions de conservation idéales, sans contrainte logistique. "
+            "Avant de choisir un prestataire, vérifiez la stabilité thermique, le contrôle hygrométrique, "
+            "ainsi que les garanties en matière d’assurance et de traçabilité des bouteilles. "
+            "Certaines caves proposent également des outils digitaux pour suivre vos stocks à distance."
+        ),
+
+        "fonds_investissement": (
+            "Vous vous intéressez à des fonds ou plateformes d’investissement dans le vin. "
+            "Nous attirons votre attention sur le fait que GrandcruX ne fournit pas de conseil en investissement. "
+            "Toutefois, il est toujours pertinent de s’informer de manière éclairée : "
+            "renseignez-vous sur la gouvernance du fonds, la sélection des crus, les frais de gestion et la liquidité du support. "
+            "Le vin peut être perçu comme une classe d’actifs alternative, à la croisée du plaisir et du patrimoine tangible."
+        ),
+
+        "pas_encore": (
+            "Vous ne possédez pas encore de vin mais souhaitez vous renseigner. "
+            "C’est une excellente démarche ! Nos conseillers GrandcruX sont disponibles pour vous accompagner, "
+            "que ce soit pour découvrir les fondamentaux de la conservation, comprendre le marché du vin ou simplement choisir vos premières bouteilles."
+        ),
+
+        "intro_motivation": (
+            "Nous avons noté que vos motivations principales étaient les suivantes :"
+        ),
+
+        "plaisir": (
+            "Le plaisir gustatif.\n\n"
+            "Il s'agit là d'une approche qui incarne l’essence même du vin. "
+            "Partager une bouteille, découvrir un millésime, vivre un instant de convivialité : "
+            "le vin, avant tout, se savoure. "
+            "Chez GrandcruX, nous croyons que le plaisir est la première forme d’investissement émotionnel dans le vin."
+        ),
+
+        "transmission": (
+            "La transmission familiale.\n\n"
+            "C’est le signe que vous vous posez les bonnes questions. "
+            "Transmettre une cave, c’est transmettre une histoire, une mémoire et un goût. "
+            "Pour aller plus loin sur ce sujet, nous vous invitons à consulter la deuxième partie du rapport, "
+            "consacrée à la pérennisation et à la transmission du patrimoine viticole."
+        ),
+
+        "placement": (
+            "Le placement à long terme.\n\n"
+            "Une réflexion judicieuse. Sans fournir de conseils en rendement ou en performance, "
+            "nous soulignons que le vin peut constituer un actif alternatif à horizon long, "
+            "conjuguant rareté, plaisir et valeur émotionnelle. "
+            "Un équilibre rare entre passion et patrimoine."
+        ),
+
+        "diversification": (
+            "La diversification du patrimoine.\n\n"
+            "Une approche avisée. Le vin peut s’envisager comme une composante complémentaire d’un patrimoine global, "
+            "au même titre que les voitures de collection, les oeuvres d’art ou les montres d’exception. "
+            "Un choix à la fois esthétique, sensoriel et patrimonial."
+        )
+    },
+
+    "en": {
+
+        "cave_personnelle": (
+            "You own (or wish to own) a personal wine cellar — a choice that reflects authenticity and passion. "
+            "Ensure a stable temperature around 12 °C, humidity near 70%, and avoid direct light. "
+            "A north or northeast orientation helps prevent temperature fluctuations, "
+            "while gentle ventilation ensures your wines age in perfect harmony."
+        ),
+
+        "cave_externalisee": (
+            "You rely on a professional or externalized wine storage service. "
+            "A practical and secure solution offering ideal storage conditions without the burden of maintenance. "
+            "Before choosing a provider, check for thermal stability, humidity control, "
+            "insurance coverage, and traceability systems. "
+            "Some also offer digital access to monitor your collection remotely."
+        ),
+
+        "fonds_investissement": (
+            "You are interested in wine investment funds or platforms. "
+            "Please note that GrandcruX does not provide investment advice. "
+            "However, we encourage you to research carefully — look into fund governance, "
+            "wine selection criteria, management fees, and liquidity. "
+            "Wine can be viewed as an alternative asset class, bridging tangible heritage and sensory pleasure."
+        ),
+
+        "pas_encore": (
+            "You do not yet own wine but wish to learn more. "
+            "An excellent decision ! GrandcruX advisors are available to guide you through "
+            "the fundamentals of storage, the wine market, and the selection of your first bottles."
+        ),
+
+        "intro_motivation": (
+            "We have noted that your main motivations are as follows:"
+        ),
+
+        "plaisir": (
+            "Pleasure.\n\n"
+            "This approach embodies the very essence of wine. Sharing a bottle, discovering a vintage, "
+            "enjoying a convivial moment — wine, above all, is meant to be savoured. "
+            "At GrandcruX, we believe that pleasure is the first true emotional investment in wine."
+        ),
+
+        "transmission": (
+            "Family transmission.\n\n"
+            "It shows that you are asking the right questions. Passing on a cellar means passing on a story, a memory, and a taste. "
+            "To explore this topic further, please refer to the second part of the report, "
+            "dedicated to the preservation and transmission of wine heritage."
+        ),
+
+        "placement": (
+            "Long-term investment.\n\n"
+            "A thoughtful perspective. While we do not provide advice on performance, "
+            "wine can be considered an alternative long-term asset combining rarity, pleasure, and emotional value. "
+            "A delicate balance between passion and heritage."
+        ),
+
+        "diversification": (
+            "Diversification.\n\n"
+            "A wise approach. Wine can be seen as a complementary component of a diversified portfolio, "
+            "alongside collectible cars, art, or fine watches. "
+            "A refined blend of aesthetics, enjoyment, and tangible value."
+        )
+    },
+
+    "nl": {
+
+        "cave_personnelle": (
+            "U bezit (of wilt bezitten) een persoonlijke wijnkelder. "
+            "Een authentieke keuze die een nauwe band met uw flessen weerspiegelt. "
+            "Zorg voor een stabiele temperatuur rond 12 °C, een vochtigheidsgraad van ongeveer 70 %, "
+            "vermijd direct licht en voorzie een zachte ventilatie. "
+            "Een noord- of noordoostgerichte kelder voorkomt temperatuurschommelingen en bevordert een ideale rijping."
+        ),
+
+        "cave_externalisee": (
+            "U kiest voor een externe of professionele wijnopslag. "
+            "Een praktische oplossing die optimale bewaaromstandigheden biedt zonder onderhoudszorgen. "
+            "Controleer bij de keuze van een aanbieder de temperatuurstabiliteit, luchtvochtigheid, "
+            "verzekering en traceerbaarheid. Sommige aanbieders bieden ook digitale toegang tot uw voorraad."
+        ),
+
+        "fonds_investissement": (
+            "U toont interesse in wijnbeleggingsfondsen of -platformen. "
+            "Let op: GrandcruX geeft geen beleggingsadvies. "
+            "Wij raden aan om goed geïnformeerd te blijven — onderzoek de structuur van het fonds, "
+            "de selectiecriteria, de beheerskosten en de liquiditeit. "
+            "Wijn kan worden beschouwd als een alternatieve beleggingscategorie, "
+            "op het kruispunt van plezier en tastbaar erfgoed."
+        ),
+
+        "pas_encore": (
+            "U bezit nog geen wijn maar wilt zich informeren. "
+            "Een uitstekende stap ! De adviseurs van GrandcruX begeleiden u graag "
+            "bij de basisprincipes van wijnbewaring, de markt en de keuze van uw eerste flessen."
+        ),
+
+        "intro_motivation": (
+            "Wij hebben vastgesteld dat uw belangrijkste motivaties de volgende zijn:"
+        ),
+
+        "plaisir": (
+            "Smaakgenot.\n\n"
+            "Dit is de ware essentie van wijn. Een fles delen, een jaargang ontdekken, genieten van gezelligheid — "
+            "wijn draait om beleving. Bij GrandcruX beschouwen we genot als de eerste en belangrijkste emotionele investering in wijn."
+        ),
+
+        "transmission": (
+            "Familiale overdracht.\n\n"
+            "Dit toont dat u de juiste vragen stelt. Een wijnkelder doorgeven betekent een verhaal, een herinnering en een smaak delen. "
+            "Voor meer informatie verwijzen wij naar het tweede deel van dit rapport, "
+            "gewijd aan het behoud en de overdracht van wijnbezit."
+        ),
+
+        "placement": (
+            "Langetermijnbelegging.\n\n"
+            "Een doordachte keuze. Hoewel wij geen rendementadvies geven, kan wijn worden beschouwd als een alternatief langetermijnactief "
+            "dat zeldzaamheid, plezier en emotionele waarde combineert. "
+            "Een subtiel evenwicht tussen passie en erfgoed."
+        ),
+
+        "diversification": (
+            "Diversificatie.\n\n"
+            "Een verstandige aanpak. Wijn kan deel uitmaken van een evenwichtige vermogensverdeling, "
+            "naast kunst, oldtimers of luxe horloges. "
+            "Een unieke mix van esthetiek, beleving en waarde."
+        )
+    }
+}
+
+# === Votre appétence au risque ===
+TITRES_RISQUE = {
+    "fr": "Votre appétence au risque",
+    "en": "Your Risk Appetite",
+    "nl": "Uw risicobereidheid"
+}
+
+# Texte selon l'appétence au risque
+TEXTES_RISQUE = {
+    "fr": {
+        "intro": (
+            "Nous avons noté votre appétence au risque suivante : "
+        ),
+
+        "tres_faible": (
+            "Risque très faible — vous privilégiez la sécurité.\n\n"
+            "Dans ce cas, le vin peut être perçu avant tout comme un actif plaisir, "
+            "dont le 'rendement' principal réside dans le plaisir de dégustation et la valorisation patrimoniale émotionnelle. "
+            "Il n’y a ici aucun risque ou un risque très contenu, "
+            "puisque le vin reste un bien tangible qui peut être conservé, transmis… ou dégusté. "
+            "Nous rappelons que GrandcruX ne fournit pas de conseils en investissement, "
+            "et que cette approche s’inscrit avant tout dans une logique de sécurité et de passion raisonnée."
+        ),
+
+        "modere": (
+            "Risque modéré — un équilibre entre plaisir et rendement.\n\n"
+            "Cette approche traduit une vision équilibrée : l’envie de concilier plaisir et potentiel de valorisation. "
+            "Il est effectivement possible d’obtenir des rendements modérés sur certaines cuvées recherchées, "
+            "mais toujours dans une optique de long terme et sans garantie. "
+            "Nous ne sommes pas conseillers en investissement, et ne formulons pas de recommandations financières. "
+            "Le vin reste un placement alternatif, où la dimension plaisir et patrimoine prime sur la recherche de performance."
+        ),
+
+        "eleve": (
+            "Risque élevé — la recherche de performance.\n\n"
+            "Certains acteurs spécialisés proposent des placements à haut risque dans le vin, "
+            "souvent liés à la spéculation sur des millésimes rares ou des volumes limités. "
+            "Cependant, la recherche de performance n’est pas, à notre connaissance, "
+            "l’élément qui caractérise le plus l’investissement dans le vin. "
+            "Notre démarche n’a pas vocation à offrir des conseils en investissement ni à viser le rendement à tout prix. "
+            "Le vin s’envisage avant tout comme un actif alternatif, mêlant passion, culture et patrimoine tangible."
+        )
+    },
+
+    "en": {
+        "intro": (
+            "We have noted the following risk appetite : "
+        ),
+
+        "tres_faible": (
+            "Very low risk — you prioritise safety.\n\n"
+            "In this case, wine can be seen primarily as a pleasure asset, "
+            "whose main 'return' lies in enjoyment, heritage and tangible value. "
+            "There is virtually no risk, as wine remains a consumable and collectible good. "
+            "We remind you that GrandcruX does not provide investment advice; "
+            "this approach is above all one of prudence, stability and pleasure."
+        ),
+
+        "modere": (
+            "Moderate risk — a balance between pleasure and return.\n\n"
+            "This balanced perspective reflects an interest in both enjoyment and potential appreciation. "
+            "It is possible to achieve moderate returns on certain sought-after vintages, "
+            "though always over the long term and without any guarantees. "
+            "We are not investment advisers and do not issue financial recommendations. "
+            "Wine remains an alternative asset class, where passion and culture take precedence over performance."
+        ),
+
+        "eleve": (
+            "High risk — a search for performance.\n\n"
+            "Some specialised platforms offer high-risk investments in fine wine, "
+            "often linked to speculation on rare vintages or limited productions. "
+            "However, the pursuit of performance is not, to our knowledge, "
+            "what best characterises wine investment. "
+            "GrandcruX does not provide investment advice and does not promote a performance-driven approach. "
+            "Wine should be viewed primarily as an alternative, tangible and cultural asset."
+        )
+    },
+
+    "nl": {
+        "intro": (
+            "Wij hebben uw risicobereidheid vastgesteld : "
+        ),
+
+        "tres_faible": (
+            "Zeer laag risico — u geeft de voorkeur aan veiligheid.\n\n"
+            "In dit geval kan wijn worden beschouwd als een plezierbezit, "
+            "waarvan het belangrijkste 'rendement' ligt in genot en erfgoedwaarde. "
+            "Er is nauwelijks risico, aangezien wijn een tastbaar goed blijft dat men kan bewaren, doorgeven of consumeren. "
+            "Wij herinneren eraan dat GrandcruX geen beleggingsadvies verstrekt "
+            "en dat deze benadering vooral draait om veiligheid en passie."
+        ),
+
+        "modere": (
+            "Gemiddeld risico — een evenwicht tussen plezier en rendement.\n\n"
+            "Deze houding getuigt van een evenwichtige visie: de wens om plezier te combineren met mogelijke waardestijging. "
+            "Op bepaalde gezochte jaargangen kan een gematigd rendement worden gerealiseerd, "
+            "maar altijd op lange termijn en zonder garantie. "
+            "Wij zijn geen beleggingsadviseurs en geven geen financieel advies. "
+            "Wijn blijft een alternatief actief, waarbij beleving en erfgoed belangrijker zijn dan pure prestatie."
+        ),
+
+        "eleve": (
+            "Hoog risico — op zoek naar prestaties.\n\n"
+            "Sommige gespecialiseerde spelers bieden beleggingen met hoog risico aan in wijn, "
+            "vaak gericht op speculatie met zeldzame jaargangen of beperkte producties. "
+            "De zoektocht naar prestaties is echter, voor zover wij weten, "
+            "niet wat het meest typerend is voor beleggen in wijn. "
+            "GrandcruX verstrekt geen beleggingsadvies en richt zich niet op rendement tegen elke prijs. "
+            "Wijn moet worden gezien als een alternatief, tastbaar en cultureel actief."
+        )
+    }
+}
+
+# === Le vin comme outil de transmission ===
+TITRES_TRANSMISSION = {
+    "fr": "Le vin comme outil de transmission",
+    "en": "Wine as a Tool for Transmission",
+    "nl": "Wijn als instrument voor overdracht"
+}
+
+# Texte selon la présence d'enfants
+TEXTES_TRANSMISSION = {
+    "fr": {
+        "intro": (
+            "Avant toute chose, il existe des règles légales encadrant la transmission du patrimoine. "
+            "Le vin, bien qu’il évoque la passion et la culture, est considéré en droit comme un bien meuble. "
+            "À ce titre, il est, tout comme les biens immeubles, susceptible d’imposition dans le cadre des droits de succession.\n\n"
+            "Retenez avant tout ceci : en Belgique, les droits de succession sont régionalisés. "
+            "Les règles d’imposition diffèrent selon que vous résidez en Région wallonne, en Région flamande ou encore à Bruxelles-Capitale."
+        ),
+
+        "enfants_oui": (
+            "Nous avons noté que vous aviez des enfants.\n\n"
+            "La présence d’enfants influe directement sur la répartition successorale. "
+            "En effet, le Code civil prévoit une réserve héréditaire légale pour chaque enfant. "
+            "Celle-ci garantit qu’une partie de votre patrimoine — appelée 'masse successorale' ou 'masse fictive' — "
+            "leur reviendra nécessairement. Cette masse correspond à la somme de vos biens au moment du décès, "
+            "diminuée de vos dettes et augmentée des donations effectuées de votre vivant.\n\n"
+            "Ainsi, la moitié de cette masse est dite 'quotité disponible' (dont vous pouvez librement disposer), "
+            "et l’autre moitié constitue la 'réserve' partagée entre vos enfants au prorata.\n\n"
+            "Ces dispositions assurent la protection familiale tout en laissant une marge de liberté patrimoniale. "
+            "Nous verrons plus bas comment ces règles peuvent s’articuler avec la transmission de votre cave et de vos vins."
+        ),
+
+        "enfants_non": (
+            "Nous avons noté que vous n’aviez pas d’enfants.\n\n"
+            "Dans ce cas, la loi désigne vos héritiers selon le principe des ordres et des degrés : "
+            "vos parents, frères, soeurs, oncles et tantes peuvent hériter directement. "
+            "Cependant, en l’absence de descendants, les droits de succession peuvent s’avérer élevés, "
+            "notamment lorsqu’ils s’appliquent à des collatéraux.\n\n"
+            "Il peut être utile d’y réfléchir à l’avance, afin de préserver la valeur symbolique et financière de votre cave. "
+            "Nous verrons plus bas comment certaines dispositions patrimoniales peuvent optimiser cette transmission."
+        ),
+
+        "analyse_intro": (
+            "À côté des taxations, il existe heureusement des règles de protection mises en place par la loi.\n\n"
+            "Ainsi, une réserve légale est prévue par enfant. Très concrètement, cela signifie qu’une partie de la masse successorale "
+            "(également appelée 'masse fictive', car elle additionne fictivement les biens donnés de votre vivant) "
+            "est réservée à vos enfants.\n\n"
+            "Cette masse se partage entre deux moitiés : la quotité disponible (librement transmissible) et la réserve (protégée pour vos héritiers)."
+        ),
+
+        "analyse_suite": (
+            "Voici donc comment se répartit la réserve de vos enfants sur la moitié de la masse successorale. "
+            "Ceci illustre, de manière simplifiée, ce que la loi leur garantit en cas de succession.\n\n"
+            "Nous reprendrons ces règles plus bas dans le cas particulier du vin."
+        )
+    },
+
+    "en": {
+        "intro": (
+            "First and foremost, inheritance and transfer of assets are governed by specific legal rules. "
+            "Wine, although associated with culture and passion, is legally considered a movable asset. "
+            "As such, it may be subject to inheritance taxation, much like real estate.\n\n"
+            "Keep in mind that in Belgium, inheritance tax is a regional matter. "
+            "Taxation rules differ between the Walloon Region, the Flemish Region, and the Brussels-Capital Region."
+        ),
+
+        "enfants_oui": (
+            "We have noted that you have children.\n\n"
+            "The presence of children directly affects inheritance rules. "
+            "Belgian civil law provides a legal hereditary reserve for each child — "
+            "a portion of your total estate (the so-called 'fictitious estate mass') that cannot be deprived from them. "
+            "This mass includes all assets owned at death, minus debts, and adds back any donations made during your lifetime.\n\n"
+            "Half of this mass is freely disposable ('available share'), "
+            "while the other half forms the children's reserve, divided equally among them.\n\n"
+            "This ensures family protection while maintaining flexibility in estate planning. "
+            "We will later see how these principles apply specifically to wine and cellar inheritance."
+        ),
+
+        "enfants_non": (
+            "We have noted that you do not have children.\n\n"
+            "In this situation, Belgian succession law designates heirs according to the legal orders of kinship: "
+            "your parents, siblings, uncles, and aunts may inherit directly. "
+            "However, without descendants, inheritance taxes can be particularly high — "
+            "especially for collateral heirs.\n\n"
+            "It may therefore be wise to anticipate this to preserve the symbolic and financial value of your wine collection. "
+            "We will later explore how estate tools can optimise this transmission."
+        ),
+
+        "analyse_intro": (
+            "Alongside taxation, Belgian law provides protective inheritance mechanisms.\n\n"
+            "A legal reserve exists for each child. In practice, this means that part of your total estate "
+            "(the 'fictitious mass', which includes all gifted and current assets) "
+            "is guaranteed to your heirs.\n\n"
+            "Half of the estate is freely disposable, and the other half is reserved proportionally for your children."
+        ),
+
+        "analyse_suite": (
+            "Below is a simplified illustration of how this hereditary reserve is distributed among your children. "
+            "It represents the portion of your estate to which each child is legally entitled.\n\n"
+            "We will see these rules further below in the specific case of wine."
+        )
+    },
+
+    "nl": {
+        "intro": (
+            "Voordat men aan overdracht denkt, is het belangrijk te weten dat de erfopvolging wettelijk geregeld is. "
+            "Wijn, hoe gepassioneerd en cultureel ook, wordt juridisch beschouwd als een roerend goed. "
+            "Net als onroerend goed kan het dus worden belast in het kader van de successierechten.\n\n"
+            "Onthoud vooral dit: in België zijn de successierechten geregionaliseerd. "
+            "De fiscale regels verschillen naargelang u woont in het Waalse Gewest, het Vlaamse Gewest of het Brussels Hoofdstedelijk Gewest."
+        ),
+
+        "enfants_oui": (
+            "Wij hebben genoteerd dat u kinderen heeft.\n\n"
+            "De aanwezigheid van kinderen heeft een directe invloed op de verdeling van de nalatenschap. "
+            "Volgens het Burgerlijk Wetboek bestaat er een wettelijke erfrechtelijke reserve voor elk kind. "
+            "Een deel van uw vermogen — de zogenaamde 'fictieve nalatenschapsmassa' — "
+            "moet dus verplicht aan hen worden toebedeeld.\n\n"
+            "De helft van deze massa is vrij beschikbaar ('beschikbaar deel'), "
+            "de andere helft vormt de 'reserve' die gelijk verdeeld wordt onder uw kinderen.\n\n"
+            "Deze regeling waarborgt bescherming van het gezin en biedt tegelijk enige vrijheid. "
+            "Verderop bekijken we hoe deze regels van toepassing zijn op wijn en wijnkelders."
+        ),
+
+        "enfants_non": (
+            "Wij hebben genoteerd dat u geen kinderen heeft.\n\n"
+            "In dat geval bepaalt de wet uw erfgenamen volgens orde en graad: "
+            "ouders, broers, zussen, ooms en tantes kunnen rechtstreeks erven. "
+            "Bij afwezigheid van afstammelingen kunnen de successierechten echter hoog oplopen, "
+            "vooral bij zijverwanten.\n\n"
+            "Het is dus verstandig om hier vooraf bij stil te staan, "
+            "om de symbolische en financiële waarde van uw wijncollectie te behouden. "
+            "Verderop tonen we hoe bepaalde regelingen de overdracht kunnen optimaliseren."
+        ),
+
+        "analyse_intro": (
+            "Naast de belasting bestaan er beschermingsmechanismen voorzien door de wet.\n\n"
+            "Er is een wettelijke reserve per kind. Dit betekent dat een deel van de nalatenschapsmassa "
+            "(ook wel 'fictieve massa' genoemd, omdat het schenkingen uit het verleden meerekent) "
+            "verplicht aan uw kinderen wordt toegewezen.\n\n"
+            "De helft van deze massa is vrij beschikbaar en de andere helft wordt gelijk verdeeld onder uw kinderen."
+        ),
+
+        "analyse_suite": (
+            "Hieronder ziet u een vereenvoudigde voorstelling van de verdeling van deze reserve. "
+            "Dit geeft weer welk deel van de nalatenschap wettelijk aan elk kind toekomt.\n\n"
+            "We zullen deze regels verderop opnieuw bekijken in het specifieke geval van wijn."
+        )
+    }
+}
+
+# === La réserve légale et la quotité disponible ===
+TITRES_RESERVE = {
+    "fr": "La réserve légale et la quotité disponible",
+    "en": "The Legal Reserve and the Disposable Portion",
+    "nl": "De wettelijke reserve en het beschikbare deel"
+}
+
+# Phrase sur le nombre d'enfants : (singulier, pluriel)
+PHRASES_NOMBRE_ENFANTS = {
+    "fr": ("Vous avez {nombre} enfant.", "Vous avez {nombre} enfants."),
+    "en": ("You have {nombre} child.", "You have {nombre} children."),
+    "nl": ("U heeft {nombre} kind.", "U heeft {nombre} kinderen.")
+}
+
+# === Le régime matrimonial ===
+TITRES_REGIME = {
+    "fr": "Le régime matrimonial",
+    "en": "The Matrimonial Regime",
+    "nl": "Het huwelijksstelsel"
+}
+
+# Texte selon le régime matrimonial
+TEXTES_MATRIMONIAL = {
+    "fr": {
+        "intro": (
+            "Avant d’aborder la succession, il faut d’abord liquider le régime matrimonial lorsqu’il en existe un. "
+            "Ce principe est essentiel : il permet de déterminer ce qui appartient à chacun des époux avant toute répartition successorale.\n\n"
+            "Lorsque le couple a des enfants, la succession associe souvent les notions d’usufruit (au profit du conjoint survivant) "
+            "et de nue-propriété (au profit des enfants). Cette structure permet à la fois une protection du conjoint et une optimisation fiscale. "
+            "Nous n’entrerons pas ici dans le détail technique de ces règles. "
+            "Sachez que pour le vin, une convention de quasi-usufruit (sous seing privé ou chez le notaire) pourrait être envisagée."
+
+        ),
+
+        "non": (
+            "Vous n’êtes pas marié(e).\n\n"
+            "Dans ce cas, vous êtes soit célibataire, soit en cohabitation de fait, soit en cohabitation légale.\n\n"
+            "- En cas de **cohabitation de fait**, votre partenaire ne reçoit rien par succession légale. "
+            "Si vous souhaitez qu’il ou elle hérite de votre cave ou de la valeur de vos vins, "
+            "il est nécessaire de le prévoir expressément par testament.\n\n"
+            "- En cas de **cohabitation légale**, vous êtes assimilé à un régime de séparation des biens : "
+            "vos patrimoines restent distincts, chacun conservant la propriété de ses biens, y compris vos vins et bouteilles personnelles.\n\n"
+            "Dans les deux cas, la prévoyance et la clarté juridique sont des clés pour préserver la transmission harmonieuse de votre patrimoine viticole."
+        ),
+
+        "communautelegale": (
+            "Vous êtes marié(e) sous le régime de la **communauté légale**.\n\n"
+            "Dans ce régime, les biens acquis avant le mariage restent propres, "
+            "tandis que ceux acquis pendant le mariage (y compris les revenus) deviennent communs.\n\n"
+            "Vos vins achetés avant le mariage restent donc votre propriété personnelle, "
+            "tandis que les bouteilles acquises durant le mariage appartiennent à la communauté.\n\n"
+            "Ce régime assure un équilibre entre autonomie et partage. "
+            "Il offre également certaines protections fiscales et successorales entre époux."
+        ),
+
+        "separationbien": (
+            "Vous êtes marié(e) sous le régime de la **séparation de biens**.\n\n"
+            "Chaque époux conserve ici son patrimoine propre. "
+            "Il n’existe pas de masse commune : chacun reste propriétaire exclusif des biens qu’il acquiert.\n\n"
+            "Vos vins sont donc strictement rattachés à votre patrimoine personnel, "
+            "sauf mention contraire (donation, achat commun, etc.).\n\n"
+            "Ce régime offre une grande indépendance patrimoniale, "
+            "mais peut nécessiter une attention accrue à la protection du conjoint survivant.\n\n"
+        ),
+
+        "communauteuniverselle": (
+            "Vous êtes marié(e) sous le régime de la **communauté universelle**.\n\n"
+            "Tous les biens, qu’ils aient été acquis avant ou pendant le mariage, "
+            "sont mis en commun, sauf clauses particulières dans le contrat.\n\n"
+            "Les vins acquis avant ou après le mariage appartiennent donc à la communauté. "
+            "En cas de décès, le conjoint survivant conserve une part significative du patrimoine, "
+            "ce qui peut favoriser la stabilité successorale mais limiter la part des enfants.\n\n"
+            "Ce régime est souvent choisi dans une logique de protection maximale du couple."
+        )
+    },
+
+    "en": {
+        "intro": (
+            "Before addressing inheritance, it is necessary to settle the matrimonial regime when one exists. "
+            "This determines what belongs to each spouse before any estate division.\n\n"
+            "When children are involved, inheritance usually combines **usufruct (for the surviving spouse)** "
+            "and **bare ownership (for the children)** — a structure that offers both protection and tax efficiency. "
+            "We will not delve into the legal mechanisms."
+            "Please note that for the wine, a quasi-usufruct agreement (either under private signature or through a notary) "
+            "could be considered."
+        ),
+
+        "non": (
+            "You are not married.\n\n"
+            "This means you are either single, in de facto cohabitation, or in legal cohabitation.\n\n"
+            "- In the case of **de facto cohabitation**, your partner has no inheritance rights by default. "
+            "If you wish for them to inherit your wine cellar or the value of your wines, "
+            "this must be explicitly provided for in a will.\n\n"
+            "- In **legal cohabitation**, you are considered under a separation of property regime — "
+            "each partner retains ownership of their own assets, including their wines.\n\n"
+            "In both cases, careful estate planning helps preserve the symbolic and financial value of your wine collection."
+        ),
+
+        "communautelegale": (
+            "You are married under the **legal community regime**.\n\n"
+            "Assets acquired before marriage remain personal, "
+            "while those acquired during marriage (including income) are jointly owned.\n\n"
+            "Wines purchased before marriage remain your property, "
+            "while those acquired afterward belong to the community.\n\n"
+            "This regime provides balance and mutual protection, "
+            "and offers certain tax and inheritance benefits between spouses."
+        ),
+
+        "separationbien": (
+            "You are married under the **separation of property** regime.\n\n"
+            "Each spouse maintains their own estate — there is no shared community property.\n\n"
+            "Your wines are therefore part of your personal assets, "
+            "unless otherwise stipulated (e.g., joint purchase or donation).\n\n"
+            "This regime grants financial independence, "
+            "but may require additional arrangements to protect the surviving spouse.\n\n"
+        ),
+
+        "communauteuniverselle": (
+            "You are married under the **universal community** regime.\n\n"
+            "All assets — whether acquired before or after marriage — "
+            "are considered joint property, unless exceptions are defined in the marriage contract.\n\n"
+            "Wines purchased at any time are therefore part of the shared estate. "
+            "In the event of death, the surviving spouse retains a substantial portion of the assets, "
+            "which enhances protection but reduces the share available to heirs.\n\n"
+            "This regime is often chosen to ensure full protection of the couple."
+        )
+    },
+
+    "nl": {
+        "intro": (
+            "Voordat men aan de nalatenschap denkt, moet eerst het huwelijksvermogensstelsel worden vereffend indien dit bestaat. "
+            "Dit bepaalt wat aan elke echtgenoot toebehoort vóór de verdeling van de erfenis.\n\n"
+            "Wanneer er kinderen zijn, wordt vaak gewerkt met **vruchtgebruik (voor de langstlevende echtgenoot)** "
+            "en **blote eigendom (voor de kinderen)** — een structuur die bescherming en fiscale optimalisatie combineert. "
+            "We gaan niet in op de technische details."
+            "Weet dat voor de wijn een quasi-vruchtgebruikovereenkomst (onderhands of via een notaris) kan worden "
+            "overwogen."
+
+        ),
+
+        "non": (
+            "U bent niet gehuwd.\n\n"
+            "Dit betekent dat u vrijgezel bent, feitelijk samenwoont of wettelijk samenwoont.\n\n"
+            "- Bij **feitelijke samenwoning** erft uw partner niets automatisch. "
+            "Wilt u dat hij of zij uw wijncollectie of de waarde ervan erft, dan moet u dit vastleggen in een testament.\n\n"
+            "- Bij **wettelijke samenwoning** geldt een **scheiding van goederen** : "
+            "ieder behoudt zijn eigen vermogen, inclusief zijn wijnbezit.\n\n"
+            "In beide gevallen is het verstandig om vooruit te plannen om de waarde van uw wijncollectie te behouden."
+        ),
+
+        "communautelegale": (
+            "U bent gehuwd onder het **wettelijk stelsel**.\n\n"
+            "Goederen van vóór het huwelijk blijven persoonlijk, "
+            "terwijl goederen die tijdens het huwelijk worden verworven, gemeenschappelijk worden.\n\n"
+            "Wijnen die vóór het huwelijk zijn gekocht, blijven dus persoonlijk, "
+            "terwijl wijnen die daarna zijn verworven, gemeenschappelijk zijn.\n\n"
+            "Dit stelsel biedt een evenwicht tussen autonomie en solidariteit en voorziet in bescherming tussen echtgenoten."
+        ),
+
+        "separationbien": (
+            "U bent gehuwd onder het **stelsel van scheiding van goederen**.\n\n"
+            "Elke echtgenoot behoudt hier zijn eigen vermogen : er is geen gemeenschappelijk vermogen.\n\n"
+            "Uw wijnen behoren dus uitsluitend tot uw persoonlijke vermogen, "
+            "tenzij anders overeengekomen (bijvoorbeeld gemeenschappelijke aankoop of schenking).\n\n"
+            "Dit stelsel waarborgt financiële onafhankelijkheid, "
+            "maar kan aanvullende bescherming voor de langstlevende vereisen.\n\n"
+        ),
+
+        "communauteuniverselle": (
+            "U bent gehuwd onder het **stelsel van algehele gemeenschap**.\n\n"
+            "Alle goederen, zowel van vóór als van na het huwelijk, "
+            "worden gemeenschappelijk eigendom, tenzij het contract anders bepaalt.\n\n"
+            "Uw wijnbezit behoort dus volledig tot de gemeenschap. "
+            "Bij overlijden behoudt de langstlevende echtgenoot een groot deel van het vermogen, "
+            "wat bescherming biedt maar het erfdeel van de kinderen verkleint.\n\n"
+            "Dit stelsel wordt vaak gekozen om de onderlinge bescherming te versterken."
+        )
+    }
+}
+
+# === Modes alternatifs d'optimisation ===
+TITRES_OPTIMISATION = {
+    "fr": "Modes alternatifs d'optimisation",
+    "en": "Alternative Ways of Optimisation",
+    "nl": "Alternatieve optimalisatiemethoden"
+}
+
+# Texte selon la détention d'une société
+TEXTES_SOCIETE = {
+    "fr": {
+        "intro": (
+            "Outre la transmission familiale classique, certaines formes de détention patrimoniale peuvent s’effectuer "
+            "par le biais d’une société. Cela peut offrir des voies d’optimisation ou de planification, "
+            "notamment lorsqu’il s’agit d’actifs tangibles comme le vin.\n\n"
+            "Si vous disposez d’une société, plusieurs leviers légaux belges peuvent être abordés avec votre comptable : "
+            "le versement de dividendes, la constitution de réserves de liquidation, ou encore le régime fiscal VVPRbis. "
+            "Ces mécanismes peuvent, dans certains cas, contribuer à une transmission progressive ou fiscalement efficiente.\n\n"
+            "Nous vous invitons à aborder ces questions avec votre professionnel de confiance afin d’en évaluer la pertinence dans votre situation."
+        ),
+
+        "type": (
+            "Nous notons que vous disposez de la société suivante : {type_societe}."
+        ),
+
+        "non": (
+            "Vous n’avez pas de société déclarée. Dans ce cas, la transmission de votre patrimoine viticole s’effectuera principalement "
+            "à titre personnel, dans le cadre du droit successoral classique."
+        )
+    },
+
+    "en": {
+        "intro": (
+            "Beyond traditional family succession, certain assets — such as wine — can also be held and transmitted through a company. "
+            "This structure may open up opportunities for optimisation or long-term planning.\n\n"
+            "If you own a company, your accountant may advise you on mechanisms recognised under Belgian law such as "
+            "dividend distribution, liquidation reserves, or the VVPRbis regime. "
+            "These can, in some cases, support gradual or tax-efficient transmission.\n\n"
+            "We encourage you to discuss these aspects with your trusted advisor to assess what may apply to your situation."
+        ),
+
+        "type": (
+            "We note that you have indicated the following company type: {type_societe}."
+        ),
+
+        "non": (
+            "You have indicated that you do not own a company. "
+            "In this case, the transmission of your wine assets will follow the general principles of personal inheritance law."
+        )
+    },
+
+    "nl": {
+        "intro": (
+            "Naast de klassieke familiale overdracht kan een deel van het vermogen — zoals wijn — ook via een vennootschap worden beheerd. "
+            "Dit kan mogelijkheden bieden voor optimalisatie en langetermijnplanning.\n\n"
+            "Indien u een vennootschap bezit, kan uw boekhouder u informeren over mechanismen die in België bestaan, "
+            "zoals dividenduitkeringen, liquidatiereserves of het VVPRbis-stelsel. "
+            "Deze instrumenten kunnen in bepaalde gevallen bijdragen tot een geleidelijke of fiscaal gunstige overdracht.\n\n"
+            "Bespreek deze opties gerust met uw vertrouwenspersoon om te bepalen wat voor u relevant is."
+        ),
+
+        "type": (
+            "Wij merken op dat u de volgende vennootschap hebt opgegeven: {type_societe}."
+        ),
+
+        "non": (
+            "U hebt geen vennootschap vermeld. "
+            "In dat geval zal de overdracht van uw wijnbezit hoofdzakelijk plaatsvinden via de gewone erfregels."
+        )
+    }
+}
+
+# === La donation : transmettre avec sens ===
+TITRES_DONATION = {
+    "fr": "La donation : transmettre avec sens",
+    "en": "Donation: Giving with Purpose",
+    "nl": "De schenking: met betekenis overdragen"
+}
+
+# Texte sur les donations
+TEXTES_DONATIONS = {
+    "fr": {
+        "intro": (
+            "Désirez-vous faire un cadeau à Noël, à votre compagne, à votre enfant ou à un proche ? "
+            "C’est une excellente idée ! Non seulement ce geste fait plaisir, mais il peut aussi avoir un intérêt fiscal insoupçonné.\n\n"
+            "Comme nous l’avons évoqué plus haut, la succession légale non préparée peut se transformer en véritable gouffre fiscal. "
+            "En Belgique, selon le lien de parenté, les droits de succession peuvent grimper jusqu’à **70 % ou plus** dans certains cas. "
+            "Une manière d’anticiper et d’alléger cette charge consiste à donner de son vivant : la **donation**."
+        ),
+
+        "types": (
+            "Il existe deux grands types de donation :\n\n"
+            "• **La donation sous seing privé**, non enregistrée, gratuite (0 %), mais soumise à une période dite de « survie » "
+            "de 3 à 5 ans selon la région. En cas de décès du donateur pendant ce délai, les droits de succession restent dus.\n\n"
+            "• **La donation enregistrée**, via un notaire, soumise à un droit d’enregistrement modéré (environ 3 %), "
+            "mais définitivement exonérée de droits de succession. Elle offre donc sécurité et transparence.\n\n"
+            "Le choix dépend du niveau de confort souhaité et de la nature du bien transmis."
+        ),
+
+        "pacte": (
+            "Rédigez un **pacte adjoint** afin de formaliser la donation. "
+            "Ce document, simple mais essentiel, précise la nature du don et peut contenir certaines conditions : "
+            "• le **retour conventionnel** (si le donataire décède avant le donateur, le bien revient au patrimoine initial), "
+            "• une **compensation financière** justifiée par une charge, "
+            "• ou une **interdiction temporaire de vente** des bouteilles pendant une période déterminée. "
+            "Songez également à quelques précautions particulières lors de la rédaction : "
+            "mentionnez pour chaque bouteille son **millésime**, son **domaine**, et, si nécessaire, un **montant expertisé** de la bouteille."
+        ),
+
+        "transition_oui": (
+            "Nous avons noté que vous avez déjà envisagé des donations par le passé. "
+            "Rassurez-vous : il n’en va pas autrement pour le vin. "
+            "Les mêmes principes s’appliquent, à quelques nuances près."
+        ),
+
+        "transition_non": (
+            "Nous avons noté que vous n'avez pas encore envisagé de donations par le passé. "
+            "Le vin constitue une manière élégante et symbolique d’envisager une première transmission."
+        ),
+
+        "vin": (
+            "En effet, le vin, en tant que bien matériel et patrimonial, peut ainsi tout à fait faire l’objet d’une donation.\n\n"
+            "Toutefois, certaines précautions s’imposent : faites expertiser la valeur de votre cave par un professionnel "
+            "reconnu — idéalement en présence du donataire — afin d’éviter toute contestation ultérieure.\n\n"
+            "Gardez malgré tout à l’esprit que la valeur de vos grands crus peut évoluer au fil du temps. Ainsi, "
+            "contrairement à une somme d’argent, un cohéritier pourrait invoquer la réduction de la donation au moment "
+            "du décès de votre parent, si celle-ci venait à porter atteinte à sa réserve héréditaire.\n\n"
+            "Il est donc recommandé d'avoir ces questions à l'esprit lorsque vous vous faites accompagner "
+            "par votre notaire ou un conseiller de confiance lors de la transmission."
+
+        )
+    },
+
+    "en": {
+        "intro": (
+            "Would you like to make a gift — for Christmas, to your partner, or to your child? "
+            "It’s a wonderful idea ! Not only does it bring joy, but it can also have unexpected tax advantages.\n\n"
+            "As mentioned earlier, unplanned inheritance can become a financial burden. "
+            "In Belgium, depending on family ties, inheritance taxes can reach **up to 70 % or more** in certain cases. "
+            "A way to anticipate this is through **donation** — giving during one’s lifetime."
+        ),
+
+        "types": (
+            "There are two main types of donation:\n\n"
+            "• **Unregistered private donation**, free of charge (0 %), but subject to a 'survival' period of 3 to 5 years "
+            "depending on the region. If the donor passes away within this period, inheritance tax remains due.\n\n"
+            "• **Registered donation**, executed through a notary, subject to a modest registration tax (around 3 %), "
+            "after which it becomes fully exempt from inheritance duties.\n\n"
+            "The right choice depends on the desired level of security and the nature of the asset transferred."
+        ),
+
+        "pacte": (
+            "Draw up an **adjunct agreement** to formalize the gift. "
+            "This simple yet essential document specifies the nature of the gift and may include certain conditions: "
+            "• a **conventional return clause** (if the donee passes away before the donor, the asset returns to the original estate), "
+            "• a **financial compensation** justified by a charge, "
+            "• or a **temporary prohibition on selling** the bottles for a set period. "
+            "Also, take a few particular precautions when drafting the document: "
+            "for each bottle, specify its **vintage**, **estate**, and, if necessary, an **appraised value**."
+        ),
+
+        "transition_oui": (
+            "We have noted that you have already considered making donations in the past. "
+            "Rest assured — it’s not so different when it comes to wine. "
+            "The same legal and practical principles generally apply."
+        ),
+
+        "transition_non": (
+            "We have noted that you have not yet considered making donations. "
+            "Wine can be a thoughtful and meaningful way to take the first step toward transmission."
+        ),
+
+        "vin": (
+            "Indeed, wine, as a tangible and patrimonial asset, can perfectly well be the subject of a donation.\n\n"
+            "However, certain precautions should be taken: have the value of your wine cellar assessed by "
+            "a recognized professional — ideally in the presence of the donee — to avoid any future disputes.\n\n"
+            "Keep in mind that the value of fine wines may change over time. Thus, unlike a sum of money, a co-heir "
+            "may invoke the reduction of the gift upon the death of your parent if it infringes on their reserved portion "
+            "of the estate.\n\n"
+            "It is therefore advisable to keep these considerations in mind when being assisted by your notary or a trusted "
+            "advisor during the transfer."
+        )
+    },
+
+    "nl": {
+        "intro": (
+            "Wilt u een geschenk doen — met Kerst, aan uw partner of aan uw kind ? "
+            "Een uitstekend idee ! Niet alleen een mooi gebaar, maar ook fiscaal interessant.\n\n"
+            "Zoals eerder vermeld, kan een niet-geplande erfenis leiden tot hoge belastingen. "
+            "In België kunnen de successierechten, afhankelijk van de familieband, oplopen tot **meer dan 70 %** in bepaalde gevallen. "
+            "Een manier om dit te vermijden is via **schenking** — een overdracht tijdens het leven."
+        ),
+
+        "types": (
+            "Er bestaan twee hoofdvormen van schenking:\n\n"
+            "• **Niet-geregistreerde schenking onderhands**, volledig gratis (0 %), "
+            "maar met een 'overlevingsperiode' van 3 tot 5 jaar afhankelijk van het gewest. "
+            "Bij overlijden van de schenker binnen die termijn blijven successierechten verschuldigd.\n\n"
+            "• **Geregistreerde schenking**, via notaris, met een beperkt registratierecht (ongeveer 3 %), "
+            "maar daarna volledig vrijgesteld van successierechten.\n\n"
+            "De keuze hangt af van het gewenste comfort en de aard van het overgedragen goed."
+        ),
+
+        "pacte": (
+            "Stel een **aanvullend pact** op om de schenking te formaliseren. "
+            "Dit eenvoudige maar essentiële document verduidelijkt de aard van de schenking en kan bepaalde voorwaarden bevatten: "
+            "• een **conventioneel terugkeerbeding** (als de begiftigde overlijdt vóór de schenker, keert het goed terug naar het oorspronkelijke vermogen), "
+            "• een **financiële compensatie** gerechtvaardigd door een last, "
+            "• of een **tijdelijk verkoopverbod** van de flessen gedurende een bepaalde periode. "
+            "Denk ook aan enkele bijzondere voorzorgsmaatregelen bij het opstellen van het document: "
+            "vermeld voor elke fles het **millésime (oogstjaar)**, het **domein**, en indien nodig een **getaxeerde waarde** van de fles."
+        ),
+
+        "transition_oui": (
+            "Wij hebben genoteerd dat u in het verleden al schenkingen heeft overwogen. "
+            "Wees gerust, voor wijn is het niet anders. "
+            "Dezelfde principes blijven grotendeels van toepassing."
+        ),
+
+        "transition_non": (
+            "Wij hebben genoteerd dat u nog geen schenkingen heeft overwogen. "
+            "Wijn kan een stijlvolle en betekenisvolle manier zijn om daarmee te beginnen."
+        ),
+
+        "vin": (
+            "Wijn kan immers, als een tastbaar en vermogensbestanddeel, perfect het voorwerp van een schenking zijn.\n\n"
+            "Wijn, als tastbaar en vermogensbestanddeel, kan zeker het voorwerp zijn van een schenking.\n\n"
+            "Toch zijn enkele voorzorgsmaatregelen aangewezen: laat de waarde van uw wijnkelder schatten door een "
+            "erkende professional — bij voorkeur in aanwezigheid van de begiftigde — om latere betwistingen te vermijden.\n\n"
+            "Houd er rekening mee dat de waarde van uw grote wijnen in de loop der tijd kan evolueren. In tegenstelling tot een "
+            "geldsom kan een mede-erfgenaam bij het overlijden van uw ouder de vermindering van de schenking inroepen, indien "
+            "deze een inbreuk vormt op zijn of haar reservatair erfdeel.\n\n"
+            "Het is daarom raadzaam deze vragen in gedachten te houden wanneer u zich laat begeleiden door uw notaris of een "
+            "vertrouwensadviseur bij de overdracht."
+        )
+    }
+}
+
+# === Pour conclure ===
+TITRES_CONCLUSION = {
+    "fr": "Pour conclure",
+    "en": "In Conclusion",
+    "nl": "Ter afsluiting"
+}
+
+# Texte selon l'importance accordée au patrimoine culturel
+TEXTES_CONCLUSION = {
+    "fr": {
+        "faible": (
+            "Vous avez indiqué accorder une importance limitée à la notion de patrimoine culturel.\n\n"
+            "C’est un point de vue que nous comprenons : le vin peut avant tout être un plaisir personnel, "
+            "une expérience intime, vécue dans l’instant. Mais même dans cette approche, il conserve une dimension de mémoire et d’émotion. "
+            "Chaque bouteille, chaque millésime raconte une histoire — celle d’un lieu, d’un geste, d’un savoir-faire. "
+            "Et c’est déjà, à sa manière, une trace patrimoniale.\n\n"
+            "Puissiez-vous continuer à savourer le vin comme un art de vivre, à votre rythme et selon vos envies."
+        ),
+
+        "moyenne": (
+            "Vous accordez une importance modérée à la notion de patrimoine culturel.\n\n"
+            "Le vin s’inscrit justement dans cet équilibre : entre plaisir et transmission, entre culture et partage. "
+            "Il n’est pas nécessaire d’être collectionneur ou héritier pour en saisir la beauté. "
+            "Le vin relie, inspire et traverse le temps — il appartient à ceux qui le font vivre.\n\n"
+            "Chez GrandcruX, nous croyons que chaque cave, même modeste, peut devenir le reflet d’une culture personnelle, "
+            "celle du goût, du souvenir et de la transmission raisonnée."
+        ),
+
+        "elevee": (
+            "Vous accordez une grande importance à la notion de patrimoine culturel.\n\n"
+            "C’est là, sans doute, la plus belle manière d’aborder le vin : non comme un bien de consommation, "
+            "mais comme un héritage vivant. Préserver, partager, transmettre — trois gestes qui fondent la culture du vin "
+            "et qui prolongent l’histoire de ceux qui l’aiment.\n\n"
+            "Chez GrandcruX, nous partageons pleinement cette vision : le vin n’est pas seulement une passion, "
+            "il est un lien entre les générations, un langage universel du temps et de la terre."
+        )
+    },
+
+    "en": {
+        "faible": (
+            "You indicated that you place limited importance on the cultural heritage aspect.\n\n"
+            "That is perfectly understandable — wine can first and foremost be a personal pleasure, "
+            "a moment to enjoy and to share in the present. Yet even in that, it carries memory and emotion. "
+            "Each bottle tells a story — of a place, a gesture, a savoir-faire — and that, too, is a form of heritage.\n\n"
+            "May you continue to enjoy wine as an art of living, in your own way and at your own pace."
+        ),
+
+        "moyenne": (
+            "You give moderate importance to the idea of cultural heritage.\n\n"
+            "Wine perfectly embodies that balance — between pleasure and transmission, culture and sharing. "
+            "You don’t have to be a collector to appreciate its meaning. "
+            "Wine connects people, inspires emotion, and stands the test of time.\n\n"
+            "At GrandcruX, we believe every cellar, however humble, can become a reflection of one’s own culture — "
+            "of taste, of memory, and of thoughtful transmission."
+        ),
+
+        "elevee": (
+            "You attach great importance to cultural heritage.\n\n"
+            "That is perhaps the most beautiful way to approach wine — not merely as a commodity, "
+            "but as a living legacy. To preserve, to share, to transmit — these gestures define the culture of wine "
+            "and extend the story of those who cherish it.\n\n"
+            "At GrandcruX, we fully share this vision: wine is not only a passion, "
+            "it is a bond between generations, a universal language of time and terroir."
+        )
+    },
+
+    "nl": {
+        "faible": (
+            "U hecht beperkte waarde aan het culturele erfgoedaspect.\n\n"
+            "Dat is volkomen begrijpelijk — wijn kan in de eerste plaats een persoonlijk genot zijn, "
+            "een moment om van te genieten, hier en nu. Toch draagt hij ook een herinnering en een emotie in zich. "
+            "Elke fles vertelt een verhaal — over een plaats, een gebaar, een vakmanschap — en dat is al erfgoed op zich.\n\n"
+            "Moge u wijn blijven ervaren als een kunst van het leven, op uw eigen manier en in uw eigen tempo."
+        ),
+
+        "moyenne": (
+            "U hecht een gemiddelde waarde aan het culturele erfgoed.\n\n"
+            "Wijn belichaamt precies dat evenwicht — tussen plezier en overdracht, tussen cultuur en delen. "
+            "Men hoeft geen verzamelaar te zijn om de schoonheid ervan te begrijpen. "
+            "Wijn verbindt mensen, wekt emoties op en trotseert de tijd.\n\n"
+            "Bij GrandcruX geloven we dat elke kelder, hoe bescheiden ook, een weerspiegeling kan worden "
+            "van een persoonlijke cultuur — van smaak, herinnering en bewuste overdracht."
+        ),
+
+        "elevee": (
+            "U hecht veel waarde aan cultureel erfgoed.\n\n"
+            "Dat is wellicht de mooiste manier om wijn te benaderen — niet enkel als consumptiegoed, "
+            "maar als levend erfgoed. Bewaren, delen, overdragen — dat zijn de gebaren die de wijncultuur vormen "
+            "en het verhaal van de liefhebber voortzetten.\n\n"
+            "Bij GrandcruX delen we deze visie volledig: wijn is niet alleen een passie, "
+            "het is een band tussen generaties, een universele taal van tijd en terroir."
+        )
+    }
+}
+
+# Mention complémentaire si une présentation a été demandée
+MENTIONS_PRESENTATION = {
+    "fr": (
+        "Nous avons noté que vous étiez intéressé(e) par une présentation ou une documentation "
+        "complémentaire sur le vin comme support de transmission ou sur les aspects culturels "
+        "et les bonnes pratiques.\n\n"
+        "N’hésitez pas à en discuter avec nos conseillers ou à consulter régulièrement les "
+        "informations mises à jour sur notre site."
+    ),
+    "en": (
+        "We have noted your interest in receiving a presentation or additional material "
+        "about wine as a medium of transmission, or about its cultural aspects and best practices.\n\n"
+        "Feel free to discuss this with our advisors or to check our website regularly for updates."
+    ),
+    "nl": (
+        "We hebben genoteerd dat u geïnteresseerd bent in een presentatie of bijkomende documentatie "
+        "over wijn als middel tot overdracht, of over de culturele aspecten en goede praktijken.\n\n"
+        "Aarzel niet om dit te bespreken met onze adviseurs of regelmatig onze website te raadplegen "
+        "voor nieuwe informatie."
+    ),
+}
+
+# === Annexe (remarques du client) ===
+TITRES_ANNEXE = {
+    "fr": "ANNEXE",
+    "en": "APPENDIX",
+    "nl": "BIJLAGE"
+}
+
+# Introduction de l'annexe
+TEXTES_ANNEXE = {
+    "fr": (
+        "Nous avons noté votre commentaire et nous vous en remercions.\n\n"
+        "N'hésitez pas à prendre contact avec nous afin que nous en discutions. "
+        "Si une réponse écrite est souhaitée, vous pouvez apporter ce rapport lors de votre rendez-vous "
+        "ou d'une conférence et nous y répondrons directement dans cet encadré."
+    ),
+    "en": (
+        "We have noted your comment and thank you for sharing it.\n\n"
+        "Please feel free to contact us if you would like to discuss it further. "
+        "If a written response is required, you may bring this report to your appointment "
+        "or to one of our conferences, and we will reply directly in this section."
+    ),
+    "nl": (
+        "Wij hebben uw opmerking genoteerd en danken u daarvoor.\n\n"
+        "Aarzel niet om contact met ons op te nemen als u dit verder wilt bespreken. "
+        "Indien een schriftelijk antwoord gewenst is, kunt u dit rapport meenemen "
+        "naar uw afspraak of een conferentie, zodat wij rechtstreeks in dit kader kunnen antwoorden."
+    )
+}
+
+# === Formules d'impression du rapport ===
+TEXTES_IMPRESSION = {
+    "fr": {
+        "title": "Nos formules d'impression du rapport",
+        "subtitle": "(Nos options d’impression et de livraison)",
+        "rows": [
+            ("Remise en main propre du rapport sur rendez-vous", "GRATUIT"),
+            ("Envoi du rapport par la poste", "25 EUR (+ frais de port éventuels)"),
+            ("Envoi du rapport et livraison à domicile du pack découverte", "525 EUR (+ frais si hors Bruxelles)"),
+            ("Formule alternative sur mesure", "Prix à discuter (sur devis)")
+        ],
+        "footer": "Si l'une de ces formules vous intéresse, n'hésitez pas a nous contacter.",
+        "team": "L'équipe GrandcruX",
+        "contact": "info@grandcruX.com"
+    },
+    "en": {
+        "title": "Our printed report options",
+        "subtitle": "(Printing and delivery packages)",
+        "rows": [
+            ("Printed report handover at our office", "FREE"),
+            ("Printed report sent by mail", "25 EUR (+ possible shipping fees)"),
+            ("Printed report and home delivery of the discovery pack", "525 EUR (+ fees outside Brussels)"),
+            ("Custom-made package", "Price to be discussed (on request)")
+        ],
+        "footer": "If you are interested in one of these options, feel free to contact us.",
+        "team": "The GrandcruX Team",
+        "contact": "info@grandcruX.com"
+    },
+    "nl": {
+        "title": "Onze formules voor het gedrukte rapport",
+        "subtitle": "(Onze afdruk- en leveringsopties)",
+        "rows": [
+            ("Afhaling van het rapport in ons kantoor", "GRATIS"),
+            ("Verzending van het rapport per post", "25 EUR (+ eventuele verzendkosten)"),
+            ("Verzending van het rapport en levering van het wijnspakket", "525 EUR (+ kosten buiten Brussel)"),
+            ("Alternatieve formule op maat", "Prijs te bespreken (op aanvraag)")
+        ],
+        "footer": "Indien u geïnteresseerd bent in een van deze formules, neem gerust contact met ons op.",
+        "team": "Het GrandcruX-team",
+        "contact": "info@grandcruX.com"
+    }
+}
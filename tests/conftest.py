@@ -0,0 +1,108 @@
+import json
+import os
+import secrets
+import sys
+from unittest import mock
+
+import pytest
+
+# Les modules de l'application sont à la racine du dépôt
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Ni workers de file ni pool de processus de rendu pendant les tests
+os.environ.setdefault("JOB_WORKER_THREADS", "0")
+os.environ.setdefault("RENDER_WORKERS", "0")
+
+
+class FakeDatabase:
+    """
+    DatabaseHandler sans PostgreSQL : garde les appels en mémoire. La file des
+    jobs reprend la logique des requêtes SQL, avec une horloge `now` (secondes)
+    que les tests avancent eux-mêmes.
+    """
+
+    def __init__(self, database_url=None):
+        self.persons = []
+        self.archives = []
+        self.jobs = {}
+        self.pieces = {}
+        self.now = 0.0
+
+    # --- File d'attente des réponses au formulaire ---
+
+    def enqueue_job(self, donnees, etape="enregistrement", attachments=None):
+        job_id = len(self.jobs) + 1
+        self.jobs[job_id] = {
+            "id": job_id, "statut": "en_attente", "etape": etape, "donnees": json.loads(json.dumps(donnees)),
+            "tentatives": 0, "erreur": None, "disponible_a": self.now, "verrouille_a": None,
+            "jeton": secrets.token_urlsafe(16),
+        }
+        self.pieces[job_id] = list(attachments or ())
+        return job_id, self.jobs[job_id]["jeton"]
+
+    def claim_job(self, lease_seconds, max_tentatives):
+        for job in self.jobs.values():
+            expire = job["statut"] == "en_cours" and job["verrouille_a"] < self.now - lease_seconds
+            if expire:
+                # Reprise après la mort d'un worker : essai compté
+                job["tentatives"] += 1
+                job["erreur"] = f"{job['etape']} : verrou expiré, worker arrêté pendant l'étape"
+                if job["tentatives"] >= max_tentatives:
+                    job["statut"] = "echec"
+                    continue
+            if expire or (job["statut"] == "en_attente" and job["disponible_a"] <= self.now):
+                job["statut"] = "en_cours"
+                job["verrouille_a"] = self.now
+                return {key: job[key] for key in ("id", "etape", "donnees", "tentatives")}
+        return None
+
+    def advance_job(self, job_id, etape):
+        job = self.jobs[job_id]
+        job.update(etape=etape, tentatives=0, erreur=None, verrouille_a=self.now)
+        if etape == "termine":
+            job["statut"] = "termine"
+            self.pieces[job_id] = []
+
+    def fail_job(self, job_id, erreur, retry_seconds, max_tentatives):
+        job = self.jobs[job_id]
+        job["tentatives"] += 1
+        job["erreur"] = erreur
+        job["statut"] = "echec" if job["tentatives"] >= max_tentatives else "en_attente"
+        job["disponible_a"] = self.now + retry_seconds
+        return job["statut"]
+
+    def defer_job(self, job_id, erreur, retry_seconds):
+        job = self.jobs[job_id]
+        job.update(statut="en_attente", erreur=erreur, disponible_a=self.now + retry_seconds)
+
+    def get_job(self, jeton):
+        for job in self.jobs.values():
+            if job["jeton"] == jeton:
+                return {key: job[key] for key in ("statut", "etape", "tentatives")}
+        return None
+
+    def save_job_pieces(self, job_id, attachments):
+        self.pieces[job_id] = list(attachments)
+
+    def get_job_pieces(self, job_id):
+        return list(self.pieces[job_id])
+
+    def create_person(self, *args, **kwargs):
+        self.persons.append((args, kwargs))
+
+    def archive_reports(self, destinataire, lang, mode_envoi, rapports):
+        self.archives.append((destinataire, lang, mode_envoi, list(rapports)))
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    """Module app.py importé avec une base simulée."""
+    with mock.patch("database_handler.DatabaseHandler", FakeDatabase):
+        import app
+    return app
+
+
+@pytest.fixture
+def client(app_module):
+    app_module.app.config["TESTING"] = True
+    return app_module.app.test_client()
@@ -0,0 +1,168 @@
+import os
+import threading
+import time
+
+import psycopg2
+import pytest
+from psycopg2 import extensions
+
+from db_pool import ConnectionPool, PoolTimeout
+
+
+class FakeInfo:
+    transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query):
+        if self.conn.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+
+class FakeConnection:
+    """Connexion psycopg2 réduite à ce qu'utilise le pool."""
+
+    opened = []
+
+    def __init__(self):
+        self.closed = 0
+        self.broken = False
+        self.rollbacks = 0
+        self.info = FakeInfo()
+        FakeConnection.opened.append(self)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def pool():
+    FakeConnection.opened = []
+    pool = ConnectionPool(FakeConnection, minconn=1, maxconn=2, timeout=0.2, healthcheck=0)
+    yield pool
+    pool.close()
+
+
+def test_fill_ouvre_les_connexions_minimales(pool):
+    pool.fill()
+    assert len(FakeConnection.opened) == 1
+
+    conn = pool.acquire()
+    assert conn is FakeConnection.opened[0]
+    pool.release(conn)
+
+
+def test_connexion_reutilisee(pool):
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert second is first
+    assert len(FakeConnection.opened) == 1
+
+
+def test_timeout_quand_tout_est_prete(pool):
+    a, b = pool.acquire(), pool.acquire()
+
+    start = time.monotonic()
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    assert 0.15 < time.monotonic() - start < 1
+
+    pool.release(a)
+    pool.release(b)
+
+
+def test_attente_reveillee_par_release(pool):
+    a, b = pool.acquire(), pool.acquire()
+    recu = []
+    waiter = threading.Thread(target=lambda: recu.append(pool.acquire(timeout=2)))
+    waiter.start()
+    time.sleep(0.05)
+    pool.release(a)
+    waiter.join()
+
+    assert recu == [a]
+    pool.release(a)
+    pool.release(b)
+
+
+def test_echec_de_connexion_libere_la_place(pool):
+    pool.acquire()
+
+    def refus():
+        raise psycopg2.OperationalError("could not connect to server")
+
+    pool.connect = refus
+    with pytest.raises(psycopg2.OperationalError):
+        pool.acquire()
+    assert pool._size == 1
+
+
+def test_rollback_au_retour(pool):
+    with pool.connection() as conn:
+        conn.info.transaction_status = extensions.TRANSACTION_STATUS_INTRANS
+
+    assert conn.rollbacks == 1
+    assert not conn.closed
+
+
+def test_connexion_perdue_ecartee(pool):
+    with pytest.raises(psycopg2.OperationalError):
+        with pool.connection() as conn:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    assert conn.closed
+    assert pool._size == 0
+    with pool.connection() as other:
+        assert other is not conn
+
+
+def test_connexion_en_panne_remplacee_a_l_emprunt(pool):
+    with pool.connection() as conn:
+        pass
+    conn.broken = True
+
+    with pool.connection() as other:
+        assert other is not conn
+    assert conn.closed
+    assert pool._size == 1
+
+
+def test_fork_ouvre_de_nouvelles_connexions(pool):
+    herite = pool.acquire()
+    lecture, ecriture = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            conn = pool.acquire()
+            ok = conn is not herite and pool._size == 1
+            # Une connexion empruntée par le parent n'est ni reprise ni fermée
+            pool.release(herite)
+            ok = ok and not herite.closed and all(c is not herite for c, _ in pool._idle)
+            os.write(ecriture, b"1" if ok else b"0")
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    assert os.read(lecture, 1) == b"1"
+    assert not herite.closed
+    pool.release(herite)
+    assert pool._size == 1
@@ -0,0 +1,172 @@
+import pytest
+
+import job_worker
+from job_worker import JobWorker
+from tests.conftest import FakeDatabase
+
+PIECES = [("rapport.pdf", b"%PDF")]
+
+
+class Etapes:
+    """Étapes d'un job : chacune lève l'erreur suivante de sa liste, puis réussit."""
+
+    def __init__(self, **erreurs):
+        self.erreurs = {etape: list(liste) for etape, liste in erreurs.items()}
+        self.appels = []
+
+    def _etape(self, etape):
+        self.appels.append(etape)
+        if self.erreurs.get(etape):
+            raise self.erreurs[etape].pop(0)
+
+    def render(self, data):
+        self._etape("rendu")
+        return PIECES
+
+    def send_email(self, data, attachments):
+        assert attachments == PIECES
+        self._etape("email")
+
+    def persist(self, data):
+        self._etape("enregistrement")
+
+
+@pytest.fixture
+def db():
+    return FakeDatabase()
+
+
+def worker(db, etapes):
+    return JobWorker(db, render=etapes.render, send_email=etapes.send_email, persist=etapes.persist)
+
+
+def drain(db, job_worker_):
+    """Traite la file jusqu'au bout, en avançant l'horloge jusqu'aux essais différés."""
+    for _ in range(50):
+        if not job_worker_.run_once():
+            attente = [job["disponible_a"] for job in db.jobs.values() if job["statut"] == "en_attente"]
+            if not attente:
+                return
+            db.now = max(db.now, min(attente))
+
+
+def test_steps_run_in_order(db):
+    etapes = Etapes()
+    job_id, _ = worker(db, etapes).enqueue({"mail": "client@example.com"})
+    drain(db, worker(db, etapes))
+    assert etapes.appels == ["enregistrement", "rendu", "email"]
+    assert db.jobs[job_id]["statut"] == "termine"
+    assert db.pieces[job_id] == []
+
+
+def test_prospect_is_saved_even_if_email_fails_for_good(db, monkeypatch):
+    monkeypatch.setattr(job_worker, "JOB_MAX_ATTEMPTS", 3)
+    etapes = Etapes(email=[OSError("relais injoignable")] * 3)
+    job_id, _ = db.enqueue_job({"mail": "client@example.com"})
+    drain(db, worker(db, etapes))
+    assert etapes.appels.count("enregistrement") == 1
+    assert db.jobs[job_id]["statut"] == "echec"
+    assert db.jobs[job_id]["etape"] == "email"
+
+
+def test_completed_steps_are_not_repeated(db):
+    etapes = Etapes(rendu=[OSError("pool cassé")])
+    db.enqueue_job({"mail": "client@example.com"})
+    drain(db, worker(db, etapes))
+    assert etapes.appels == ["enregistrement", "rendu", "rendu", "email"]
+
+
+def test_backoff_doubles_per_attempt_of_the_current_step(db, monkeypatch):
+    monkeypatch.setattr(job_worker, "JOB_RETRY_DELAY", 10)
+    etapes = Etapes(enregistrement=[OSError("base")] * 2, rendu=[OSError("pool")])
+    job_id, _ = db.enqueue_job({"mail": "client@example.com"})
+    w = worker(db, etapes)
+
+    delais = []
+    for _ in range(3):
+        w.run_once()
+        job = db.jobs[job_id]
+        delais.append(job["disponible_a"] - db.now)
+        db.now = job["disponible_a"]
+    # Deux échecs de l'enregistrement (10 s puis 20 s), puis premier échec du rendu : 10 s
+    assert delais == [10, 20, 10]
+    assert db.jobs[job_id]["etape"] == "rendu"
+
+
+@pytest.mark.parametrize("erreur", [KeyError("tel"), ValueError("Adresse e-mail du destinataire manquante.")])
+def test_deterministic_errors_fail_at_once(db, erreur):
+    etapes = Etapes(enregistrement=[erreur] * 5)
+    job_id, _ = db.enqueue_job({})
+    drain(db, worker(db, etapes))
+    assert etapes.appels == ["enregistrement"]
+    assert db.jobs[job_id]["statut"] == "echec"
+    assert type(erreur).__name__ in db.jobs[job_id]["erreur"]
+
+
+def test_bad_header_fails_at_once(db):
+    from flask_mail import BadHeaderError
+
+    etapes = Etapes(email=[BadHeaderError()] * 5)
+    job_id, _ = db.enqueue_job({})
+    drain(db, worker(db, etapes))
+    assert etapes.appels.count("email") == 1
+    assert db.jobs[job_id]["statut"] == "echec"
+
+
+def test_unavailable_service_defers_without_counting_an_attempt(db):
+    from mailer import MailUnavailable
+
+    etapes = Etapes(email=[MailUnavailable(40)])
+    job_id, _ = db.enqueue_job({})
+    w = worker(db, etapes)
+    while w.run_once():
+        pass
+    job = db.jobs[job_id]
+    assert job["statut"] == "en_attente" and job["etape"] == "email"
+    assert job["tentatives"] == 0
+    assert job["disponible_a"] - db.now == 40
+    drain(db, w)
+    assert job["statut"] == "termine"
+
+
+def test_job_status_is_looked_up_by_token_without_error_text(client, app_module):
+    job_id, jeton = app_module.db_handler.enqueue_job({"mail": "client@example.com"})
+    app_module.db_handler.fail_job(job_id, "email : 550 client@example.com refusé", 30, 5)
+
+    response = client.get(f"/jobs/{jeton}")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["statut"] == "en_attente"
+    assert "erreur" not in body and "id" not in body
+    assert client.get(f"/jobs/{job_id}").status_code == 404
+
+
+def test_job_reclaimed_after_a_dead_worker_counts_an_attempt(db, monkeypatch):
+    monkeypatch.setattr(job_worker, "JOB_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(job_worker, "JOB_LEASE_SECONDS", 300)
+    job_id, _ = db.enqueue_job({})
+
+    # Le worker meurt à chaque fois pendant l'étape : le job reste `en_cours`
+    for tentatives in range(3):
+        job = db.claim_job(job_worker.JOB_LEASE_SECONDS, job_worker.JOB_MAX_ATTEMPTS)
+        assert job["id"] == job_id and job["tentatives"] == tentatives
+        assert db.claim_job(job_worker.JOB_LEASE_SECONDS, job_worker.JOB_MAX_ATTEMPTS) is None
+        db.now += 301
+
+    assert db.claim_job(job_worker.JOB_LEASE_SECONDS, job_worker.JOB_MAX_ATTEMPTS) is None
+    assert db.jobs[job_id]["statut"] == "echec"
+    assert "verrou expiré" in db.jobs[job_id]["erreur"]
+
+
+def test_reclaimed_job_resumes_with_its_attempts_counted(db, monkeypatch):
+    monkeypatch.setattr(job_worker, "JOB_RETRY_DELAY", 10)
+    etapes = Etapes(enregistrement=[OSError("base indisponible")])
+    job_id, _ = db.enqueue_job({})
+    db.claim_job(job_worker.JOB_LEASE_SECONDS, job_worker.JOB_MAX_ATTEMPTS)
+    db.now += job_worker.JOB_LEASE_SECONDS + 1
+
+    worker(db, etapes).run_once()
+    job = db.jobs[job_id]
+    # Deuxième essai de l'étape : délai doublé
+    assert job["tentatives"] == 2
+    assert job["disponible_a"] - db.now == 20
@@ -0,0 +1,221 @@
+import smtplib
+
+import pytest
+from flask import Flask
+from flask_mail import BadHeaderError, Mail, Message
+
+import mailer
+from mailer import CircuitBreaker, MailUnavailable, PooledMailer
+
+
+class FakeConnection:
+    """Connexion SMTP simulée : `envoyer(msg)` décide du sort de chaque message."""
+
+    ouvertures = 0
+    connect_error = None
+    envoyer = staticmethod(lambda msg: None)
+
+    def __init__(self, mail, connect_timeout, send_timeout):
+        pass
+
+    def __enter__(self):
+        FakeConnection.ouvertures += 1
+        if FakeConnection.connect_error is not None:
+            raise FakeConnection.connect_error
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def send(self, msg):
+        FakeConnection.envoyer(msg)
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(mailer, "TimedConnection", FakeConnection)
+    monkeypatch.setattr(FakeConnection, "ouvertures", 0)
+    monkeypatch.setattr(FakeConnection, "connect_error", None)
+    monkeypatch.setattr(FakeConnection, "envoyer", staticmethod(lambda msg: None))
+    app = Flask(__name__)
+    app.config.update(MAIL_DEFAULT_SENDER="noreply@example.com", MAIL_SUPPRESS_SEND=False)
+    return app
+
+
+def make_mailer(app, threshold=2, reset_timeout=0.0):
+    return PooledMailer(app, Mail(app), size=1, idle_timeout=0.05, wait_timeout=5,
+                        breaker=CircuitBreaker(threshold, reset_timeout))
+
+
+def message(recipient="client@example.com"):
+    return Message("Rapport", recipients=[recipient], sender="noreply@example.com", body="...")
+
+
+def test_breaker_opens_after_threshold_and_lets_one_trial_through():
+    breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+    breaker.failure()
+    assert breaker.state == "ferme" and breaker.allow()
+    breaker.failure()
+    assert breaker.state == "ouvert"
+    assert not breaker.allow()
+    assert breaker.retry_after() > 0
+
+    breaker._opened_at -= 60
+    assert breaker.allow()
+    assert breaker.state == "semi_ouvert"
+    # Un seul message d'essai à la fois
+    assert not breaker.allow()
+
+
+def test_breaker_trial_verdicts():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+    breaker.failure()
+    assert breaker.allow() and breaker.state == "semi_ouvert"
+    breaker.failure()
+    assert breaker.state == "ouvert"
+
+    assert breaker.allow()
+    breaker.success()
+    assert breaker.state == "ferme" and breaker.failures == 0
+
+
+def test_breaker_release_frees_the_trial_slot():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+    breaker.failure()
+    assert breaker.allow() and not breaker.allow()
+    breaker.release()
+    assert breaker.state == "semi_ouvert"
+    assert breaker.allow()
+
+
+def test_breaker_settle_classifies_errors():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=60)
+    breaker.settle(ValueError("message"))
+    assert breaker.state == "ferme"
+    breaker.settle(smtplib.SMTPRecipientsRefused({}))
+    assert breaker.state == "ferme"
+    breaker.settle(smtplib.SMTPServerDisconnected("perdue"))
+    assert breaker.state == "ouvert"
+
+
+def test_bad_header_trial_does_not_wedge_breaker(app):
+    pool = make_mailer(app, threshold=1)
+    pool.breaker.failure()
+    assert pool.breaker.state == "ouvert"
+
+    with pytest.raises(BadHeaderError):
+        pool.send(message("client@example.com\nBcc: autre@example.com"))
+    # Le message suivant sert d'essai et referme le disjoncteur
+    pool.send(message())
+    assert pool.breaker.state == "ferme"
+    assert pool.available
+
+
+def test_message_error_during_trial_releases_the_slot(app, monkeypatch):
+    erreurs = [UnicodeEncodeError("ascii", "é", 0, 1, "test")]
+
+    def envoyer(msg):
+        if erreurs:
+            raise erreurs.pop()
+
+    monkeypatch.setattr(FakeConnection, "envoyer", staticmethod(envoyer))
+    pool = make_mailer(app, threshold=1)
+    pool.breaker.failure()
+
+    with pytest.raises(UnicodeEncodeError):
+        pool.send(message())
+    assert pool.breaker.state == "semi_ouvert"
+    pool.send(message())
+    assert pool.breaker.state == "ferme"
+
+
+def test_connection_failures_open_breaker_and_fail_fast(app):
+    FakeConnection.connect_error = ConnectionRefusedError("refusée")
+    pool = make_mailer(app, threshold=2, reset_timeout=60)
+    for _ in range(2):
+        with pytest.raises(ConnectionRefusedError):
+            pool.send(message())
+    assert pool.breaker.state == "ouvert"
+    assert not pool.available
+
+    ouvertures = FakeConnection.ouvertures
+    with pytest.raises(MailUnavailable) as excinfo:
+        pool.send(message())
+    assert excinfo.value.retry_after > 0
+    assert FakeConnection.ouvertures == ouvertures
+
+
+def test_lost_connection_is_retried_once_on_a_new_connection(app, monkeypatch):
+    erreurs = [smtplib.SMTPServerDisconnected("perdue")]
+
+    def envoyer(msg):
+        if erreurs:
+            raise erreurs.pop()
+
+    monkeypatch.setattr(FakeConnection, "envoyer", staticmethod(envoyer))
+    pool = make_mailer(app)
+    pool.send(message())
+    assert FakeConnection.ouvertures == 2
+    assert pool.breaker.state == "ferme"
+
+
+def test_timed_out_message_is_withdrawn_from_the_queue(app, monkeypatch):
+    import threading
+
+    debloque = threading.Event()
+    envoyes = []
+
+    def envoyer(msg):
+        if not envoyes:
+            debloque.wait(5)
+        envoyes.append(msg.recipients[0])
+
+    monkeypatch.setattr(FakeConnection, "envoyer", staticmethod(envoyer))
+    pool = make_mailer(app)
+    premier = pool.submit(message("premier@example.com"))
+
+    # Le seul thread d'envoi est occupé : le second message reste en file
+    pool.wait_timeout = 0.2
+    with pytest.raises(TimeoutError):
+        pool.send(message("second@example.com"))
+    debloque.set()
+    premier.result(timeout=5)
+    pool.wait_timeout = 5
+    pool.send(message("troisieme@example.com"))
+    assert envoyes == ["premier@example.com", "troisieme@example.com"]
+
+
+def test_message_being_sent_is_awaited_past_the_wait_timeout(app, monkeypatch):
+    import time
+
+    monkeypatch.setattr(FakeConnection, "envoyer", staticmethod(lambda msg: time.sleep(0.3)))
+    pool = make_mailer(app)
+    pool.wait_timeout = 0.1
+    pool.send(message())
+
+
+@pytest.mark.parametrize("erreur", [
+    MailUnavailable(40),
+    TimeoutError("attente dépassée"),
+    smtplib.SMTPServerDisconnected("Connection unexpectedly closed"),
+    ConnectionRefusedError(111, "Connection refused"),
+])
+def test_create_person_defers_email_failing_after_the_availability_check(client, app_module, monkeypatch, erreur):
+    # Disjoncteur fermé au moment du contrôle, panne pendant l'envoi
+    monkeypatch.setattr(PooledMailer, "available", property(lambda self: True))
+
+    def envoi_en_echec(data, attachments):
+        raise erreur
+
+    monkeypatch.setattr(app_module, "send_pdf_by_email", envoi_en_echec)
+    db = app_module.db_handler
+    avant = len(db.jobs)
+
+    response = client.post("/create_person", json={"prenom": "Jean", "mail": "jean@example.com", "lang": "fr"})
+
+    assert response.status_code == 202
+    job_id = max(db.jobs)
+    assert len(db.jobs) == avant + 1
+    assert db.jobs[job_id]["etape"] == "email"
+    assert db.pieces[job_id]
+    assert client.get(response.get_json()["job"]).get_json()["etape"] == "email"
@@ -0,0 +1,50 @@
+import metrics
+
+
+def test_capture_and_replay():
+    histogramme = metrics.histogram("test_capture_seconds", "test", ["etape"])
+    compteur = metrics.counter("test_capture_total", "test")
+    with metrics.capture() as samples:
+        histogramme.observe(0.2, etape="a")
+        compteur.inc()
+    assert len(samples) == 2
+
+    metrics.replay(samples)
+    assert histogramme.count(etape="a") == 2
+    assert compteur.value() == 2
+
+
+def test_suppress_ignores_observations():
+    histogramme = metrics.histogram("test_suppress_seconds", "test")
+    compteur = metrics.counter("test_suppress_total", "test")
+    with metrics.suppress(), metrics.capture() as samples:
+        histogramme.observe(1.0)
+        compteur.inc()
+    assert samples == []
+    assert histogramme.count() == 0 and compteur.value() == 0
+    histogramme.observe(1.0)
+    assert histogramme.count() == 1
+
+
+def test_warmup_renders_are_not_recorded():
+    from report import RENDER_SECONDS, SECTION_SECONDS
+    from render_service import warm_worker
+
+    avant = render_text_lines(RENDER_SECONDS, SECTION_SECONDS)
+    warm_worker()
+    assert render_text_lines(RENDER_SECONDS, SECTION_SECONDS) == avant
+
+
+def render_text_lines(*histogrammes):
+    return [line for histogramme in histogrammes for line in histogramme.expose()]
+
+
+def test_create_person_is_tracked(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "send_pdf_by_email", lambda data, attachments: None)
+    avant = metrics.OPERATION_TOTAL.value(operation="create_person", resultat="ok")
+
+    response = client.post("/create_person", json={"prenom": "Jean", "mail": "jean@example.com", "lang": "fr"})
+    assert response.status_code == 201
+    assert metrics.OPERATION_TOTAL.value(operation="create_person", resultat="ok") == avant + 1
+    _, personne = app_module.db_handler.persons[-1]
+    assert personne["nom"] == "PROSPECT" and personne["domicile"] == "" and personne["tel"] is None
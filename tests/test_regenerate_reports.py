@@ -0,0 +1,22 @@
+import os
+
+from regenerate_reports import write_attachments
+
+
+def test_noms_de_fichier_restent_dans_le_repertoire(tmp_path):
+    sortie = tmp_path / "rapports"
+    sortie.mkdir()
+    noms = set()
+    written = write_attachments(str(sortie), 1, [("../../evil.pdf", b"a"), ("..", b"bc")], noms)
+
+    assert written == 3
+    assert sorted(os.listdir(sortie)) == ["evil.pdf", "rapport_1.pdf"]
+    assert os.listdir(tmp_path) == ["rapports"]
+
+
+def test_doublons_prefixes_par_la_ligne(tmp_path):
+    noms = set()
+    write_attachments(str(tmp_path), 1, [("Rapport_Jean_Dupont.pdf", b"a")], noms)
+    write_attachments(str(tmp_path), 2, [("Rapport_Jean_Dupont.pdf", b"b")], noms)
+
+    assert sorted(os.listdir(tmp_path)) == ["2_Rapport_Jean_Dupont.pdf", "Rapport_Jean_Dupont.pdf"]
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+import render_service
+from render_service import WARMUP_DATA, RenderService, RenderTimeout
+
+
+def rendu_bloque(data):
+    while True:
+        pass
+
+
+def test_timeout_kills_the_stuck_render_process(monkeypatch):
+    # Processus obtenus par fork : ils voient les fonctions remplacées ici
+    monkeypatch.setattr(render_service, "warm_worker", lambda: None)
+    monkeypatch.setattr(render_service, "render_job", rendu_bloque)
+    service = RenderService(workers=1, timeout=0.5, start_method="fork")
+    pool = service._get_pool()
+    pool.submit(os.getpid).result(timeout=10)
+    processes = list(pool._processes.values())
+
+    with pytest.raises(RenderTimeout):
+        service.render(WARMUP_DATA)
+    assert processes and not any(process.is_alive() for process in processes)
+
+    # Le pool suivant est recréé et préchauffé
+    service._ready.wait(10)
+    assert service.ready
+    service.shutdown()
+
+
+def test_number_of_children_is_bounded():
+    from report import NOMBRE_ENFANTS_MAX, generate_pdf
+
+    data = {**WARMUP_DATA, "lang": "fr", "enfants": "oui"}
+    borne = generate_pdf(deterministic=True, **{**data, "nombre_enfants": str(NOMBRE_ENFANTS_MAX)})
+    enorme = generate_pdf(deterministic=True, **{**data, "nombre_enfants": "1000000"})
+    assert enorme == borne
+
+
+def test_failed_warmup_is_retried_until_ready(monkeypatch, tmp_path):
+    essai = tmp_path / "premier_essai"
+
+    def warm_en_echec_une_fois():
+        if not essai.exists():
+            essai.touch()
+            raise RuntimeError("préchauffage en échec")
+
+    monkeypatch.setattr(render_service, "warm_worker", warm_en_echec_une_fois)
+    service = RenderService(workers=2, timeout=5, start_method="fork")
+    service.start_background(retry=0.05)
+    assert service._ready.wait(20)
+    assert essai.exists()
+    service.shutdown()
+
+
+def test_start_waits_for_every_process(monkeypatch):
+    monkeypatch.setattr(render_service, "warm_worker", lambda: None)
+    service = RenderService(workers=3, timeout=5, start_method="fork")
+    assert service.start()
+    assert service.ready
+    assert len(service._pool._processes) == 3
+    service.shutdown()
+
+
+def rendu_pid(data):
+    return [("pid", str(os.getpid()).encode())], []
+
+
+def test_forked_child_builds_and_warms_its_own_pool(monkeypatch):
+    monkeypatch.setattr(render_service, "warm_worker", lambda: None)
+    monkeypatch.setattr(render_service, "render_job", rendu_pid)
+    service = RenderService(workers=1, timeout=5, start_method="fork")
+    service.start_background(retry=0.05)
+    assert service._ready.wait(10)
+    pool_parent = service._pool
+    pids_parent = set(pool_parent._processes)
+
+    lecture, ecriture = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            # Préchauffage relancé dans l'enfant, sur un pool qui lui appartient
+            ok = not service.ready and service._ready.wait(10)
+            ((_, rendu_par),) = service.render(WARMUP_DATA)
+            ok = ok and service._pool is not pool_parent and int(rendu_par) not in pids_parent
+            service.shutdown()
+            os.write(ecriture, b"1" if ok else b"0")
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    assert os.read(lecture, 1) == b"1"
+    # Le pool du parent est intact
+    assert service._pool is pool_parent and service.ready
+    ((_, rendu_par),) = service.render(WARMUP_DATA)
+    assert int(rendu_par) in pids_parent
+    service.shutdown()
@@ -0,0 +1,81 @@
+import math
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from render_service import WARMUP_DATA
+from report import generate_pdf
+from report_assets import IMAGES, LARGEURS_MM, PROFILS, ImageRegistry, resized_image
+from report_fragments import FRAGMENT_CACHE
+from report_pack import AssetPack, build_pack
+
+DATA = {**WARMUP_DATA, "lang": "fr"}
+
+
+def image(tmp_path, nom, largeur, hauteur, format):
+    path = tmp_path / nom
+    Image.new("RGB", (largeur, hauteur), (128, 0, 32)).save(path, format)
+    return str(path)
+
+
+@pytest.mark.parametrize("nom, format", [("photo.jpg", "JPEG"), ("logo.png", "PNG")])
+def test_variante_a_la_largeur_d_affichage(tmp_path, nom, format):
+    path = image(tmp_path, nom, 2000, 1000, format)
+    variante = Image.open(BytesIO(resized_image(path, 100, 150, 80)))
+
+    assert variante.format == format
+    assert variante.width == math.ceil(100 / 25.4 * 150)
+    assert variante.height == round(1000 * variante.width / 2000)
+
+
+def test_image_deja_assez_petite_gardee(tmp_path):
+    path = image(tmp_path, "bouteille.jpg", 40, 40, "JPEG")
+
+    assert resized_image(path, 8, 150, 80) is None
+
+
+def test_profil_inconnu_refuse():
+    with pytest.raises(ValueError):
+        ImageRegistry(pack=None).load("web")
+
+
+def test_variantes_email_plus_petites_que_les_originaux():
+    registre = ImageRegistry(pack=None)
+    originaux, variantes = registre.load("print"), registre.load("email")
+
+    dpi, _ = PROFILS["email"]
+    for key in IMAGES:
+        assert variantes[key]["w"] <= max(math.ceil(LARGEURS_MM[key] / 25.4 * dpi), originaux[key]["w"])
+    assert sum(len(info["data"]) for info in variantes.values()) < sum(len(info["data"]) for info in originaux.values())
+
+
+def test_paquet_identique_au_decodage(tmp_path):
+    path = str(tmp_path / "report_assets.pack")
+    build_pack(path)
+    depuis_paquet = ImageRegistry(pack=AssetPack(path)).load("email")
+    decodees = ImageRegistry(pack=None).load("email")
+
+    for key, info in decodees.items():
+        assert type(depuis_paquet[key]).__name__ == "PackedImageInfo"
+        assert (depuis_paquet[key]["w"], depuis_paquet[key]["h"]) == (info["w"], info["h"])
+        assert depuis_paquet[key]["data"] == info["data"]
+
+
+def test_rapport_email_plus_leger_meme_mise_en_page():
+    email = generate_pdf(size_profile="email", deterministic=True, **DATA)
+    impression = generate_pdf(size_profile="print", deterministic=True, **DATA)
+
+    assert len(email) < len(impression) * 0.5
+    assert email.count(b"/Type /Page\n") == impression.count(b"/Type /Page\n")
+
+
+def test_fragments_partages_entre_profils():
+    FRAGMENT_CACHE.clear()
+    impression = generate_pdf(size_profile="print", deterministic=True, **DATA)
+
+    # Fragments mis en page avec les variantes email, rejoués dans un rapport d'impression
+    FRAGMENT_CACHE.clear()
+    generate_pdf(size_profile="email", deterministic=True, **DATA)
+    assert generate_pdf(size_profile="print", deterministic=True, **DATA) == impression
+    FRAGMENT_CACHE.clear()
@@ -0,0 +1,106 @@
+import pytest
+
+from render_service import WARMUP_DATA
+from report import Section, ReportPDF, generate_pdf
+from report_fragments import FRAGMENT_CACHE, FRAGMENT_CACHE_TOTAL, FragmentCache
+from report_lines import LINE_CACHE
+
+
+@pytest.fixture(autouse=True)
+def caches_vides():
+    FRAGMENT_CACHE.clear()
+    LINE_CACHE.clear()
+    yield
+    FRAGMENT_CACHE.clear()
+    LINE_CACHE.clear()
+
+
+def ecrire_lignes(pdf, data):
+    # Texte dans l'état reçu, puis changement d'état que la suite du document doit voir
+    for i in range(int(data["lignes"])):
+        pdf.paragraph(f"{data['lang']} ligne {i}", 2)
+    pdf.set_font("Helvetica", "B", 15)
+    pdf.set_text_color(10, 120, 30)
+
+
+ESSAI = Section("essai", ecrire_lignes, ("lang", "lignes"), ())
+
+
+def document(cache, data, taille=12, couleur=(0, 0, 0), y=None):
+    """Document d'une page : la section d'essai rendue par `cache`, puis un paragraphe."""
+    pdf = ReportPDF(deterministic=True)
+    pdf.add_page()
+    pdf.set_font("Helvetica", "", taille)
+    pdf.set_text_color(*couleur)
+    if y is not None:
+        pdf.set_y(y)
+    cache.render(pdf, ESSAI, data)
+    pdf.paragraph("Paragraphe qui suit la section", 0)
+    return bytes(pdf.output()), pdf.page
+
+
+def sans_cache(data, **etat):
+    return document(FragmentCache(maxsize=0), data, **etat)
+
+
+@pytest.mark.parametrize("etat_suivant", [{"taille": 16}, {"couleur": (128, 0, 32)}, {"y": 60}])
+def test_etat_du_document_dans_la_cle(etat_suivant):
+    cache = FragmentCache(maxsize=8)
+    data = {"lang": "fr", "lignes": "3"}
+    document(cache, data)
+
+    # Mêmes réponses, autre police, couleur ou position : nouvelle mise en page
+    assert document(cache, data, **etat_suivant) == sans_cache(data, **etat_suivant)
+    assert len(cache) == 2
+
+
+def test_entrees_dans_la_cle():
+    cache = FragmentCache(maxsize=8)
+    document(cache, {"lang": "fr", "lignes": "3"})
+
+    assert document(cache, {"lang": "en", "lignes": "3"}) == sans_cache({"lang": "en", "lignes": "3"})
+    assert len(cache) == 2
+
+
+def test_saut_de_page_dans_la_section_rejoue():
+    cache = FragmentCache(maxsize=8)
+    data = {"lang": "fr", "lignes": "60"}
+    attendu, pages = sans_cache(data, y=200)
+    assert pages >= 3
+
+    document(cache, data, y=200)
+    rejoues = FRAGMENT_CACHE_TOTAL.value(resultat="cache")
+    # Pages ajoutées, état final (police, couleur, position) restauré
+    assert document(cache, data, y=200) == (attendu, pages)
+    assert FRAGMENT_CACHE_TOTAL.value(resultat="cache") == rejoues + 1
+
+
+def test_type_de_societe_mis_en_page_sans_cache():
+    data = {**WARMUP_DATA, "lang": "fr", "societe": "oui"}
+    premier = {**data, "type_societe": "SPRL Dupont et fils"}
+    second = {**data, "type_societe": "Fondation Martin"}
+    second_seul = generate_pdf(deterministic=True, **second)
+    FRAGMENT_CACHE.clear()
+    LINE_CACHE.clear()
+
+    generate_pdf(deterministic=True, **premier)
+    assert generate_pdf(deterministic=True, **second) == second_seul
+    # Le texte saisi n'est gardé ni dans les fragments ni dans les lignes
+    assert not any("Dupont" in repr(key) for key in FRAGMENT_CACHE._fragments)
+    assert not any("Dupont" in repr(key) for key in LINE_CACHE._lines)
+
+
+def test_societe_sans_type_reste_en_cache():
+    data = {**WARMUP_DATA, "lang": "fr", "societe": "oui", "type_societe": "  "}
+    generate_pdf(**data)
+
+    assert any(key[0] == "societe" for key in FRAGMENT_CACHE._fragments)
+
+
+def test_rendu_deterministe_avec_ou_sans_cache(monkeypatch):
+    data = {**WARMUP_DATA, "lang": "nl"}
+    froid = generate_pdf(deterministic=True, **data)
+    assert generate_pdf(deterministic=True, **data) == froid
+
+    monkeypatch.setattr(FRAGMENT_CACHE, "maxsize", 0)
+    assert generate_pdf(deterministic=True, **data) == froid
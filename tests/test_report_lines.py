@@ -0,0 +1,92 @@
+import re
+import zlib
+
+import pytest
+
+from render_service import WARMUP_DATA
+from report import ReportPDF, generate_pdf
+from report_fragments import FRAGMENT_CACHE
+from report_lines import LINE_CACHE, LINE_CACHE_TOTAL, LineCache
+
+TEXTE = ("Les grands vins se conservent à l'abri de la lumière, couchés, à une température stable "
+         "et dans une cave assez humide pour que le bouchon ne sèche pas. ") * 3
+
+
+@pytest.fixture(autouse=True)
+def cache_de_lignes_seul(monkeypatch):
+    # Sans fragments rejoués, tous les paragraphes passent par le cache de lignes
+    monkeypatch.setattr(FRAGMENT_CACHE, "maxsize", 0)
+    LINE_CACHE.clear()
+    yield
+    LINE_CACHE.clear()
+
+
+def texte_pdf(contenu):
+    """Chaînes affichées par les flux de contenu (compressés) d'un PDF en polices standard."""
+    morceaux = []
+    for flux in re.findall(rb"stream\r?\n(.*?)\r?\nendstream", contenu, re.S):
+        try:
+            flux = zlib.decompress(flux)
+        except zlib.error:
+            continue
+        morceaux.extend(m.decode("latin-1") for m in re.findall(rb"\(((?:\\.|[^\\)])*)\)", flux))
+    return " ".join(morceaux)
+
+
+def paragraphe(cache, x=10, taille=12):
+    """Un paragraphe de TEXTE coupé par `cache`, à partir de `x`, en Helvetica `taille`."""
+    pdf = ReportPDF(deterministic=True)
+    pdf.add_page()
+    pdf.set_font("Helvetica", "", taille)
+    pdf.set_x(x)
+    cache.multi_cell(pdf, 8, pdf.clean(TEXTE))
+    return bytes(pdf.output())
+
+
+@pytest.mark.parametrize("autre", [{"x": 60}, {"taille": 14}])
+def test_largeur_et_taille_dans_la_cle(autre):
+    cache = LineCache(maxsize=8)
+    paragraphe(cache)
+    calculs = LINE_CACHE_TOTAL.value(resultat="calcul")
+
+    # Même texte, coupé sur une autre largeur ou avec une autre taille de police
+    assert paragraphe(cache, **autre) == paragraphe(LineCache(maxsize=0), **autre)
+    assert LINE_CACHE_TOTAL.value(resultat="calcul") == calculs + 1
+    assert len(cache) == 2
+
+
+def test_coupures_rejouees_a_l_identique():
+    cache = LineCache(maxsize=8)
+    attendu = paragraphe(LineCache(maxsize=0))
+    paragraphe(cache)
+    depuis_cache = LINE_CACHE_TOTAL.value(resultat="cache")
+
+    assert paragraphe(cache) == attendu
+    assert LINE_CACHE_TOTAL.value(resultat="cache") == depuis_cache + 1
+
+
+def test_reutilise_d_une_langue_a_l_autre():
+    francais = generate_pdf(deterministic=True, **{**WARMUP_DATA, "lang": "fr"})
+    cles_fr = set(LINE_CACHE._lines)
+
+    anglais = generate_pdf(deterministic=True, **{**WARMUP_DATA, "lang": "en"})
+    # L'anglais a ses propres coupures, sans reprendre celles du français
+    assert set(LINE_CACHE._lines) - cles_fr
+    assert "You have expressed a preference" in texte_pdf(anglais)
+    assert "Vous avez exprim" not in texte_pdf(anglais)
+
+    # Le français revient entièrement depuis le cache, à l'identique
+    calculs = LINE_CACHE_TOTAL.value(resultat="calcul")
+    assert generate_pdf(deterministic=True, **{**WARMUP_DATA, "lang": "fr"}) == francais
+    assert LINE_CACHE_TOTAL.value(resultat="calcul") == calculs
+
+
+def test_region_differente_pas_melangee():
+    generate_pdf(deterministic=True, **{**WARMUP_DATA, "lang": "fr", "region_preferee": "bordeaux"})
+    cles_bordeaux = set(LINE_CACHE._lines)
+    bourgogne = generate_pdf(deterministic=True, **{**WARMUP_DATA, "lang": "fr", "region_preferee": "bourgogne"})
+
+    nouvelles = set(LINE_CACHE._lines) - cles_bordeaux
+    assert any("bourgogne" in key[0] for key in nouvelles)
+    assert "viticole suivante : bourgogne" in texte_pdf(bourgogne)
+    assert "viticole suivante : bordeaux" not in texte_pdf(bourgogne)
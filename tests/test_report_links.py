@@ -0,0 +1,95 @@
+import pytest
+from itsdangerous import BadSignature, SignatureExpired
+
+from report_store import ReportLinks, ReportStore
+
+PDF = b"%PDF-1.4 rapport de test"
+
+
+@pytest.fixture
+def links():
+    return ReportLinks(secret="test", max_age=3600, base_url="https://rapports.example.com/")
+
+
+@pytest.fixture
+def stored(app_module, links, tmp_path, monkeypatch):
+    """Un PDF stocké et les liens de l'application configurés pour le test."""
+    store = ReportStore(str(tmp_path))
+    monkeypatch.setattr(app_module, "REPORT_STORE", store)
+    monkeypatch.setattr(app_module, "REPORT_LINKS", links)
+    return store.put(PDF)
+
+
+def test_sign_and_verify_round_trip(links):
+    key = "a" * 64
+    token = links.sign(key, "Jean_Dupont_conditions.pdf")
+    assert links.verify(token) == (key, "Jean_Dupont_conditions.pdf")
+    assert links.url(key, "x.pdf") == f"https://rapports.example.com/reports/{links.sign(key, 'x.pdf')}"
+
+
+def test_verify_rejects_tampered_and_foreign_tokens(links):
+    token = links.sign("a" * 64, "x.pdf")
+    with pytest.raises(BadSignature):
+        links.verify(token[:-2] + "xx")
+    with pytest.raises(BadSignature):
+        ReportLinks(secret="autre", base_url="https://x").verify(token)
+
+
+def test_verify_rejects_expired_tokens():
+    links = ReportLinks(secret="test", max_age=-1, base_url="https://x")
+    with pytest.raises(SignatureExpired):
+        links.verify(links.sign("a" * 64, "x.pdf"))
+
+
+def test_verify_without_secret_is_a_bad_signature(links):
+    token = links.sign("a" * 64, "x.pdf")
+    with pytest.raises(BadSignature):
+        ReportLinks(secret="", base_url="https://x").verify(token)
+
+
+def test_check_requires_secret_and_base_url():
+    ReportLinks(secret="s", base_url="https://x").check()
+    with pytest.raises(RuntimeError, match="REPORT_LINK_SECRET"):
+        ReportLinks(secret="", base_url="https://x").check()
+    with pytest.raises(RuntimeError, match="REPORT_BASE_URL"):
+        ReportLinks(secret="s", base_url="").check()
+
+
+def test_store_is_content_addressed(tmp_path):
+    store = ReportStore(str(tmp_path))
+    key = store.put(PDF)
+    assert store.put(PDF) == key
+    assert store.get(key) == PDF
+    with pytest.raises(ValueError):
+        store.path("../../etc/passwd")
+
+
+def test_download_serves_pdf_privately(client, links, stored):
+    response = client.get(f"/reports/{links.sign(stored, 'Jean_conditions.pdf')}")
+    assert response.status_code == 200
+    assert response.data == PDF
+    assert response.headers["Content-Type"] == "application/pdf"
+    assert response.headers["Cache-Control"] == "private, no-store"
+    assert "Jean_conditions.pdf" in response.headers["Content-Disposition"]
+
+
+def test_download_revalidation_and_range(client, links, stored):
+    url = f"/reports/{links.sign(stored, 'x.pdf')}"
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    partiel = client.get(url, headers={"Range": "bytes=0-3"})
+    assert partiel.status_code == 206 and partiel.data == PDF[:4]
+
+
+def test_download_bad_expired_and_missing(client, app_module, links, stored, monkeypatch):
+    assert client.get("/reports/pas-un-jeton").status_code == 404
+    assert client.get(f"/reports/{links.sign('b' * 64, 'x.pdf')}").status_code == 404
+
+    monkeypatch.setattr(app_module, "REPORT_LINKS", ReportLinks(secret="test", max_age=-1, base_url="https://x"))
+    assert client.get(f"/reports/{links.sign(stored, 'x.pdf')}").status_code == 410
+
+
+def test_download_without_secret_is_not_found(client, app_module, links, stored, monkeypatch):
+    token = links.sign(stored, "x.pdf")
+    monkeypatch.setattr(app_module, "REPORT_LINKS", ReportLinks(secret="", base_url=""))
+    assert client.get(f"/reports/{token}").status_code == 404